@@ -11,7 +11,7 @@ from urllib.parse import quote as urlquote
 
 import sentry_sdk
 from django.conf import settings
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseBase
 from django.http.request import HttpRequest
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
@@ -67,6 +67,7 @@ from .permissions import (
     SuperuserOrStaffFeatureFlaggedPermission,
     SuperuserPermission,
 )
+from .streaming import StreamingJSONResponse
 
 __all__ = [
     "Endpoint",
@@ -488,6 +489,23 @@ class Endpoint(APIView):
     def respond(self, context: object | None = None, **kwargs: Any) -> Response:
         return Response(context, **kwargs)
 
+    def respond_streaming(self, context: object | None = None, **kwargs: Any) -> HttpResponseBase:
+        """
+        Responds with large payloads, which are encoded and sent in chunks rather than rendered
+        at once when streaming JSON responses are enabled.
+        """
+        if options.get("api.streaming-json-responses"):
+            return StreamingJSONResponse(context, **kwargs)
+        return self.respond(context, **kwargs)
+
+    def get_streaming_response_cls(self) -> type[Response] | type[StreamingJSONResponse]:
+        """
+        The `response_cls` to pass to `paginate` for large pages, see `respond_streaming`.
+        """
+        if options.get("api.streaming-json-responses"):
+            return StreamingJSONResponse
+        return Response
+
     def respond_with_text(self, text):
         return self.respond({"text": text})
 
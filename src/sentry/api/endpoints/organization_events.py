@@ -752,4 +752,5 @@ class OrganizationEventsEndpoint(OrganizationEventsV2EndpointBase):
                         standard_meta=True,
                         dataset=dataset,
                     ),
+                    response_cls=self.get_streaming_response_cls(),
                 )
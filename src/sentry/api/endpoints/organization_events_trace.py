@@ -9,7 +9,7 @@ from datetime import datetime, timedelta
 from typing import Any, Deque, Optional, TypedDict, TypeVar, cast
 
 import sentry_sdk
-from django.http import Http404, HttpRequest, HttpResponse
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseBase
 from rest_framework.exceptions import ParseError
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -1045,7 +1045,7 @@ class OrganizationEventsTraceEndpointBase(OrganizationEventsV2EndpointBase):
             sentry_sdk.set_tag("trace_view.projects.grouped", format_grouped_length(len_projects))
             set_measurement("trace_view.projects", len_projects)
 
-    def get(self, request: Request, organization: Organization, trace_id: str) -> HttpResponse:
+    def get(self, request: Request, organization: Organization, trace_id: str) -> HttpResponseBase:
         if not self.has_feature(organization, request):
             return Response(status=404)
 
@@ -1126,7 +1126,7 @@ class OrganizationEventsTraceEndpointBase(OrganizationEventsV2EndpointBase):
                 extra={"extra_roots": len(roots), **warning_extra},
             )
 
-        return Response(
+        return self.respond_streaming(
             self.serialize(
                 limit,
                 transactions,
@@ -1,5 +1,8 @@
+import base64
 import bisect
 import functools
+import heapq
+import itertools
 import logging
 import math
 from collections.abc import Callable, Iterable, Sequence
@@ -7,11 +10,13 @@ from datetime import datetime, timezone
 from typing import Any, Protocol
 from urllib.parse import quote
 
-from django.core.exceptions import EmptyResultSet, ObjectDoesNotExist
+from django.core.exceptions import EmptyResultSet, ObjectDoesNotExist, ValidationError
 from django.db import connections
+from django.db.models import Q
 from django.db.models.functions import Lower
 
-from sentry.utils.cursors import Cursor, CursorResult, build_cursor
+from sentry.utils import json
+from sentry.utils.cursors import Cursor, CursorResult, StringCursor, build_cursor
 from sentry.utils.pagination_factory import PaginatorLike
 
 quote_name = connections["default"].ops.quote_name
@@ -41,6 +46,40 @@ def count_hits(queryset, max_hits):
     return cursor.fetchone()[0]
 
 
+def estimate_hits(queryset, max_hits):
+    """
+    Estimates the number of rows in the queryset from the planner statistics instead of
+    counting them. Unfiltered querysets use the row estimate of the table in `pg_class`, others
+    the estimate of the query plan. Falls back to `count_hits` if the table was never analyzed.
+    """
+    query = queryset.query
+    db = queryset.using_replica().db
+    cursor = connections[db].cursor()
+    if not query.where:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+        estimate = row[0] if row else -1
+    else:
+        hits_query = query.clone()
+        hits_query.clear_ordering(force=True, clear_default=True)
+        try:
+            h_sql, h_params = hits_query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {h_sql}", h_params)
+        plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = plan[0]["Plan"]["Plan Rows"]
+
+    if estimate < 0:
+        return count_hits(queryset, max_hits)
+    return int(estimate)
+
+
 class BadPaginationError(Exception):
     pass
 
@@ -304,6 +343,129 @@ class OffsetPaginator(PaginatorLike):
         return count_hits(self.queryset, max_hits)
 
 
+class KeysetPaginator(PaginatorLike):
+    """
+    Paginates a queryset by the keys of the rows at the edges of the current page, rather than
+    by an offset, so that deep pages cost as much as the first one.
+
+    `order_by` is a sequence of fields, each of them optionally prefixed with "-" to sort it
+    descending, and must not contain nullable fields. The primary key is appended if missing to
+    make the order total. Cursors are `StringCursor`s whose value encodes the key of the last
+    (or first, for previous pages) row of a page, and whose offset is always 0.
+
+    With `approximate_hits`, hits are estimated from the planner statistics instead of counted,
+    see `estimate_hits`. They are not capped by `max_hits` then.
+    """
+
+    def __init__(
+        self,
+        queryset,
+        order_by=("-id",),
+        max_limit=MAX_LIMIT,
+        on_results=None,
+        approximate_hits=False,
+    ):
+        if isinstance(order_by, str):
+            order_by = (order_by,)
+        order_by = tuple(order_by)
+        pk_name = queryset.model._meta.pk.name
+        if not any(key.lstrip("-") in ("id", "pk", pk_name) for key in order_by):
+            order_by += (f"-{pk_name}" if order_by[-1].startswith("-") else pk_name,)
+
+        self.keys = [(key.lstrip("-"), key.startswith("-")) for key in order_by]
+        self.queryset = queryset
+        self.max_limit = max_limit
+        self.on_results = on_results
+        self.approximate_hits = approximate_hits
+
+    def _get_field(self, name):
+        if name in self.queryset.query.annotations:
+            return self.queryset.query.annotations[name].output_field
+        if name == "pk":
+            return self.queryset.model._meta.pk
+        return self.queryset.model._meta.get_field(name)
+
+    def encode_key(self, item) -> str:
+        values = [getattr(item, name) for name, _ in self.keys]
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip("=")
+
+    def decode_key(self, value):
+        try:
+            padded = value + "=" * (-len(value) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (TypeError, ValueError):
+            raise BadPaginationError("Invalid cursor value")
+        if not isinstance(values, list) or len(values) != len(self.keys):
+            raise BadPaginationError("Invalid cursor value")
+        try:
+            return [
+                self._get_field(name).to_python(value)
+                for (name, _), value in zip(self.keys, values)
+            ]
+        except ValidationError:
+            raise BadPaginationError("Invalid cursor value")
+
+    def build_queryset(self, cursor_key, is_prev):
+        # Previous pages are read backwards from the cursor, and reversed once fetched.
+        queryset = self.queryset.order_by(
+            *[name if desc == is_prev else f"-{name}" for name, desc in self.keys]
+        )
+        if cursor_key is None:
+            return queryset
+
+        # (a, b) > (x, y) is expanded to a > x OR (a = x AND b > y), as the keys may be sorted
+        # in different directions.
+        condition = Q()
+        equal = Q()
+        for (name, desc), value in zip(self.keys, cursor_key):
+            lookup = "gt" if desc == is_prev else "lt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return queryset.filter(condition)
+
+    def get_result(self, limit=100, cursor=None, count_hits=False, known_hits=None, max_hits=None):
+        limit = min(limit, self.max_limit)
+        is_prev = bool(cursor and cursor.is_prev)
+        cursor_key = self.decode_key(str(cursor.value)) if cursor and cursor.value else None
+
+        queryset = self.build_queryset(cursor_key, is_prev)
+        results = list(queryset[: limit + 1])
+        has_more = len(results) > limit
+        results = results[:limit]
+        if is_prev:
+            results.reverse()
+
+        # Rows exist on the other side of the cursor, unless it is the first request.
+        had_cursor = cursor_key is not None
+        if results:
+            next_value = self.encode_key(results[-1])
+            prev_value = self.encode_key(results[0])
+        else:
+            next_value = prev_value = cursor.value if cursor else ""
+        next_cursor = StringCursor(next_value, 0, False, has_more if not is_prev else had_cursor)
+        prev_cursor = StringCursor(prev_value, 0, True, has_more if is_prev else had_cursor)
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        if max_hits is None:
+            max_hits = MAX_HITS_LIMIT
+        hits = self.count_hits(max_hits) if count_hits else known_hits
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=hits,
+            max_hits=max_hits if count_hits and not self.approximate_hits else None,
+        )
+
+    def count_hits(self, max_hits):
+        if self.approximate_hits:
+            return estimate_hits(self.queryset, max_hits)
+        return count_hits(self.queryset, max_hits)
+
+
 class MergingOffsetPaginator(OffsetPaginator):
     """This paginator uses a function to first look up items from an
     independently paginated resource to only then fall back to a query set.
@@ -615,6 +777,14 @@ class CombinedQuerysetPaginator:
                 not using_other
             ), "When sorting by a date, it must be the key used on all intermediaries"
 
+        # Dates and numbers sort the same in the database and in python, so the querysets can be
+        # merged while read. Strings are sorted by the collation of the database, they are
+        # fetched entirely and sorted in python instead.
+        self.mergeable = not self.case_insensitive and all(
+            intermediary.order_by_type in (int, float, datetime)
+            for intermediary in self.intermediaries
+        )
+
     def key_from_item(self, item):
         return self.model_key_map.get(type(item))[0]
 
@@ -661,23 +831,51 @@ class CombinedQuerysetPaginator:
                     queryset = queryset.order_by(f"-{key}")
             combined_querysets += list(queryset)
 
-        def _sort_combined_querysets(item):
-            sort_keys = []
-            sort_keys.append(self.get_item_key(item))
-            if len(self.model_key_map.get(type(item))) > 1:
-                # XXX: This doesn't do anything - it just uses a column name as the sort key. It should be pulling the
-                # value of the other keys out instead.
-                sort_keys.extend(iter(self.model_key_map.get(type(item))[1:]))
-            sort_keys.append(type(item).__name__)
-            return tuple(sort_keys)
-
         combined_querysets.sort(
-            key=_sort_combined_querysets,
+            key=self._sort_key,
             reverse=asc if is_prev else not asc,
         )
 
         return combined_querysets
 
+    def _sort_key(self, item):
+        sort_keys = []
+        sort_keys.append(self.get_item_key(item))
+        if len(self.model_key_map.get(type(item))) > 1:
+            # XXX: This doesn't do anything - it just uses a column name as the sort key. It should be pulling the
+            # value of the other keys out instead.
+            sort_keys.extend(iter(self.model_key_map.get(type(item))[1:]))
+        sort_keys.append(type(item).__name__)
+        return tuple(sort_keys)
+
+    def _merge_combined_querysets(self, stop, chunk_size):
+        """
+        Merges the first `stop` rows of the querysets, sorted by the database, with a k-way merge.
+        Rows are fetched lazily in chunks growing from `chunk_size`, so that each queryset is only
+        read as far as the merge gets into it.
+        """
+
+        def fetch(queryset):
+            start, size = 0, chunk_size
+            while start < stop:
+                end = min(start + size, stop)
+                chunk = list(queryset[start:end])
+                yield from chunk
+                if len(chunk) < end - start:
+                    return
+                start, size = end, size * 2
+
+        querysets = [
+            intermediary.queryset.order_by(
+                *[f"-{key}" if self.desc else key for key in intermediary.order_by]
+            )
+            for intermediary in self.intermediaries
+        ]
+        merged = heapq.merge(
+            *[fetch(queryset) for queryset in querysets], key=self._sort_key, reverse=self.desc
+        )
+        return list(itertools.islice(merged, stop))
+
     def get_result(self, cursor=None, limit=100):
         # offset is page #
         # value is page limit
@@ -686,8 +884,6 @@ class CombinedQuerysetPaginator:
 
         limit = min(limit, MAX_LIMIT)
 
-        combined_querysets = self._build_combined_querysets(cursor.is_prev)
-
         page = int(cursor.offset)
         cursor_value = int(cursor.value)
         offset = page * cursor_value
@@ -696,6 +892,11 @@ class CombinedQuerysetPaginator:
         if offset < 0:
             raise BadPaginationError("Pagination offset cannot be negative")
 
+        if self.mergeable:
+            combined_querysets = self._merge_combined_querysets(stop, limit + 1)
+        else:
+            combined_querysets = self._build_combined_querysets(cursor.is_prev)
+
         results = list(combined_querysets[offset:stop])
         if cursor.value != limit:
             results = results[-(limit + 1) :]
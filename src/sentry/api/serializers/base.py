@@ -7,6 +7,8 @@ from typing import Any, TypeVar
 import sentry_sdk
 from django.contrib.auth.models import AnonymousUser
 
+from sentry import options
+from sentry.api.serializers.result_cache import ResultCache, get_result_cache
 from sentry.users.models.user import User
 from sentry.users.services.user.model import RpcUser
 
@@ -64,6 +66,12 @@ def serialize(
                 pass
         else:
             return objects
+    result_cache = get_result_cache(serializer)
+    if result_cache is not None and options.get("api.serializers.result-cache.enabled"):
+        scope = result_cache.get_scope(user, kwargs)
+        if scope is not None:
+            return _serialize_cached(objects, user, serializer, result_cache, scope, **kwargs)
+
     with sentry_sdk.start_span(op="serialize", name=type(serializer).__name__) as span:
         span.set_data("Object Count", len(objects))
 
@@ -80,6 +88,45 @@ def serialize(
             return [serializer(o, attrs=attrs.get(o, {}), user=user, **kwargs) for o in objects]
 
 
+def _serialize_cached(
+    objects: Sequence[Any],
+    user: User | RpcUser | AnonymousUser,
+    serializer: Any,
+    result_cache: ResultCache,
+    scope: str,
+    **kwargs: Any,
+) -> Any:
+    """Serializes the objects missing from the result cache of the serializer only."""
+    with sentry_sdk.start_span(op="serialize", name=type(serializer).__name__) as span:
+        span.set_data("Object Count", len(objects))
+
+        with sentry_sdk.start_span(op="serialize.cache", name=type(serializer).__name__):
+            cached, missing_keys = result_cache.get_many(
+                [o for o in objects if o is not None], scope
+            )
+        span.set_data("Cached Count", len(cached))
+
+        missing = [o for o in objects if o is not None and o.id not in cached]
+        with sentry_sdk.start_span(op="serialize.get_attrs", name=type(serializer).__name__):
+            attrs = serializer.get_attrs(item_list=missing, user=user, **kwargs) if missing else {}
+
+        with sentry_sdk.start_span(op="serialize.iterate", name=type(serializer).__name__):
+            results = []
+            to_cache = {}
+            for o in objects:
+                if o is not None and o.id in cached:
+                    results.append(cached[o.id])
+                    continue
+                result = serializer(o, attrs=attrs.get(o, {}), user=user, **kwargs)
+                # Failures to serialize are not cached.
+                if result is not None:
+                    to_cache[missing_keys[o.id]] = result
+                results.append(result)
+
+        result_cache.set_many(to_cache)
+        return results
+
+
 class Serializer:
     """A Serializer class contains the logic to serialize a specific type of object."""
 
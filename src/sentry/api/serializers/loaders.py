@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import atexit
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any
+
+import sentry_sdk
+from django.db import connections
+
+from sentry import options
+from sentry.utils import metrics
+
+_loader_pool = ThreadPoolExecutor(max_workers=10, thread_name_prefix="serializer-loader")
+
+atexit.register(_loader_pool.shutdown, False)
+
+
+def _run_loader(name: str, loader: Callable[[], Any]) -> Any:
+    with sentry_sdk.start_span(op="serialize.get_attrs.loader", name=name):
+        with metrics.timer("serializers.attribute_loader.duration", tags={"loader": name}):
+            return loader()
+
+
+def _run_threaded_loader(
+    isolation_scope: sentry_sdk.Scope,
+    current_scope: sentry_sdk.Scope,
+    name: str,
+    loader: Callable[[], Any],
+) -> Any:
+    with sentry_sdk.scope.use_isolation_scope(isolation_scope):
+        with sentry_sdk.scope.use_scope(current_scope):
+            try:
+                return _run_loader(name, loader)
+            finally:
+                # Loaders are mostly meant for Snuba queries, but may also look up a few
+                # models. Connections are per thread, don't leave them open in the pool.
+                connections.close_all()
+
+
+class AttributeLoaders:
+    """
+    Loads independent attributes of the objects passed to `Serializer.get_attrs`.
+
+    Each loader is a callable without arguments which fetches one attribute for all of the
+    objects at once, and is timed in its own span. Loaders added with `threaded=True` are
+    started in a thread pool first, and run concurrently with each other and with the other
+    loaders, which run in the calling thread. Loaders must not depend on each other.
+
+    Threaded loaders are meant for Snuba queries. They may look up a few models, but use their
+    own database connection, outside of any transaction of the calling thread.
+    """
+
+    def __init__(self, concurrent: bool | None = None) -> None:
+        if concurrent is None:
+            concurrent = options.get("api.serializers.concurrent-attribute-loaders")
+        self.concurrent = concurrent
+        self._loaders: dict[str, tuple[Callable[[], Any], bool]] = {}
+
+    def add(self, name: str, loader: Callable[[], Any], threaded: bool = False) -> None:
+        if name in self._loaders:
+            raise ValueError(f"Attribute loader {name!r} is already registered")
+        self._loaders[name] = (loader, threaded)
+
+    def load(self) -> dict[str, Any]:
+        """
+        Runs all of the loaders, and returns their results keyed by name. Exceptions raised by
+        loaders are propagated once all threaded loaders are done.
+        """
+        futures: dict[str, Future[Any]] = {}
+        if self.concurrent:
+            isolation_scope = sentry_sdk.Scope.get_isolation_scope()
+            current_scope = sentry_sdk.Scope.get_current_scope()
+            for name, (loader, threaded) in self._loaders.items():
+                if threaded:
+                    futures[name] = _loader_pool.submit(
+                        _run_threaded_loader, isolation_scope, current_scope, name, loader
+                    )
+
+        results: dict[str, Any] = {}
+        try:
+            for name, (loader, _) in self._loaders.items():
+                if name not in futures:
+                    results[name] = _run_loader(name, loader)
+        finally:
+            # Don't leave threaded loaders running once the caller is gone.
+            wait(futures.values())
+
+        for name, future in futures.items():
+            results[name] = future.result()
+        return results
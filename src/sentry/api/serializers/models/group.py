@@ -9,12 +9,14 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Protocol, TypedDict, TypeGuard
 
 import sentry_sdk
+from dateutil.parser import parse as parse_datetime
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.db.models import Min, prefetch_related_objects
 
 from sentry import tagstore
 from sentry.api.serializers import Serializer, register, serialize
+from sentry.api.serializers.loaders import AttributeLoaders
 from sentry.api.serializers.models.actor import ActorSerializer
 from sentry.api.serializers.models.plugin import is_plugin_deprecated
 from sentry.app import env
@@ -50,7 +52,6 @@ from sentry.reprocessing2 import get_progress
 from sentry.search.events.constants import RELEASE_STAGE_ALIAS
 from sentry.search.events.filter import convert_search_filter_to_snuba_query, format_search_filter
 from sentry.snuba.dataset import Dataset
-from sentry.tagstore.snuba.backend import fix_tag_value_data
 from sentry.tagstore.types import GroupTagValue
 from sentry.tsdb.snuba import SnubaTSDB
 from sentry.types.group import SUBSTATUS_TO_STR, PriorityLevel
@@ -154,7 +155,14 @@ def is_seen_stats(o: object) -> TypeGuard[SeenStats]:
     return isinstance(o, dict) and "times_seen" in o
 
 
+def _parse_seen_timestamp(value: str) -> datetime:
+    return parse_datetime(value).replace(tzinfo=timezone.utc)
+
+
 class GroupSerializerBase(Serializer, ABC):
+    #: Whether the seen stats can be loaded concurrently, see `AttributeLoaders`.
+    threaded_seen_stats = False
+
     def __init__(
         self,
         collapse=None,
@@ -196,28 +204,55 @@ class GroupSerializerBase(Serializer, ABC):
         # making unnecessary queries.
         prefetch_related_objects(item_list, "project__organization")
 
+        # The lookups are independent of each other, threaded ones run alongside all of the others.
+        loaders = AttributeLoaders()
         if user.is_authenticated and item_list:
-            bookmarks = set(
-                GroupBookmark.objects.filter(user_id=user.id, group__in=item_list).values_list(
-                    "group_id", flat=True
-                )
+            loaders.add(
+                "bookmarks",
+                lambda: set(
+                    GroupBookmark.objects.filter(user_id=user.id, group__in=item_list).values_list(
+                        "group_id", flat=True
+                    )
+                ),
             )
-            seen_groups = dict(
-                GroupSeen.objects.filter(user_id=user.id, group__in=item_list).values_list(
-                    "group_id", "last_seen"
-                )
+            loaders.add(
+                "seen_groups",
+                lambda: dict(
+                    GroupSeen.objects.filter(user_id=user.id, group__in=item_list).values_list(
+                        "group_id", "last_seen"
+                    )
+                ),
             )
-            subscriptions = self._get_subscriptions(item_list, user)
+            loaders.add("subscriptions", lambda: self._get_subscriptions(item_list, user))
+        loaders.add("assignees", lambda: self._serialize_assignees(item_list))
+        loaders.add(
+            "ignore_items",
+            lambda: {g.group_id: g for g in GroupSnooze.objects.filter(group__in=item_list)},
+        )
+        loaders.add("resolutions", lambda: self._resolve_resolutions(item_list, user))
+        loaders.add(
+            "share_ids",
+            lambda: dict(
+                GroupShare.objects.filter(group__in=item_list).values_list("group_id", "uuid")
+            ),
+        )
+        self._add_seen_stats_loaders(loaders, item_list, user)
+        loaded = loaders.load()
+
+        if user.is_authenticated and item_list:
+            bookmarks = loaded["bookmarks"]
+            seen_groups = loaded["seen_groups"]
+            subscriptions = loaded["subscriptions"]
         else:
             bookmarks = set()
             seen_groups = {}
             subscriptions = defaultdict(lambda: (False, False, None))
 
-        resolved_assignees = self._serialize_assignees(item_list)
-
-        ignore_items = {g.group_id: g for g in GroupSnooze.objects.filter(group__in=item_list)}
-
-        release_resolutions, commit_resolutions = self._resolve_resolutions(item_list, user)
+        resolved_assignees = loaded["assignees"]
+        ignore_items = loaded["ignore_items"]
+        release_resolutions, commit_resolutions = loaded["resolutions"]
+        share_ids = loaded["share_ids"]
+        seen_stats = self._merge_seen_stats(item_list, loaded)
 
         user_ids = {
             user_id
@@ -236,12 +271,6 @@ class GroupSerializerBase(Serializer, ABC):
         else:
             actors = {}
 
-        share_ids = dict(
-            GroupShare.objects.filter(group__in=item_list).values_list("group_id", "uuid")
-        )
-
-        seen_stats = self._get_seen_stats(item_list, user)
-
         organization_id_list = list({item.project.organization_id for item in item_list})
         # if no groups, then we can't proceed but this seems to be a valid use case
         if not item_list:
@@ -455,23 +484,42 @@ class GroupSerializerBase(Serializer, ABC):
             - last_seen
             - user_count
         """
-        if self._collapse("stats"):
-            return None
+        loaders = AttributeLoaders()
+        self._add_seen_stats_loaders(loaders, item_list, user)
+        return self._merge_seen_stats(item_list, loaders.load())
 
-        if not item_list:
-            return None
+    def _add_seen_stats_loaders(
+        self, loaders: AttributeLoaders, item_list: Sequence[Group], user
+    ) -> None:
+        if self._collapse("stats") or not item_list:
+            return
 
-        # partition the item_list by type
+        # partition the item_list by type, the seen_stats are bulk queried by type
         error_issues = [group for group in item_list if GroupCategory.ERROR == group.issue_category]
         generic_issues = [
             group for group in item_list if group.issue_category != GroupCategory.ERROR
         ]
+        if error_issues:
+            loaders.add(
+                "seen_stats_error",
+                lambda: self._seen_stats_error(error_issues, user),
+                threaded=self.threaded_seen_stats,
+            )
+        if generic_issues:
+            loaders.add(
+                "seen_stats_generic",
+                lambda: self._seen_stats_generic(generic_issues, user),
+                threaded=self.threaded_seen_stats,
+            )
+
+    def _merge_seen_stats(
+        self, item_list: Sequence[Group], loaded: Mapping[str, Any]
+    ) -> Mapping[Group, SeenStats] | None:
+        if self._collapse("stats") or not item_list:
+            return None
 
-        # bulk query for the seen_stats by type
-        error_stats = (self._seen_stats_error(error_issues, user) if error_issues else {}) or {}
-        generic_stats = (
-            self._seen_stats_generic(generic_issues, user) if generic_issues else {}
-        ) or {}
+        error_stats = loaded.get("seen_stats_error") or {}
+        generic_stats = loaded.get("seen_stats_generic") or {}
         agg_stats = {**error_stats, **generic_stats}
         # combine results back
         return {group: agg_stats[group] for group in item_list if group in agg_stats}
@@ -932,6 +980,8 @@ class GroupSerializerSnuba(GroupSerializerBase):
         # postgres for no reason
         RELEASE_STAGE_ALIAS,
     }
+    # The seen stats are queried from Snuba.
+    threaded_seen_stats = True
 
     def __init__(
         self,
@@ -1104,17 +1154,17 @@ class GroupSerializerSnuba(GroupSerializerBase):
     def _parse_seen_stats_results(
         result, item_list, use_result_first_seen_times_seen, environment_ids=None
     ):
-        seen_data = {
-            issue["group_id"]: fix_tag_value_data(
-                dict(filter(lambda key: key[0] != "group_id", issue.items()))
-            )
-            for issue in result["data"]
-        }
-        user_counts = {item_id: value["count"] for item_id, value in seen_data.items()}
-        last_seen = {item_id: value["last_seen"] for item_id, value in seen_data.items()}
+        # The results are read column by column rather than copied row by row, and the first
+        # seen timestamps are only parsed when they are used.
+        rows = result["data"]
+        group_ids = [row["group_id"] for row in rows]
+        user_counts = dict(zip(group_ids, [row["count"] for row in rows]))
+        last_seen = dict(zip(group_ids, [_parse_seen_timestamp(row["last_seen"]) for row in rows]))
         if use_result_first_seen_times_seen:
-            first_seen = {item_id: value["first_seen"] for item_id, value in seen_data.items()}
-            times_seen = {item_id: value["times_seen"] for item_id, value in seen_data.items()}
+            first_seen = dict(
+                zip(group_ids, [_parse_seen_timestamp(row["first_seen"]) for row in rows])
+            )
+            times_seen = dict(zip(group_ids, [row["times_seen"] for row in rows]))
         else:
             if environment_ids:
                 first_seen = {
@@ -2,14 +2,14 @@ from __future__ import annotations
 
 import functools
 from abc import abstractmethod
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from datetime import datetime, timedelta
 from typing import Any, NamedTuple, NotRequired, Protocol, TypedDict
 
 from django.contrib.auth.models import AnonymousUser
 from django.utils import timezone
 
-from sentry import features, release_health, tsdb
+from sentry import features, options, release_health, tsdb
 from sentry.api.serializers import serialize
 from sentry.api.serializers.models.group import (
     BaseGroupSerializerResponse,
@@ -50,6 +50,15 @@ from sentry.utils.safe import safe_execute
 from sentry.utils.snuba import resolve_column, resolve_conditions
 
 
+def _zip_series(
+    get_range_columns: Callable[..., tuple[list[int], dict[int, list[int]]]], **kwargs: Any
+) -> dict[int, list[tuple[int, int]]]:
+    # The timestamps are shared by every group, so each series is only zipped once from its
+    # counts, rather than built point by point from nested mappings.
+    series, columns = get_range_columns(**kwargs)
+    return {group_id: list(zip(series, counts)) for group_id, counts in columns.items()}
+
+
 def get_actions(group: Group) -> list[tuple[str, str]]:
     from sentry.plugins.base import plugins
 
@@ -565,12 +574,15 @@ class StreamGroupSerializerSnuba(GroupSerializerSnuba, GroupStatsMixin):
         error_conditions = resolve_conditions(conditions, resolve_column(Dataset.Discover))
         issue_conditions = resolve_conditions(conditions, resolve_column(Dataset.IssuePlatform))
 
+        columnar = options.get("api.issue-stream.columnar-stats")
         get_range = functools.partial(
-            snuba_tsdb.get_range,
+            snuba_tsdb.get_range_columns if columnar else snuba_tsdb.get_range,
             environment_ids=environment_ids,
             tenant_ids={"organization_id": self.organization_id},
             **query_params,
         )
+        if columnar:
+            get_range = functools.partial(_zip_series, get_range)
 
         results = {}
 
@@ -24,6 +24,7 @@ from sentry.api.serializers.models.role import (
     TeamRoleSerializerResponse,
 )
 from sentry.api.serializers.models.team import TeamSerializerResponse
+from sentry.api.serializers.result_cache import cache_results, user_scope
 from sentry.api.serializers.types import SerializedAvatarFields
 from sentry.api.utils import generate_region_url
 from sentry.auth.access import Access
@@ -279,7 +280,24 @@ class ControlSiloOrganizationSerializer(Serializer):
         )
 
 
+def _organization_result_scope(
+    user: User | RpcUser | AnonymousUser, kwargs: Mapping[str, Any]
+) -> str | None:
+    # The access and onboarding tasks of the viewer are not cached.
+    if "access" in kwargs:
+        return None
+    return f"{user_scope(user, kwargs)}:{kwargs.get('include_feature_flags', True)}"
+
+
 @register(Organization)
+@cache_results(
+    invalidated_by=[
+        (Organization, lambda organization: organization.id),
+        (OrganizationAvatar, lambda avatar: avatar.organization_id),
+        (OrganizationOption, lambda option: option.organization_id),
+    ],
+    get_scope=_organization_result_scope,
+)
 class OrganizationSerializer(Serializer):
     def get_attrs(
         self, item_list: Sequence[Organization], user: User | RpcUser | AnonymousUser, **kwargs: Any
@@ -0,0 +1,163 @@
+"""
+Opt-in cache of serialized objects which rarely change but appear in most API responses.
+
+The results of a serializer are cached per object and per scope, the part of the viewer and of
+the `serialize` arguments which the result depends on. All cached results of an object share a
+version, which is dropped whenever the object, or a model it is serialized from, is saved or
+deleted. Changes made without signals (e.g. queryset updates) and data from other silos or from
+feature flags are only picked up once the results expire.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from django.contrib.auth.models import AnonymousUser
+from django.db import router, transaction
+from django.db.models.signals import post_delete, post_save
+
+from sentry import options
+from sentry.db.models import Model
+from sentry.users.models.user import User
+from sentry.users.services.user.model import RpcUser
+from sentry.utils import metrics
+from sentry.utils.cache import cache
+
+S = TypeVar("S")
+
+ScopeFunction = Callable[[User | RpcUser | AnonymousUser, Mapping[str, Any]], str | None]
+
+
+def user_scope(user: User | RpcUser | AnonymousUser, kwargs: Mapping[str, Any]) -> str | None:
+    """The default scope, results are cached per user."""
+    return str(user.id) if user.is_authenticated else "anonymous"
+
+
+@dataclass(frozen=True)
+class ResultCache:
+    name: str
+    #: Returns the scope of the results, or None if they must not be cached.
+    get_scope: ScopeFunction
+
+    def _version_key(self, object_id: int) -> str:
+        return f"serializer-result-version:{self.name}:{object_id}"
+
+    def _result_key(self, object_id: int, version: str, scope: str) -> str:
+        return f"serializer-result:{self.name}:{object_id}:{version}:{scope}"
+
+    def _get_versions(self, object_ids: Sequence[int]) -> dict[int, str]:
+        version_keys = {object_id: self._version_key(object_id) for object_id in object_ids}
+        cached = cache.get_many(version_keys.values())
+        versions = {}
+        for object_id, version_key in version_keys.items():
+            version = cached.get(version_key)
+            if version is None:
+                # Results cached under an evicted version must not be served again.
+                version = uuid.uuid4().hex
+                cache.set(version_key, version, self.ttl * 2)
+            versions[object_id] = version
+        return versions
+
+    @property
+    def ttl(self) -> int:
+        return options.get("api.serializers.result-cache.ttl")
+
+    def get_many(self, objects: Sequence[Any], scope: str) -> tuple[dict[int, Any], dict[int, str]]:
+        """
+        Returns the cached results by object id, and the keys to cache the missing ones with.
+        """
+        versions = self._get_versions([o.id for o in objects])
+        result_keys = {
+            object_id: self._result_key(object_id, version, scope)
+            for object_id, version in versions.items()
+        }
+        cached = cache.get_many(result_keys.values())
+
+        results = {}
+        missing_keys = {}
+        for object_id, result_key in result_keys.items():
+            if result_key in cached:
+                results[object_id] = cached[result_key]
+            else:
+                missing_keys[object_id] = result_key
+
+        if results:
+            metrics.incr(
+                "api.serializers.result_cache",
+                amount=len(results),
+                tags={"serializer": self.name, "outcome": "hit"},
+            )
+        if missing_keys:
+            metrics.incr(
+                "api.serializers.result_cache",
+                amount=len(missing_keys),
+                tags={"serializer": self.name, "outcome": "miss"},
+            )
+        return results, missing_keys
+
+    def set_many(self, results: Mapping[str, Any]) -> None:
+        if results:
+            cache.set_many(results, self.ttl)
+
+    def invalidate(self, object_ids: Iterable[int]) -> None:
+        cache.delete_many([self._version_key(object_id) for object_id in object_ids])
+
+
+#: The result caches of serializers, by their exact class. Subclasses of a cached serializer
+#: are not cached unless they opt in themselves, since they may depend on other models.
+_result_caches: dict[type, ResultCache] = {}
+
+
+def get_result_cache(serializer: Any) -> ResultCache | None:
+    return _result_caches.get(type(serializer))
+
+
+def cache_results(
+    invalidated_by: Sequence[tuple[type[Model], Callable[[Any], int | None]]],
+    get_scope: ScopeFunction = user_scope,
+) -> Callable[[type[S]], type[S]]:
+    """
+    Opts a serializer into caching its results, see the module documentation.
+
+    :param invalidated_by: The models the results are serialized from, with a function
+        returning the id of the serialized object from a saved or deleted instance.
+    :param get_scope: Returns the scope of the results for the viewing user and the keyword
+        arguments passed to `serialize`, or None to skip the cache.
+    """
+
+    def wrapped(cls: type[S]) -> type[S]:
+        result_cache = ResultCache(name=cls.__name__, get_scope=get_scope)
+        _result_caches[cls] = result_cache
+
+        for model, get_object_id in invalidated_by:
+
+            def invalidate(
+                instance: Model,
+                get_object_id: Callable[[Any], int | None] = get_object_id,
+                model: type[Model] = model,
+                **kwargs: Any,
+            ) -> None:
+                object_id = get_object_id(instance)
+                if object_id is None:
+                    return
+                # Invalidated again once committed, as results built from the previous rows
+                # until then would be cached under the new version.
+                result_cache.invalidate([object_id])
+                transaction.on_commit(
+                    lambda: result_cache.invalidate([object_id]),
+                    using=router.db_for_write(model),
+                )
+
+            for signal in (post_save, post_delete):
+                signal.connect(
+                    invalidate,
+                    sender=model,
+                    dispatch_uid=f"invalidate_{cls.__name__}_results_{model.__name__}",
+                    weak=False,
+                )
+        return cls
+
+    return wrapped
@@ -0,0 +1,107 @@
+"""
+JSON responses which are encoded and sent in chunks, for endpoints returning large payloads.
+
+A regular `Response` is rendered in one go, keeping the whole encoded payload (and a copy of it)
+in memory next to the data until it is sent. A `StreamingJSONResponse` encodes the items of the
+top level list, or of the lists in the top level object, one at a time with orjson instead, and
+sends them once enough of them are buffered.
+
+The output decodes to the same values as the one of the default renderer, with two exceptions:
+floats may be formatted differently (e.g. `1e16` rather than `1e+16`), and NaN and infinite
+floats are encoded as `null` (as `sentry.utils.json` does) rather than raising an error.
+
+The data should be fully serialized when the response is created, since it is only encoded
+once the view has returned: errors past that point can not change the status of the response.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator, Iterator, Mapping
+from typing import Any
+
+import orjson
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+#: The size encoded items are buffered up to before being sent, in bytes.
+CHUNK_SIZE = 64 * 1024
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+# Encodes values unsupported by orjson, and dates and times, the same way as the default renderer.
+_default = JSONEncoder().default
+
+
+def _dumps(value: Any) -> bytes:
+    # Escaped by the default renderer, as these are not valid in JavaScript strings.
+    return (
+        orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS)
+        .replace(b"\xe2\x80\xa8", b"\\u2028")
+        .replace(b"\xe2\x80\xa9", b"\\u2029")
+    )
+
+
+def _is_streamed(value: Any) -> bool:
+    return isinstance(value, (list, tuple, Iterator))
+
+
+def _iter_parts(data: Any, depth: int = 0) -> Generator[bytes]:
+    if _is_streamed(data):
+        yield b"["
+        for i, item in enumerate(data):
+            if i:
+                yield b","
+            yield _dumps(item)
+        yield b"]"
+    elif depth == 0 and isinstance(data, Mapping):
+        yield b"{"
+        for i, (key, value) in enumerate(data.items()):
+            if i:
+                yield b","
+            yield _dumps(str(key))
+            yield b":"
+            yield from _iter_parts(value, depth + 1)
+        yield b"}"
+    else:
+        yield _dumps(data)
+
+
+def iter_json(data: Any, chunk_size: int = CHUNK_SIZE) -> Generator[bytes]:
+    """
+    Encodes `data` as JSON in chunks of about `chunk_size` bytes. The items of a top level list,
+    or of the lists in a top level object, are encoded one at a time, and may be produced lazily
+    by an iterator.
+    """
+    if data is None:
+        # The default renderer sends no content either.
+        return
+    buffer = bytearray()
+    for part in _iter_parts(data):
+        buffer += part
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """
+    A response encoding `data` as JSON while it is sent, see the module documentation. It takes
+    the same arguments as `Response`, so that it can be used as the `response_cls` of
+    `Endpoint.paginate`, and keeps `data` like it, for the checks made on responses.
+    """
+
+    def __init__(
+        self,
+        data: Any = None,
+        status: int | None = None,
+        headers: Mapping[str, str] | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        super().__init__(
+            iter_json(data, chunk_size),
+            status=status,
+            headers=headers,
+            content_type="application/json",
+        )
+        self.data = data
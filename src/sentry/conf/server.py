@@ -2196,6 +2196,14 @@ SENTRY_OPTIONS: dict[str, Any] = {}
 SENTRY_DEFAULT_OPTIONS: dict[str, Any] = {}
 # Raise an error in dev on failed lookups
 SENTRY_OPTIONS_COMPLAIN_ON_ERRORS = True
+# Keep options in the local cache of processes until they change, as announced through a global
+# version in the cache, rather than re-fetching each of them once their TTL expires.
+SENTRY_OPTIONS_PUSH_INVALIDATION = False
+# How often processes check the global version of the options with push invalidation, in seconds.
+SENTRY_OPTIONS_VERSION_CHECK_INTERVAL = 1
+# How long options are kept in the local cache with push invalidation, in seconds. This bounds how
+# stale options get if a change is not announced, e.g. when the cache is repaired by sync_options.
+SENTRY_OPTIONS_PUSH_TTL = 300
 
 # You should not change this setting after your database has been created
 # unless you have altered all schemas first
@@ -79,6 +79,14 @@ def ingest_replay_recordings_options() -> list[click.Option]:
     """Return a list of ingest-replay-recordings options."""
     options = multiprocessing_options(default_max_batch_size=10)
     options.append(click.Option(["--threads", "num_threads"], type=int, default=4))
+    options.append(
+        click.Option(
+            ["--mode", "mode"],
+            type=click.Choice(["default", "batched-parallel"]),
+            default="default",
+            help="The mode to process recordings in. Batched-parallel uploads segments concurrently.",
+        )
+    )
     return options
 
 
@@ -121,14 +129,59 @@ def ingest_monitors_options() -> list[click.Option]:
     return options
 
 
+def monitors_clock_tasks_options() -> list[click.Option]:
+    """Return a list of monitors-clock-tasks options."""
+    options = [
+        click.Option(
+            ["--mode", "mode"],
+            type=click.Choice(["serial", "batched"]),
+            default="serial",
+            help="The mode to process clock tasks in. Batched processes the tasks of each clock tick as sets.",
+        ),
+        click.Option(
+            ["--max-batch-size", "max_batch_size"],
+            type=int,
+            default=1000,
+            help="Maximum number of clock tasks to batch before processing.",
+        ),
+        click.Option(
+            ["--max-batch-time", "max_batch_time"],
+            type=int,
+            default=1,
+            help="Maximum time spent batching clock tasks before processing.",
+        ),
+    ]
+    return options
+
+
+def query_subscription_options() -> list[click.Option]:
+    """Return a list of *-subscription-results options."""
+    return [
+        *multiprocessing_options(default_max_batch_size=100),
+        click.Option(
+            ["--mode", "mode"],
+            type=click.Choice(["serial", "batched-parallel"]),
+            default="serial",
+            help="The mode to process subscription results in. Batched-parallel uses multithreading.",
+        ),
+        click.Option(
+            ["--max-workers", "max_workers"],
+            type=int,
+            default=None,
+            help="The maximum number of threads to spawn in batched-parallel mode.",
+        ),
+    ]
+
+
 def uptime_options() -> list[click.Option]:
     """Return a list of uptime-results options."""
     options = [
         click.Option(
             ["--mode", "mode"],
-            type=click.Choice(["serial", "parallel", "batched-parallel"]),
+            type=click.Choice(["serial", "parallel", "batched-parallel", "batched"]),
             default="serial",
-            help="The mode to process results in. Parallel uses multithreading.",
+            help="The mode to process results in. Parallel uses multithreading. Batched processes "
+            "each batch of results together in the consumer thread.",
         ),
         click.Option(
             ["--max-batch-size", "max_batch_size"],
@@ -275,6 +328,7 @@ KAFKA_CONSUMERS: Mapping[str, ConsumerDefinition] = {
     "monitors-clock-tasks": {
         "topic": Topic.MONITORS_CLOCK_TASKS,
         "strategy_factory": "sentry.monitors.consumers.clock_tasks_consumer.MonitorClockTasksStrategyFactory",
+        "click_options": monitors_clock_tasks_options(),
     },
     "monitors-incident-occurrences": {
         "topic": Topic.MONITORS_INCIDENT_OCCURRENCES,
@@ -300,32 +354,32 @@ KAFKA_CONSUMERS: Mapping[str, ConsumerDefinition] = {
     "events-subscription-results": {
         "topic": Topic.EVENTS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "events"},
     },
     "transactions-subscription-results": {
         "topic": Topic.TRANSACTIONS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "transactions"},
     },
     "generic-metrics-subscription-results": {
         "topic": Topic.GENERIC_METRICS_SUBSCRIPTIONS_RESULTS,
         "validate_schema": True,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "generic_metrics"},
     },
     "metrics-subscription-results": {
         "topic": Topic.METRICS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "metrics"},
     },
     "eap-spans-subscription-results": {
         "topic": Topic.EAP_SPANS_SUBSCRIPTIONS_RESULTS,
         "strategy_factory": "sentry.snuba.query_subscriptions.run.QuerySubscriptionStrategyFactory",
-        "click_options": multiprocessing_options(default_max_batch_size=100),
+        "click_options": query_subscription_options(),
         "static_args": {"dataset": "events_analytics_platform"},
     },
     "ingest-events": {
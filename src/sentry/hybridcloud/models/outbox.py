@@ -4,6 +4,7 @@ import abc
 import contextlib
 import datetime
 import threading
+import time
 from collections.abc import Generator, Iterable, Mapping
 from typing import Any, Self
 
@@ -57,6 +58,57 @@ def _ensure_not_null(k: str, v: Any) -> Any:
     return v
 
 
+# Processed outboxes are deleted in batches, see `OutboxBase.process_coalesced`.
+DELETE_BATCH_SIZE = 50
+MIN_DELETE_BATCH_SIZE = 10
+MAX_DELETE_BATCH_SIZE = 1000
+# Deletes taking longer than this (in seconds) shrink the batch size of their category.
+DELETE_BATCH_TARGET_DURATION = 0.1
+
+
+class AdaptiveBatchSize:
+    """
+    Batch size tracked per outbox category. The size doubles while full batches
+    complete well within the target duration and halves as soon as a batch takes
+    longer, so that categories with cheap deletes drain in larger batches without
+    letting expensive ones run into statement timeouts.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int, target_duration: float) -> None:
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_duration = target_duration
+        self._sizes: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, category: int) -> int:
+        with self._lock:
+            return self._sizes.get(category, self.initial)
+
+    def record(self, category: int, size: int, duration: float) -> int:
+        with self._lock:
+            current = self._sizes.get(category, self.initial)
+            if duration > self.target_duration:
+                current = max(self.minimum, current // 2)
+            elif duration < self.target_duration / 2 and size >= current:
+                current = min(self.maximum, current * 2)
+            self._sizes[category] = current
+            return current
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sizes.clear()
+
+
+delete_batch_sizes = AdaptiveBatchSize(
+    initial=DELETE_BATCH_SIZE,
+    minimum=MIN_DELETE_BATCH_SIZE,
+    maximum=MAX_DELETE_BATCH_SIZE,
+    target_duration=DELETE_BATCH_TARGET_DURATION,
+)
+
+
 class OutboxBase(Model):
     sharding_columns: Iterable[str]
     coalesced_columns: Iterable[str]
@@ -244,19 +296,31 @@ class OutboxBase(Model):
         if coalesced is not None:
             assert first_coalesced, "first_coalesced incorrectly set for non-empty coalesce group"
             deleted_count = 0
+            adaptive_batch_size = options.get("hybrid_cloud.outbox.adaptive_delete_batch_size")
 
             # Use a fetch and delete loop as doing cleanup in a single query
-            # causes timeouts with large datasets. Fetch in batches of 50 and
+            # causes timeouts with large datasets. Fetch in batches and
             # Apply the ID condition in python as filtering rows in postgres
             # leads to timeouts.
             while True:
-                batch = self.select_coalesced_messages().values_list("id", flat=True)[:50]
+                batch_size = DELETE_BATCH_SIZE
+                if adaptive_batch_size:
+                    batch_size = delete_batch_sizes.get(self.category)
+
+                start = time.monotonic()
+                batch = list(
+                    self.select_coalesced_messages().values_list("id", flat=True)[:batch_size]
+                )
                 delete_ids = [item_id for item_id in batch if item_id < coalesced.id]
                 if not len(delete_ids):
                     break
                 self.objects.filter(id__in=delete_ids).delete()
                 deleted_count += len(delete_ids)
 
+                if adaptive_batch_size:
+                    delete_batch_sizes.record(self.category, len(batch), time.monotonic() - start)
+                    metrics.distribution("outbox.delete_batch_size", batch_size, tags=tags)
+
             # Only process the highest id after the others have been batch processed.
             # It's not guaranteed that the ordering of the batch processing is in order,
             # meaning that failures during deletion could leave an old, staler outbox
@@ -318,7 +382,10 @@ class OutboxBase(Model):
 
     def drain_shard(
         self, flush_all: bool = False, _test_processing_barrier: threading.Barrier | None = None
-    ) -> None:
+    ) -> int:
+        """
+        Processes the coalesced messages of this shard, returning how many were processed.
+        """
         in_test_assert_no_transaction(
             "drain_shard should only be called outside of any active transaction!"
         )
@@ -330,8 +397,9 @@ class OutboxBase(Model):
             # If we're not flushing all possible shards, and we don't see any immediate values,
             # drop.
             if latest_shard_row is None:
-                return
+                return 0
 
+        processed_count = 0
         shard_row: OutboxBase | None
         while True:
             with self.process_shard(latest_shard_row) as shard_row:
@@ -349,6 +417,10 @@ class OutboxBase(Model):
                 if not processed:
                     break
 
+                processed_count += 1
+
+        return processed_count
+
     @classmethod
     def get_shard_depths_descending(cls, limit: int | None = 10) -> list[dict[str, int | str]]:
         """
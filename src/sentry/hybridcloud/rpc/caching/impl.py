@@ -1,9 +1,16 @@
+import threading
+import time
+from collections import defaultdict
 from collections.abc import Generator, Mapping
-from typing import TypeVar
+from typing import Any, TypeVar
 
+from cachetools import LRUCache
+from celery.signals import task_failure, task_success
 from django.core.cache import cache
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.signals import request_finished
 
+from sentry import app, options
 from sentry.hybridcloud.models.cacheversion import (
     CacheVersionBase,
     ControlCacheVersion,
@@ -11,9 +18,25 @@ from sentry.hybridcloud.models.cacheversion import (
 )
 from sentry.hybridcloud.rpc.caching.service import ControlCachingService, RegionCachingService
 from sentry.silo.base import SiloMode
+from sentry.utils import metrics
 
 _V = TypeVar("_V")
 
+LOCAL_CACHE_MAX_SIZE = 10_000
+LOCAL_CACHE_TTL = 60
+
+# Per-process cache in front of the django cache, enabled with `hybridcloud.caching.local_cache`.
+# It holds values by their versioned key, so clearing a key (which bumps its version) makes its
+# entries unreachable without any cross-process invalidation. Entries expire after
+# LOCAL_CACHE_TTL seconds to bound how long a value overwritten at the same version, after the
+# django cache lost it, can be served.
+_local_cache: LRUCache[str, tuple[float, str]] = LRUCache(maxsize=LOCAL_CACHE_MAX_SIZE)
+_local_cache_lock = threading.Lock()
+
+# Versions read during the current request, so that a key read many times in a request has its
+# version checked once. Cleared when the request finishes, like `sentry.utils.request_cache`.
+_request_versions = threading.local()
+
 # Implementation uses generators so that testing concurrent read after writer properties is much easier.
 # In practice all generators are synchronously consumed, except for tests.
 
@@ -26,12 +49,75 @@ def _consume_generator(g: Generator[None, None, _V]) -> _V:
             return e.value
 
 
+def _local_cache_enabled() -> bool:
+    return options.get("hybridcloud.caching.local_cache")
+
+
+def _get_request_versions() -> dict[tuple[SiloMode, str], int] | None:
+    # Outside of requests there is nothing to scope the versions to.
+    if app.env.request is None:
+        return None
+    if not hasattr(_request_versions, "versions"):
+        _request_versions.versions = {}
+    return _request_versions.versions
+
+
+def clear_request_versions(**kwargs: Any) -> None:
+    _request_versions.versions = {}
+
+
+request_finished.connect(clear_request_versions)
+task_failure.connect(clear_request_versions)
+task_success.connect(clear_request_versions)
+
+
+def clear_local_cache() -> None:
+    with _local_cache_lock:
+        _local_cache.clear()
+    clear_request_versions()
+
+
+def _get_local_values(versioned_keys: list[str]) -> dict[str, str]:
+    now = time.monotonic()
+    with _local_cache_lock:
+        return {
+            versioned_key: entry[1]
+            for versioned_key in versioned_keys
+            if (entry := _local_cache.get(versioned_key)) is not None and entry[0] > now
+        }
+
+
+def _set_local_values(values: Mapping[str, Any]) -> None:
+    expires_at = time.monotonic() + LOCAL_CACHE_TTL
+    with _local_cache_lock:
+        for versioned_key, value in values.items():
+            if isinstance(value, str):
+                _local_cache[versioned_key] = (expires_at, value)
+
+
+def _record_local_cache_hits(keys: list[str], hits: set[str]) -> None:
+    counts: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    for key in keys:
+        base_key = key.rsplit(":", 1)[0]
+        counts[base_key][0 if key in hits else 1] += 1
+
+    for base_key, (hit_count, miss_count) in counts.items():
+        tags = {"base_key": base_key}
+        if hit_count:
+            metrics.incr("hybridcloud.caching.local.hit", hit_count, tags=tags)
+        if miss_count:
+            metrics.incr("hybridcloud.caching.local.miss", miss_count, tags=tags)
+
+
 def _set_cache(
     key: str, value: str | None, version: int, timeout: int | None = None
 ) -> Generator[None, None, bool]:
     if timeout is None:
         timeout = DEFAULT_TIMEOUT
-    result = cache.add(_versioned_key(key, version), value, timeout=timeout)
+    versioned_key = _versioned_key(key, version)
+    result = cache.add(versioned_key, value, timeout=timeout)
+    if result and _local_cache_enabled():
+        _set_local_values({versioned_key: value})
     yield
     return result
 
@@ -50,16 +136,46 @@ def _version_model(mode: SiloMode) -> type[CacheVersionBase]:
 
 def _delete_cache(key: str, mode: SiloMode) -> Generator[None, None, int]:
     version = _version_model(mode).incr_version(key)
+    request_versions = _get_request_versions()
+    if request_versions is not None:
+        request_versions[(mode, key)] = version
     yield
     return version
 
 
 def _get_cache(keys: list[str], mode: SiloMode) -> Generator[None, None, Mapping[str, str | int]]:
-    versions = {cv.key: cv.version for cv in _version_model(mode).objects.filter(key__in=keys)}
+    local_cache = _local_cache_enabled()
+    request_versions = _get_request_versions() if local_cache else None
+
+    versions: dict[str, int] = {}
+    unchecked_keys = keys
+    if request_versions is not None:
+        versions = {
+            key: request_versions[(mode, key)] for key in keys if (mode, key) in request_versions
+        }
+        unchecked_keys = [key for key in keys if key not in versions]
+    if unchecked_keys:
+        versions.update(
+            (cv.key, cv.version)
+            for cv in _version_model(mode).objects.filter(key__in=unchecked_keys)
+        )
+        if request_versions is not None:
+            for key in unchecked_keys:
+                request_versions[(mode, key)] = versions.get(key, 0)
     yield
 
     versioned_keys = [_versioned_key(key, versions.get(key, 0)) for key in keys]
-    existing = cache.get_many(versioned_keys)
+    if local_cache:
+        local_values = _get_local_values(versioned_keys)
+        _record_local_cache_hits(
+            keys, {key for key, vk in zip(keys, versioned_keys) if vk in local_values}
+        )
+        remote_keys = [vk for vk in versioned_keys if vk not in local_values]
+        existing = dict(cache.get_many(remote_keys)) if remote_keys else {}
+        _set_local_values(existing)
+        existing.update(local_values)
+    else:
+        existing = cache.get_many(versioned_keys)
     yield
     result: dict[str, str | int] = {}
     for k, versioned_key in zip(keys, versioned_keys):
@@ -50,6 +50,7 @@ class SiloCacheBackedCallable(Generic[_R]):
     silo_mode: SiloMode
     base_key: str
     cb: Callable[[int], _R | None]
+    many_cb: Callable[[list[int]], list[_R]] | None
     type_: type[_R]
     timeout: int | None
 
@@ -60,12 +61,16 @@ class SiloCacheBackedCallable(Generic[_R]):
         cb: Callable[[int], _R | None],
         t: type[_R],
         timeout: int | None = None,
+        many_cb: Callable[[list[int]], list[_R]] | None = None,
     ):
         self.base_key = base_key
         self.silo_mode = silo_mode
         self.cb = cb
+        self.many_cb = many_cb
         self.type_ = t
         self.timeout = timeout
+        # Records are stored under the same keys and in the same format by both callables.
+        self._many = SiloCacheManyBackedCallable(base_key, silo_mode, self._fetch_many, t, timeout)
 
     def __call__(self, object_id: int) -> _R | None:
         if (
@@ -75,6 +80,28 @@ class SiloCacheBackedCallable(Generic[_R]):
             return self.cb(object_id)
         return self.get_one(object_id)
 
+    def _fetch_many(self, object_ids: list[int]) -> list[_R]:
+        if not object_ids:
+            return []
+        if self.many_cb is not None:
+            return self.many_cb(object_ids)
+        return [r for object_id in object_ids if (r := self.cb(object_id)) is not None]
+
+    def get_many(self, object_ids: list[int]) -> list[_R]:
+        """
+        Get many records, reading all of them from cache at once. Records missing
+        from cache are fetched with a single call to `many_cb` when one is given,
+        otherwise the wrapped function is called for each of them.
+
+        Records that do not exist are omitted from the result.
+        """
+        if (
+            SiloMode.get_current_mode() != self.silo_mode
+            and SiloMode.get_current_mode() != SiloMode.MONOLITH
+        ):
+            return self._fetch_many(object_ids)
+        return self._many.get_many(object_ids)
+
     def key_from(self, object_id: int) -> str:
         return f"{self.base_key}:{object_id}"
 
@@ -274,7 +301,11 @@ class SiloCacheManyBackedCallable(Generic[_R]):
 
 
 def back_with_silo_cache(
-    base_key: str, silo_mode: SiloMode, t: type[_R], timeout: int | None = None
+    base_key: str,
+    silo_mode: SiloMode,
+    t: type[_R],
+    timeout: int | None = None,
+    many_cb: Callable[[list[int]], list[_R]] | None = None,
 ) -> Callable[[Callable[[int], _R | None]], "SiloCacheBackedCallable[_R]"]:
     """
     Decorator for adding local caching to RPC operations on a single record.
@@ -285,11 +316,14 @@ def back_with_silo_cache(
     function for generating keys to clear cache entries
     with region_caching_service and control_caching_service.
 
+    The wrapped function also gets a `get_many` method to read many records at once,
+    `many_cb` can be given to fetch the records missing from cache in a single call.
+
     See user_service.get_user() for an example usage.
     """
 
     def wrapper(cb: Callable[[int], _R | None]) -> "SiloCacheBackedCallable[_R]":
-        return SiloCacheBackedCallable(base_key, silo_mode, cb, t, timeout)
+        return SiloCacheBackedCallable(base_key, silo_mode, cb, t, timeout, many_cb)
 
     return wrapper
 
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import math
+import queue
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import sentry_sdk
 from celery import Task
 from django.conf import settings
+from django.db import connections
 from django.db.models import Max, Min
 
+from sentry import options
 from sentry.hybridcloud.models.outbox import (
     ControlOutboxBase,
     OutboxBase,
@@ -59,6 +65,9 @@ def enqueue_outbox_jobs(
 # non coalesced work.
 CONCURRENCY = 5
 
+# The number of deepest shards reported in the shard depth distribution each turn of the scheduler.
+SHARD_DEPTH_SAMPLE_SIZE = 10
+
 
 def schedule_batch(
     silo_mode: SiloMode,
@@ -101,10 +110,19 @@ def schedule_batch(
                     outbox_identifier_hi=lo + (i + 1) * batch_size,
                 )
 
-            deepest_shard_information = outbox_model.get_shard_depths_descending(limit=1)
+            deepest_shard_information = outbox_model.get_shard_depths_descending(
+                limit=SHARD_DEPTH_SAMPLE_SIZE
+            )
             max_shard_depth = (
                 float(deepest_shard_information[0]["depth"]) if deepest_shard_information else 0.0
             )
+            for shard_information in deepest_shard_information:
+                metrics.distribution(
+                    "deliver_from_outbox.shard_depth",
+                    shard_information["depth"],
+                    tags=metrics_tags,
+                    sample_rate=1.0,
+                )
             metrics.gauge(
                 "deliver_from_outbox.maximum_shard_depth",
                 value=max_shard_depth,
@@ -174,33 +192,107 @@ def drain_outbox_shards_control(
 def process_outbox_batch(
     outbox_identifier_hi: int, outbox_identifier_low: int, outbox_model: type[OutboxBase]
 ) -> int:
-    processed_count: int = 0
-    for shard_attributes in outbox_model.find_scheduled_shards(
+    """
+    Drains the scheduled shards with outboxes in the given id range, returning the
+    number of shards that were drained.
+
+    Shards are independent of each other, so with `hybrid_cloud.outbox.parallel_drain_workers`
+    set above 1 they are drained concurrently by a pool of threads.
+    """
+    start = time.monotonic()
+    worker_threads = options.get("hybrid_cloud.outbox.parallel_drain_workers")
+    scheduled_shards = outbox_model.find_scheduled_shards(
         outbox_identifier_low, outbox_identifier_hi
-    ):
+    )
+
+    results: list[tuple[int, int]]
+    if worker_threads > 1 and len(scheduled_shards) > 1:
+        shard_queue: queue.SimpleQueue[Mapping[str, Any]] = queue.SimpleQueue()
+        for shard_attributes in scheduled_shards:
+            shard_queue.put(shard_attributes)
+
+        with ThreadPoolExecutor(max_workers=worker_threads) as threadpool:
+            futures = [
+                threadpool.submit(_drain_shard_queue, shard_queue, outbox_model)
+                for _ in range(min(worker_threads, len(scheduled_shards)))
+            ]
+            # Surfaces errors raised by the workers, see _drain_scheduled_shard
+            results = [future.result() for future in futures]
+    else:
+        results = [_drain_scheduled_shards(scheduled_shards, outbox_model)]
+
+    processed_count = sum(drained_shards for drained_shards, _ in results)
+    processed_messages = sum(messages for _, messages in results)
+
+    metrics_tags = {"outbox_name": outbox_model._meta.label, "parallel": int(worker_threads > 1)}
+    metrics.incr("deliver_from_outbox.drained_shards", processed_count, tags=metrics_tags)
+    duration = time.monotonic() - start
+    if processed_messages and duration > 0:
+        metrics.distribution(
+            "deliver_from_outbox.drain_rate",
+            processed_messages / duration,
+            tags=metrics_tags,
+        )
+    return processed_count
+
+
+def _drain_shard_queue(
+    shard_queue: queue.SimpleQueue[Mapping[str, Any]], outbox_model: type[OutboxBase]
+) -> tuple[int, int]:
+    try:
+        return _drain_scheduled_shards(_iter_queue(shard_queue), outbox_model)
+    finally:
+        # Django establishes a connection per thread, close the connections of this
+        # worker explicitly to avoid them lingering.
+        connections.close_all()
+
+
+def _iter_queue(shard_queue: queue.SimpleQueue[Mapping[str, Any]]) -> Iterator[Mapping[str, Any]]:
+    while True:
+        try:
+            yield shard_queue.get_nowait()
+        except queue.Empty:
+            return
+
+
+def _drain_scheduled_shards(
+    scheduled_shards: Iterable[Mapping[str, Any]], outbox_model: type[OutboxBase]
+) -> tuple[int, int]:
+    """
+    Drains the given shards one after another, returning the number of shards
+    drained and the number of coalesced messages processed.
+    """
+    processed_count = 0
+    processed_messages = 0
+    for shard_attributes in scheduled_shards:
         shard_outbox: OutboxBase | None = outbox_model.prepare_next_from_shard(shard_attributes)
         if not shard_outbox:
             continue
 
-        try:
-            processed_count += 1
-            shard_outbox.drain_shard(flush_all=True)
-        except Exception as e:
-            with sentry_sdk.isolation_scope() as scope:
-                if isinstance(e, OutboxFlushError):
-                    scope.set_tag("outbox.category", e.outbox.category)
-                    scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
-                    scope.set_context(
-                        "outbox",
-                        {
-                            "shard_identifier": e.outbox.shard_identifier,
-                            "object_identifier": e.outbox.object_identifier,
-                            "payload": e.outbox.payload,
-                        },
-                    )
-                sentry_sdk.capture_exception(e)
-                # In production, it's ok to just continue processing forward, but in tests we aim to surface
-                # problems aggressively.
-                if in_test_environment():
-                    raise
-    return processed_count
+        processed_count += 1
+        processed_messages += _drain_scheduled_shard(shard_outbox)
+    return processed_count, processed_messages
+
+
+def _drain_scheduled_shard(shard_outbox: OutboxBase) -> int:
+    try:
+        return shard_outbox.drain_shard(flush_all=True)
+    except Exception as e:
+        with sentry_sdk.isolation_scope() as scope:
+            if isinstance(e, OutboxFlushError):
+                scope.set_tag("outbox.category", e.outbox.category)
+                scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
+                scope.set_context(
+                    "outbox",
+                    {
+                        "shard_identifier": e.outbox.shard_identifier,
+                        "object_identifier": e.outbox.object_identifier,
+                        "payload": e.outbox.payload,
+                    },
+                )
+            sentry_sdk.capture_exception(e)
+            # In production, it's ok to just continue processing forward, but in tests we aim to surface
+            # problems aggressively.
+            if in_test_environment():
+                raise
+    return 0
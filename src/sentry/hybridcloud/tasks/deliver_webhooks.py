@@ -1,5 +1,10 @@
+import contextlib
 import datetime
 import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Generator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Never
 
@@ -14,6 +19,7 @@ from rest_framework import status
 from sentry import options
 from sentry.exceptions import RestrictedIPAddress
 from sentry.hybridcloud.models.webhookpayload import BACKOFF_INTERVAL, MAX_ATTEMPTS, WebhookPayload
+from sentry.net.http import KeepAliveSession
 from sentry.shared_integrations.exceptions import (
     ApiConflictError,
     ApiConnectionResetError,
@@ -22,7 +28,7 @@ from sentry.shared_integrations.exceptions import (
     ApiTimeoutError,
 )
 from sentry.silo.base import SiloMode
-from sentry.silo.client import RegionSiloClient, SiloClientError
+from sentry.silo.client import RegionSiloClient, SiloClientError, validate_region_ip_address
 from sentry.tasks.base import instrumented_task
 from sentry.types.region import get_region_by_name
 from sentry.utils import metrics
@@ -67,6 +73,166 @@ class DeliveryFailed(Exception):
     pass
 
 
+DESTINATION_BACKOFF_BASE = 5.0
+"""Seconds a destination is backed off for after its first failed delivery"""
+
+MAX_DESTINATION_BACKOFF = 300.0
+"""The longest a destination is backed off for, in seconds"""
+
+
+class DeliveryDestination:
+    """
+    Concurrency, rate and backoff state of the deliveries to a single provider's
+    webhook endpoint on a region silo.
+
+    Every consecutive failed delivery doubles the time the destination is backed
+    off for, a successful delivery resets it.
+    """
+
+    def __init__(self, region_name: str, provider: str, max_concurrency: int, max_rate: int):
+        self.region_name = region_name
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.max_rate = max_rate
+        self.in_flight = 0
+        self.failures = 0
+        self.backoff_until = 0.0
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._sent: deque[float] = deque()
+
+    @property
+    def metric_tags(self) -> dict[str, str]:
+        return {"destination_region": self.region_name, "provider": self.provider}
+
+    def backoff_remaining(self) -> float:
+        with self._lock:
+            return max(0.0, self.backoff_until - time.monotonic())
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.backoff_until = 0.0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            backoff = min(
+                DESTINATION_BACKOFF_BASE * 2 ** (self.failures - 1), MAX_DESTINATION_BACKOFF
+            )
+            self.backoff_until = time.monotonic() + backoff
+
+    @contextlib.contextmanager
+    def acquire(self) -> Generator[None]:
+        """
+        Blocks until a request can be sent to the destination without exceeding its
+        concurrency or rate limits.
+        """
+        with self._semaphore:
+            self._wait_for_rate_limit()
+            self._update_in_flight(1)
+            try:
+                yield
+            finally:
+                self._update_in_flight(-1)
+
+    def _update_in_flight(self, delta: int) -> None:
+        with self._lock:
+            self.in_flight += delta
+            in_flight = self.in_flight
+        metrics.gauge(
+            "hybridcloud.deliver_webhooks.destination.in_flight",
+            in_flight,
+            tags=self.metric_tags,
+        )
+
+    def _wait_for_rate_limit(self) -> None:
+        if self.max_rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and self._sent[0] <= now - 1:
+                    self._sent.popleft()
+                if len(self._sent) < self.max_rate:
+                    self._sent.append(now)
+                    return
+                delay = self._sent[0] + 1 - now
+            time.sleep(delay)
+
+
+class DeliveryEngine:
+    """
+    Delivers webhook payloads through a keep-alive session per region so that
+    connections are reused across deliveries, while limiting the concurrency and
+    request rate per destination and backing off of failing destinations. A
+    destination that slows down or fails only holds up its own mailboxes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sessions: dict[str, KeepAliveSession] = {}
+        self._destinations: dict[tuple[str, str], DeliveryDestination] = {}
+
+    def get_session(self, region_name: str) -> KeepAliveSession:
+        with self._lock:
+            session = self._sessions.get(region_name)
+            if session is None:
+                session = KeepAliveSession(is_ipaddress_permitted=validate_region_ip_address)
+                self._sessions[region_name] = session
+            return session
+
+    def get_destination(self, payload: WebhookPayload) -> DeliveryDestination:
+        region_name = payload.region_name
+        provider = payload.mailbox_name.split(":", 1)[0]
+        max_concurrency = max(
+            1, options.get("hybridcloud.webhookpayload.destination_max_concurrency")
+        )
+        max_rate = options.get("hybridcloud.webhookpayload.destination_max_rate")
+
+        with self._lock:
+            destination = self._destinations.get((region_name, provider))
+            # Limits are read from options, replace the destination when they change.
+            if (
+                destination is None
+                or destination.max_concurrency != max_concurrency
+                or destination.max_rate != max_rate
+            ):
+                destination = DeliveryDestination(region_name, provider, max_concurrency, max_rate)
+                self._destinations[(region_name, provider)] = destination
+            return destination
+
+    def deliver(self, payload: WebhookPayload) -> None:
+        destination = self.get_destination(payload)
+        with destination.acquire():
+            start = time.monotonic()
+            try:
+                perform_request(payload, session=self.get_session(payload.region_name))
+            except DeliveryFailed:
+                destination.record_failure()
+                raise
+            else:
+                destination.record_success()
+            finally:
+                metrics.distribution(
+                    "hybridcloud.deliver_webhooks.destination.latency",
+                    (time.monotonic() - start) * 1000,
+                    tags=destination.metric_tags,
+                    unit="millisecond",
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._destinations.clear()
+
+
+delivery_engine = DeliveryEngine()
+
+
 @instrumented_task(
     name="sentry.hybridcloud.tasks.deliver_webhooks.schedule_webhook_delivery",
     queue="webhook.control",
@@ -243,10 +409,31 @@ def drain_mailbox_parallel(payload_id: int) -> None:
             )
 
     worker_threads = options.get("hybridcloud.webhookpayload.worker_threads")
+    pooled_delivery = options.get("hybridcloud.webhookpayload.pooled_delivery")
     deadline = timezone.now() + BATCH_SCHEDULE_OFFSET
     request_failed = False
     delivered = 0
     while True:
+        # Yield the worker to other mailboxes while the destination is failing. The messages
+        # are left untouched, so no delivery attempts are spent on them.
+        if pooled_delivery:
+            destination = delivery_engine.get_destination(payload)
+            backoff_remaining = destination.backoff_remaining()
+            if backoff_remaining > 0:
+                logger.info(
+                    "deliver_webhook_parallel.destination_backoff",
+                    extra={
+                        "mailbox_name": payload.mailbox_name,
+                        "delivered": delivered,
+                        "backoff_remaining": backoff_remaining,
+                    },
+                )
+                metrics.incr(
+                    "hybridcloud.deliver_webhooks.delivery",
+                    tags={"outcome": "destination_backoff"},
+                )
+                break
+
         current_time = timezone.now()
         # We have run until the end of our batch schedule delay. Break the loop so this worker can take another
         # task.
@@ -272,7 +459,7 @@ def drain_mailbox_parallel(payload_id: int) -> None:
         # Use a threadpool to send requests concurrently
         with ThreadPoolExecutor(max_workers=worker_threads) as threadpool:
             futures = {
-                threadpool.submit(deliver_message_parallel, record)
+                threadpool.submit(deliver_message_parallel, record, pooled_delivery)
                 for record in query[:worker_threads]
             }
             for future in as_completed(futures):
@@ -334,9 +521,14 @@ def drain_mailbox_parallel(payload_id: int) -> None:
             return
 
 
-def deliver_message_parallel(payload: WebhookPayload) -> tuple[WebhookPayload, Exception | None]:
+def deliver_message_parallel(
+    payload: WebhookPayload, pooled_delivery: bool = False
+) -> tuple[WebhookPayload, Exception | None]:
     try:
-        perform_request(payload)
+        if pooled_delivery:
+            delivery_engine.deliver(payload)
+        else:
+            perform_request(payload)
         return (payload, None)
     except Exception as err:
         return (payload, err)
@@ -362,7 +554,7 @@ def deliver_message(payload: WebhookPayload) -> None:
     metrics.incr("hybridcloud.deliver_webhooks.delivery", tags={"outcome": "ok"})
 
 
-def perform_request(payload: WebhookPayload) -> None:
+def perform_request(payload: WebhookPayload, session: KeepAliveSession | None = None) -> None:
     logging_context: dict[str, str | int] = {
         "payload_id": payload.id,
         "mailbox_name": payload.mailbox_name,
@@ -371,7 +563,7 @@ def perform_request(payload: WebhookPayload) -> None:
     region = get_region_by_name(name=payload.region_name)
 
     try:
-        client = RegionSiloClient(region=region)
+        client = RegionSiloClient(region=region, session=session)
         with metrics.timer(
             "hybridcloud.deliver_webhooks.send_request",
             tags={"destination_region": region.name},
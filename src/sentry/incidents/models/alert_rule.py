@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import logging
+import uuid
 from collections.abc import Callable, Collection, Iterable
 from enum import Enum, IntEnum, StrEnum
 from typing import TYPE_CHECKING, Any, ClassVar, Self
@@ -619,6 +620,31 @@ class AlertRuleActivity(Model):
         db_table = "sentry_alertruleactivity"
 
 
+ALERT_RULE_STATE_VERSION_KEY = "alert_rule_state_version:%s:%s"
+ALERT_RULE_STATE_VERSION_TTL = 60 * 60 * 24
+
+
+def build_alert_rule_state_version_key(model_name: str, instance_id: int) -> str:
+    return ALERT_RULE_STATE_VERSION_KEY % (model_name, instance_id)
+
+
+def bump_alert_rule_state_version(
+    instance: QuerySubscription | AlertRule | AlertRuleTrigger, **kwargs: Any
+) -> None:
+    """
+    Replaces the version token of a subscription or alert rule. Caches of the
+    alert rule and triggers of a subscription, such as the one used by the
+    subscription processor, compare these tokens to detect stale entries.
+    """
+    if isinstance(instance, AlertRuleTrigger):
+        key = build_alert_rule_state_version_key("alert_rule", instance.alert_rule_id)
+    elif isinstance(instance, AlertRule):
+        key = build_alert_rule_state_version_key("alert_rule", instance.id)
+    else:
+        key = build_alert_rule_state_version_key("subscription", instance.id)
+    cache.set(key, uuid.uuid4().hex, ALERT_RULE_STATE_VERSION_TTL)
+
+
 pre_delete.connect(AlertRuleManager.dual_delete_alert_rule, sender=AlertRule)
 
 post_delete.connect(AlertRuleManager.clear_subscription_cache, sender=QuerySubscription)
@@ -631,3 +657,10 @@ post_delete.connect(AlertRuleTriggerManager.clear_alert_rule_trigger_cache, send
 post_save.connect(AlertRuleTriggerManager.clear_alert_rule_trigger_cache, sender=AlertRule)
 post_save.connect(AlertRuleTriggerManager.clear_trigger_cache, sender=AlertRuleTrigger)
 post_delete.connect(AlertRuleTriggerManager.clear_trigger_cache, sender=AlertRuleTrigger)
+
+post_save.connect(bump_alert_rule_state_version, sender=QuerySubscription)
+post_delete.connect(bump_alert_rule_state_version, sender=QuerySubscription)
+post_save.connect(bump_alert_rule_state_version, sender=AlertRule)
+post_delete.connect(bump_alert_rule_state_version, sender=AlertRule)
+post_save.connect(bump_alert_rule_state_version, sender=AlertRuleTrigger)
+post_delete.connect(bump_alert_rule_state_version, sender=AlertRuleTrigger)
@@ -2,18 +2,22 @@ from __future__ import annotations
 
 import logging
 import operator
+import threading
+import time
 from collections.abc import Sequence
-from copy import deepcopy
+from copy import copy, deepcopy
 from datetime import datetime, timedelta
-from typing import TypeVar, cast
+from typing import Any, TypeVar, cast
 
+from cachetools import LRUCache
 from django.conf import settings
+from django.core.cache import cache
 from django.db import router, transaction
 from django.utils import timezone
 from sentry_redis_tools.retrying_cluster import RetryingRedisCluster
 from snuba_sdk import Column, Condition, Limit, Op
 
-from sentry import features
+from sentry import features, options
 from sentry.incidents.logic import (
     CRITICAL_TRIGGER_LABEL,
     WARNING_TRIGGER_LABEL,
@@ -28,6 +32,7 @@ from sentry.incidents.models.alert_rule import (
     AlertRuleThresholdType,
     AlertRuleTrigger,
     AlertRuleTriggerActionMethod,
+    build_alert_rule_state_version_key,
 )
 from sentry.incidents.models.incident import (
     Incident,
@@ -81,6 +86,121 @@ CRASH_RATE_ALERT_MINIMUM_THRESHOLD: int | None = None
 
 T = TypeVar("T")
 
+AlertRuleStats = tuple[datetime, dict[int, int], dict[int, int]]
+# Expiry, versions of the subscription and alert rule, alert rule and triggers.
+AlertRuleStateEntry = tuple[float, tuple[Any, Any], AlertRule, list[AlertRuleTrigger]]
+
+
+class AlertRuleStateCache:
+    """
+    Per-process cache of the alert rule and triggers of each subscription, so
+    that they do not need to be loaded for every subscription update.
+
+    Entries are validated against version tokens which are replaced whenever
+    the subscription, its alert rule or the triggers of the alert rule are
+    saved or deleted (see `bump_alert_rule_state_version`). Validating the
+    entries of a batch of subscriptions takes a single cache round trip.
+    Entries also expire after `ttl` seconds, in case a version token was
+    evicted from the cache.
+    """
+
+    def __init__(self, max_size: int = 50_000, ttl: int = 300) -> None:
+        self.ttl = ttl
+        self._entries: LRUCache[int, AlertRuleStateEntry] = LRUCache(maxsize=max_size)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _version_keys(subscription_id: int, alert_rule_id: int) -> tuple[str, str]:
+        return (
+            build_alert_rule_state_version_key("subscription", subscription_id),
+            build_alert_rule_state_version_key("alert_rule", alert_rule_id),
+        )
+
+    def get_many(
+        self, subscriptions: Sequence[QuerySubscription]
+    ) -> dict[int, tuple[AlertRule, list[AlertRuleTrigger]]]:
+        """
+        Returns the alert rule and triggers of each subscription, keyed by
+        subscription id. Subscriptions without an alert rule are omitted. The
+        returned alert rules are copies which may be modified by the caller.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entries = {
+                subscription.id: entry
+                for subscription in subscriptions
+                if (entry := self._entries.get(subscription.id)) is not None and entry[0] > now
+            }
+
+        version_keys = {
+            subscription_id: self._version_keys(subscription_id, entry[2].id)
+            for subscription_id, entry in entries.items()
+        }
+        versions = cache.get_many([key for keys in version_keys.values() for key in keys])
+
+        result = {}
+        for subscription in subscriptions:
+            entry = entries.get(subscription.id)
+            if entry is not None and entry[1] == tuple(
+                versions.get(key) for key in version_keys[subscription.id]
+            ):
+                metrics.incr("incidents.subscription_processor.state_cache.hit")
+                alert_rule, triggers = entry[2], entry[3]
+            else:
+                metrics.incr("incidents.subscription_processor.state_cache.miss")
+                loaded = self._load(subscription)
+                if loaded is None:
+                    continue
+                alert_rule, triggers = loaded
+
+            result[subscription.id] = (self._copy_alert_rule(alert_rule, subscription), triggers)
+
+        return result
+
+    def _load(
+        self, subscription: QuerySubscription
+    ) -> tuple[AlertRule, list[AlertRuleTrigger]] | None:
+        # The version of the subscription is read before loading the alert
+        # rule, so that changes made while loading are not cached.
+        subscription_version = cache.get(
+            build_alert_rule_state_version_key("subscription", subscription.id)
+        )
+        try:
+            alert_rule = AlertRule.objects.get_for_subscription(subscription)
+        except AlertRule.DoesNotExist:
+            return None
+
+        alert_rule_version = cache.get(
+            build_alert_rule_state_version_key("alert_rule", alert_rule.id)
+        )
+        triggers = AlertRuleTrigger.objects.get_for_alert_rule(alert_rule)
+        triggers.sort(key=lambda trigger: trigger.alert_threshold)
+
+        with self._lock:
+            self._entries[subscription.id] = (
+                time.monotonic() + self.ttl,
+                (subscription_version, alert_rule_version),
+                alert_rule,
+                triggers,
+            )
+        return alert_rule, triggers
+
+    @staticmethod
+    def _copy_alert_rule(alert_rule: AlertRule, subscription: QuerySubscription) -> AlertRule:
+        alert_rule = copy(alert_rule)
+        # Prefer the snuba query of the subscription, it is loaded either way
+        # and is at least as recent as the cached alert rule.
+        if alert_rule.snuba_query_id == subscription.snuba_query_id:
+            alert_rule.snuba_query = subscription.snuba_query
+        return alert_rule
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+alert_rule_state_cache = AlertRuleStateCache()
+
 
 class SubscriptionProcessor:
     """
@@ -100,21 +220,40 @@ class SubscriptionProcessor:
         AlertRuleThresholdType.BELOW: (operator.lt, operator.gt),
     }
 
-    def __init__(self, subscription: QuerySubscription) -> None:
+    def __init__(
+        self,
+        subscription: QuerySubscription,
+        alert_rule_state: tuple[AlertRule, list[AlertRuleTrigger]] | None = None,
+        stats: AlertRuleStats | None = None,
+        stats_pipeline: Any | None = None,
+    ) -> None:
+        """
+        The alert rule, triggers and stats are loaded unless provided. When a
+        `stats_pipeline` is provided, stat updates are queued into it rather
+        than written immediately. See `process_subscription_updates`.
+        """
         self.subscription = subscription
-        try:
-            self.alert_rule = AlertRule.objects.get_for_subscription(subscription)
-        except AlertRule.DoesNotExist:
-            return
+        self.stats_pipeline = stats_pipeline
 
-        self.triggers = AlertRuleTrigger.objects.get_for_alert_rule(self.alert_rule)
-        self.triggers.sort(key=lambda trigger: trigger.alert_threshold)
+        if alert_rule_state is not None:
+            self.alert_rule, self.triggers = alert_rule_state
+        else:
+            try:
+                self.alert_rule = AlertRule.objects.get_for_subscription(subscription)
+            except AlertRule.DoesNotExist:
+                return
+
+            self.triggers = AlertRuleTrigger.objects.get_for_alert_rule(self.alert_rule)
+            self.triggers.sort(key=lambda trigger: trigger.alert_threshold)
+
+        if stats is None:
+            stats = get_alert_rule_stats(self.alert_rule, self.subscription, self.triggers)
 
         (
             self.last_update,
             self.trigger_alert_counts,
             self.trigger_resolve_counts,
-        ) = get_alert_rule_stats(self.alert_rule, self.subscription, self.triggers)
+        ) = stats
         self.orig_trigger_alert_counts = deepcopy(self.trigger_alert_counts)
         self.orig_trigger_resolve_counts = deepcopy(self.trigger_resolve_counts)
 
@@ -840,8 +979,14 @@ class SubscriptionProcessor:
             self.last_update,
             updated_trigger_alert_counts,
             updated_trigger_resolve_counts,
+            pipeline=self.stats_pipeline,
         )
 
+        # The stored stats now match, so that further updates processed by
+        # this processor only write what they change.
+        self.orig_trigger_alert_counts = deepcopy(self.trigger_alert_counts)
+        self.orig_trigger_resolve_counts = deepcopy(self.trigger_resolve_counts)
+
 
 def build_alert_rule_stat_keys(alert_rule: AlertRule, subscription: QuerySubscription) -> list[str]:
     """
@@ -903,6 +1048,35 @@ def get_alert_rule_stats(
     alert_rule_keys = build_alert_rule_stat_keys(alert_rule, subscription)
     trigger_keys = build_trigger_stat_keys(alert_rule, subscription, triggers)
     results = get_redis_client().mget(alert_rule_keys + trigger_keys)
+    return _parse_alert_rule_stats(triggers, results)
+
+
+def get_alert_rule_stats_many(
+    entries: Sequence[tuple[AlertRule, QuerySubscription, list[AlertRuleTrigger]]],
+) -> list[AlertRuleStats]:
+    """
+    Fetches the stats of many alert rules and subscriptions using a single
+    Redis pipeline. See `get_alert_rule_stats`.
+    """
+    if not entries:
+        return []
+
+    pipeline = get_redis_client().pipeline()
+    for alert_rule, subscription, triggers in entries:
+        pipeline.mget(
+            build_alert_rule_stat_keys(alert_rule, subscription)
+            + build_trigger_stat_keys(alert_rule, subscription, triggers)
+        )
+
+    return [
+        _parse_alert_rule_stats(triggers, results)
+        for (_, _, triggers), results in zip(entries, pipeline.execute())
+    ]
+
+
+def _parse_alert_rule_stats(
+    triggers: list[AlertRuleTrigger], results: Sequence[Any]
+) -> AlertRuleStats:
     results = tuple(0 if result is None else int(result) for result in results)
     last_update = to_datetime(results[0])
     trigger_results = results[1:]
@@ -924,11 +1098,17 @@ def update_alert_rule_stats(
     last_update: datetime,
     alert_counts: dict[int, int],
     resolve_counts: dict[int, int],
+    pipeline: Any | None = None,
 ) -> None:
     """
     Updates stats about the alert rule, subscription and triggers if they've changed.
+
+    When a pipeline is provided the updates are queued into it, it is up to the
+    caller to execute it.
     """
-    pipeline = get_redis_client().pipeline()
+    execute = pipeline is None
+    if pipeline is None:
+        pipeline = get_redis_client().pipeline()
 
     counts_with_stat_keys = zip(ALERT_RULE_TRIGGER_STAT_KEYS, (alert_counts, resolve_counts))
     for stat_key, trigger_counts in counts_with_stat_keys:
@@ -943,7 +1123,79 @@ def update_alert_rule_stats(
 
     last_update_key = build_alert_rule_stat_keys(alert_rule, subscription)[0]
     pipeline.set(last_update_key, int(last_update.timestamp()), ex=REDIS_TTL)
-    pipeline.execute()
+    if execute:
+        pipeline.execute()
+
+
+def process_subscription_updates(
+    updates: Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]],
+) -> None:
+    """
+    Processes a batch of subscription updates. Updates of the same subscription
+    are processed in order by a single `SubscriptionProcessor`.
+
+    The alert rules and triggers of the subscriptions are served from the
+    per-process `alert_rule_state_cache` when enabled, and the alert rule stats
+    of all subscriptions are read with a single Redis pipeline and written with
+    another once every update has been processed.
+    """
+    updates_by_subscription: dict[int, list[QuerySubscriptionUpdate]] = {}
+    subscriptions: dict[int, QuerySubscription] = {}
+    for subscription_update, subscription in updates:
+        updates_by_subscription.setdefault(subscription.id, []).append(subscription_update)
+        subscriptions[subscription.id] = subscription
+
+    with metrics.timer("incidents.subscription_processor.batch.load_state"):
+        if options.get("incidents.subscription-processor.state-cache.enabled"):
+            alert_rule_states = alert_rule_state_cache.get_many(list(subscriptions.values()))
+        else:
+            alert_rule_states = {}
+            for subscription in subscriptions.values():
+                try:
+                    alert_rule = AlertRule.objects.get_for_subscription(subscription)
+                except AlertRule.DoesNotExist:
+                    continue
+                triggers = AlertRuleTrigger.objects.get_for_alert_rule(alert_rule)
+                triggers.sort(key=lambda trigger: trigger.alert_threshold)
+                alert_rule_states[subscription.id] = (alert_rule, triggers)
+
+        stats = dict(
+            zip(
+                alert_rule_states.keys(),
+                get_alert_rule_stats_many(
+                    [
+                        (alert_rule, subscriptions[subscription_id], triggers)
+                        for subscription_id, (alert_rule, triggers) in alert_rule_states.items()
+                    ]
+                ),
+            )
+        )
+
+    stats_pipeline = get_redis_client().pipeline()
+
+    for subscription_id, subscription_updates in updates_by_subscription.items():
+        processor = SubscriptionProcessor(
+            subscriptions[subscription_id],
+            alert_rule_state=alert_rule_states.get(subscription_id),
+            stats=stats.get(subscription_id),
+            stats_pipeline=stats_pipeline,
+        )
+        # Subscriptions without an alert rule load nothing, the processor
+        # deletes them when processing their first update.
+        for subscription_update in subscription_updates:
+            with metrics.timer("incidents.subscription_procesor.process_update"):
+                try:
+                    processor.process_update(subscription_update)
+                except Exception:
+                    logger.exception(
+                        "Failed to process subscription update",
+                        extra={"subscription_id": subscription_id},
+                    )
+
+    with metrics.timer("incidents.subscription_processor.batch.update_stats"):
+        stats_pipeline.execute()
+
+    metrics.distribution("incidents.subscription_processor.batch.size", len(updates))
 
 
 def get_redis_client() -> RetryingRedisCluster:
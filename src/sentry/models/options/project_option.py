@@ -143,6 +143,34 @@ class ProjectOptionManager(OptionManager["ProjectOption"]):
 
         return self._option_cache.get(cache_key, {})
 
+    def prefetch_all_values(self, project_ids: Sequence[int]) -> None:
+        """
+        Loads the options of many projects into the local cache at once, so that reading
+        them afterwards does not query the cache or database per project.
+        """
+        cache_keys = {
+            self._make_key(project_id): project_id
+            for project_id in project_ids
+            if self._make_key(project_id) not in self._option_cache
+        }
+        if not cache_keys:
+            return
+
+        cached = cache.get_many(cache_keys.keys())
+        missing: dict[int, dict[str, Any]] = {
+            project_id: {}
+            for cache_key, project_id in cache_keys.items()
+            if cached.get(cache_key) is None
+        }
+        if missing:
+            for option in self.filter(project_id__in=missing.keys()):
+                missing[option.project_id][option.key] = option.value
+            cache.set_many({self._make_key(project_id): v for project_id, v in missing.items()})
+
+        for cache_key, project_id in cache_keys.items():
+            result = cached.get(cache_key)
+            self._option_cache[cache_key] = missing[project_id] if result is None else result
+
     def reload_cache(self, project_id: int, update_reason: str) -> Mapping[str, Any]:
         from sentry.tasks.relay import schedule_invalidate_project_config
 
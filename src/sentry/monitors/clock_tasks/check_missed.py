@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 
 from arroyo.backends.kafka import KafkaPayload
-from django.db.models import Q
+from django.db import router, transaction
+from django.db.models import Case, DateTimeField, Q, Value, When
 from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import MarkMissing
 
 from sentry.constants import ObjectStatus
+from sentry.monitors.logic.incidents import try_incident_threshold
 from sentry.monitors.logic.mark_failed import mark_failed
 from sentry.monitors.models import (
     CheckInStatus,
@@ -18,6 +21,7 @@ from sentry.monitors.models import (
 )
 from sentry.monitors.schedule import get_prev_schedule
 from sentry.utils import metrics
+from sentry.utils.iterators import chunked
 
 from .producer import MONITORS_CLOCK_TASKS_CODEC, produce_task
 
@@ -30,6 +34,10 @@ logger = logging.getLogger(__name__)
 # monitors the larger the number of checkins to check will exist.
 MONITOR_LIMIT = 10_000
 
+# The number of monitor environments marked as missed per query when marking
+# environments missed in bulk.
+MARK_MISSING_CHUNK_SIZE = 500
+
 # re-use the monitor exclusion query node across dispatch_check_missing and
 # mark_environment_missing.
 IGNORE_MONITORS = ~Q(
@@ -168,3 +176,100 @@ def mark_environment_missing(monitor_environment_id: int, ts: datetime):
         received=ts,
         clock_tick=ts,
     )
+
+
+def mark_environments_missing(monitor_environment_ids: Sequence[int], ts: datetime) -> None:
+    """
+    Set-based variant of `mark_environment_missing`. The monitor environments
+    are processed in chunks, each chunk is marked as missed with a single
+    UPDATE and its missed check-ins are created with a single INSERT. Incident
+    thresholds are still evaluated per monitor environment.
+    """
+    for chunk in chunked(monitor_environment_ids, MARK_MISSING_CHUNK_SIZE):
+        _mark_environments_missing_chunk(chunk, ts)
+
+
+def _case_by_id(values: dict[int, datetime]) -> Case:
+    return Case(
+        *(When(id=id, then=Value(value)) for id, value in values.items()),
+        output_field=DateTimeField(),
+    )
+
+
+def _mark_environments_missing_chunk(monitor_environment_ids: Sequence[int], ts: datetime) -> None:
+    monitor_environments = {
+        monitor_environment.id: monitor_environment
+        for monitor_environment in MonitorEnvironment.objects.select_related("monitor").filter(
+            IGNORE_MONITORS,
+            id__in=monitor_environment_ids,
+            # See mark_environment_missing
+            next_checkin_latest__lte=ts,
+        )
+    }
+    if not monitor_environments:
+        return
+
+    # See mark_environment_missing for details on how the reference time of
+    # the failure is computed.
+    next_checkins: dict[int, tuple[datetime, datetime]] = {}
+    for monitor_environment in monitor_environments.values():
+        monitor = monitor_environment.monitor
+        assert monitor_environment.next_checkin is not None
+
+        most_recent_expected_ts = get_prev_schedule(
+            monitor_environment.next_checkin.astimezone(monitor.timezone),
+            ts.astimezone(monitor.timezone),
+            monitor.schedule,
+        )
+        next_checkins[monitor_environment.id] = (
+            monitor.get_next_expected_checkin(most_recent_expected_ts),
+            monitor.get_next_expected_checkin_latest(most_recent_expected_ts),
+        )
+
+    with transaction.atomic(router.db_for_write(MonitorCheckIn)):
+        # Move the next check-in forward for all missed environments. This
+        # mirrors the update done by `mark_failed`, the last_checkin of a
+        # missed environment is never moved forward. Any check-in received
+        # since we selected the environments will have moved the
+        # next_checkin_latest past the tick, those environments are skipped.
+        marked = MonitorEnvironment.objects.filter(
+            id__in=monitor_environments.keys(),
+            next_checkin_latest__lte=ts,
+        ).update_with_returning(
+            ["id"],
+            next_checkin=_case_by_id({id: times[0] for id, times in next_checkins.items()}),
+            next_checkin_latest=_case_by_id({id: times[1] for id, times in next_checkins.items()}),
+        )
+        marked_ids = sorted(row[0] for row in marked)
+
+        # See mark_environment_missing for details on the missed check-in
+        checkins = MonitorCheckIn.objects.bulk_create(
+            [
+                MonitorCheckIn(
+                    project_id=monitor_environments[id].monitor.project_id,
+                    monitor=monitor_environments[id].monitor,
+                    monitor_environment=monitor_environments[id],
+                    status=CheckInStatus.MISSED,
+                    date_added=monitor_environments[id].next_checkin,
+                    date_clock=ts,
+                    expected_time=monitor_environments[id].next_checkin,
+                    monitor_config=monitor_environments[id].monitor.get_validated_config(),
+                )
+                for id in marked_ids
+            ]
+        )
+
+    metrics.incr("sentry.monitors.tasks.check_missing.marked", amount=len(marked_ids))
+
+    for checkin in checkins:
+        monitor_environment = checkin.monitor_environment
+        monitor_environment.next_checkin, monitor_environment.next_checkin_latest = next_checkins[
+            monitor_environment.id
+        ]
+        try:
+            try_incident_threshold(checkin, received=ts, clock_tick=ts)
+        except Exception:
+            logger.exception(
+                "mark_missing.incident_threshold_failed",
+                extra={"monitor_environment_id": monitor_environment.id},
+            )
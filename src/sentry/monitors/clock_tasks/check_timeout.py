@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 
 from arroyo.backends.kafka import KafkaPayload
+from django.db.models import Max
 from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import MarkTimeout
 
 from sentry.monitors.logic.mark_failed import mark_failed
 from sentry.monitors.models import CheckInStatus, MonitorCheckIn
 from sentry.monitors.schedule import get_prev_schedule
 from sentry.utils import metrics
+from sentry.utils.iterators import chunked
 
 from .producer import MONITORS_CLOCK_TASKS_CODEC, produce_task
 
@@ -21,6 +24,10 @@ logger = logging.getLogger(__name__)
 # monitors the larger the number of checkins to check will exist.
 CHECKINS_LIMIT = 10_000
 
+# The number of check-ins marked as timed out per query when marking check-ins
+# timed out in bulk.
+MARK_TIMEOUT_CHUNK_SIZE = 500
+
 
 def dispatch_check_timeout(ts: datetime):
     """
@@ -124,3 +131,69 @@ def mark_checkin_timeout(checkin_id: int, ts: datetime) -> None:
             received=ts,
             clock_tick=ts,
         )
+
+
+def mark_checkins_timeout(checkin_ids: Sequence[int], ts: datetime) -> None:
+    """
+    Set-based variant of `mark_checkin_timeout`. The check-ins are processed
+    in chunks, each chunk is marked as timed out with a single UPDATE and
+    newer results are looked up with a single query. Monitor environments
+    without a newer result are then marked as failed individually.
+    """
+    for chunk in chunked(checkin_ids, MARK_TIMEOUT_CHUNK_SIZE):
+        _mark_checkins_timeout_chunk(chunk, ts)
+
+
+def _mark_checkins_timeout_chunk(checkin_ids: Sequence[int], ts: datetime) -> None:
+    marked = (
+        MonitorCheckIn.objects.filter(id__in=checkin_ids)
+        .exclude(status=CheckInStatus.TIMEOUT)
+        .update_with_returning(["id"], status=CheckInStatus.TIMEOUT)
+    )
+    if not marked:
+        return
+
+    metrics.incr("sentry.monitors.tasks.check_timeout.marked", amount=len(marked))
+
+    checkins = list(
+        MonitorCheckIn.objects.select_related(
+            "monitor_environment", "monitor_environment__monitor"
+        ).filter(id__in=[row[0] for row in marked])
+    )
+
+    # The most recent result of each monitor environment, used to determine if
+    # a newer check-in was responsible for the state change.
+    latest_results = dict(
+        MonitorCheckIn.objects.filter(
+            monitor_environment_id__in={checkin.monitor_environment_id for checkin in checkins},
+            date_added__gt=min(checkin.date_added for checkin in checkins),
+            status__in=[CheckInStatus.OK, CheckInStatus.ERROR],
+        )
+        .values("monitor_environment_id")
+        .annotate(latest=Max("date_added"))
+        .values_list("monitor_environment_id", "latest")
+    )
+
+    for checkin in sorted(checkins, key=lambda checkin: checkin.date_added):
+        latest_result = latest_results.get(checkin.monitor_environment_id)
+        if latest_result is not None and latest_result > checkin.date_added:
+            continue
+
+        monitor = checkin.monitor_environment.monitor
+        checkin.status = CheckInStatus.TIMEOUT
+
+        # See mark_checkin_timeout
+        most_recent_expected_ts = get_prev_schedule(
+            checkin.date_added.astimezone(monitor.timezone),
+            ts.astimezone(monitor.timezone),
+            monitor.schedule,
+        )
+        try:
+            mark_failed(
+                checkin,
+                failed_at=most_recent_expected_ts,
+                received=ts,
+                clock_tick=ts,
+            )
+        except Exception:
+            logger.exception("checkin_timeout.mark_failed_failed", extra={"checkin_id": checkin.id})
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import TypeGuard
+from typing import Literal, TypeGuard
 
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.processing.strategies.abstract import ProcessingStrategy, ProcessingStrategyFactory
+from arroyo.processing.strategies.batching import BatchStep, ValuesBatch
 from arroyo.processing.strategies.commit import CommitOffsets
 from arroyo.processing.strategies.run_task import RunTask
 from arroyo.types import BrokerValue, Commit, FilteredPayload, Message, Partition
@@ -19,9 +22,13 @@ from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import (
 )
 
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
-from sentry.monitors.clock_tasks.check_missed import mark_environment_missing
-from sentry.monitors.clock_tasks.check_timeout import mark_checkin_timeout
+from sentry.monitors.clock_tasks.check_missed import (
+    mark_environment_missing,
+    mark_environments_missing,
+)
+from sentry.monitors.clock_tasks.check_timeout import mark_checkin_timeout, mark_checkins_timeout
 from sentry.monitors.clock_tasks.mark_unknown import mark_checkin_unknown
+from sentry.utils import metrics
 
 MONITORS_CLOCK_TASKS_CODEC: Codec[MonitorsClockTasks] = get_topic_codec(Topic.MONITORS_CLOCK_TASKS)
 
@@ -65,15 +72,123 @@ def process_clock_task(message: Message[KafkaPayload | FilteredPayload]):
         logger.exception("Failed to process clock tick task")
 
 
+@dataclass
+class _TickTasks:
+    """
+    The tasks of a batch dispatched for a single clock tick.
+    """
+
+    missing_environment_ids: list[int] = field(default_factory=list)
+    timeout_checkin_ids: list[int] = field(default_factory=list)
+    unknown_checkin_ids: list[int] = field(default_factory=list)
+
+
+def process_clock_task_batch(message: Message[ValuesBatch[KafkaPayload]]) -> None:
+    """
+    Receives batches of clock tasks and processes the tasks of each clock tick
+    as sets, rather than one at a time.
+
+    Tasks for a monitor environment are always produced into the same
+    partition, ordered by their clock tick. Processing the ticks of a batch in
+    order thus preserves the order of tasks for every monitor environment.
+    """
+    batch = message.payload
+    tasks_by_tick: dict[datetime, _TickTasks] = defaultdict(_TickTasks)
+
+    for item in batch:
+        try:
+            wrapper = MONITORS_CLOCK_TASKS_CODEC.decode(item.payload.value)
+        except Exception:
+            logger.exception("Failed to unpack clock tick task")
+            continue
+
+        tasks = tasks_by_tick[datetime.fromtimestamp(wrapper["ts"], tz=timezone.utc)]
+
+        if is_mark_missing(wrapper):
+            tasks.missing_environment_ids.append(int(wrapper["monitor_environment_id"]))
+        elif is_mark_timeout(wrapper):
+            tasks.timeout_checkin_ids.append(int(wrapper["checkin_id"]))
+        elif is_mark_unknown(wrapper):
+            tasks.unknown_checkin_ids.append(int(wrapper["checkin_id"]))
+        else:
+            logger.error("Unsupported clock-tick task type: %s", wrapper["type"])
+
+    metrics.gauge("monitors.clock_tasks.batch_size", len(batch))
+    metrics.gauge("monitors.clock_tasks.batch_ticks", len(tasks_by_tick))
+
+    with metrics.timer("monitors.clock_tasks.batch.duration"):
+        for ts in sorted(tasks_by_tick):
+            tasks = tasks_by_tick[ts]
+
+            # Tasks are processed in the order they are dispatched for a tick
+            if tasks.missing_environment_ids:
+                try:
+                    mark_environments_missing(tasks.missing_environment_ids, ts)
+                except Exception:
+                    logger.exception("Failed to process clock tick missed tasks")
+
+            if tasks.timeout_checkin_ids:
+                try:
+                    mark_checkins_timeout(tasks.timeout_checkin_ids, ts)
+                except Exception:
+                    logger.exception("Failed to process clock tick timeout tasks")
+
+            for checkin_id in tasks.unknown_checkin_ids:
+                try:
+                    mark_checkin_unknown(checkin_id, ts)
+                except Exception:
+                    logger.exception("Failed to process clock tick task")
+
+
 class MonitorClockTasksStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
-    def __init__(self) -> None:
-        pass
+    batched = False
+    """
+    Does the consumer process the tasks of each clock tick as sets?
+    """
+
+    max_batch_size = 1000
+    """
+    How many tasks will be batched at once when in batched mode.
+    """
+
+    max_batch_time = 1
+    """
+    The maximum time in seconds to accumulate a batch of tasks.
+    """
+
+    def __init__(
+        self,
+        mode: Literal["serial", "batched"] | None = None,
+        max_batch_size: int | None = None,
+        max_batch_time: int | None = None,
+    ) -> None:
+        if mode == "batched":
+            self.batched = True
+
+        if max_batch_size is not None:
+            self.max_batch_size = max_batch_size
+        if max_batch_time is not None:
+            self.max_batch_time = max_batch_time
+
+    def create_batched_worker(self, commit: Commit) -> ProcessingStrategy[KafkaPayload]:
+        batch_processor = RunTask(
+            function=process_clock_task_batch,
+            next_step=CommitOffsets(commit),
+        )
+        return BatchStep(
+            max_batch_size=self.max_batch_size,
+            max_batch_time=self.max_batch_time,
+            next_step=batch_processor,
+        )
 
     def create_with_partitions(
         self,
         commit: Commit,
         partitions: Mapping[Partition, int],
     ) -> ProcessingStrategy[KafkaPayload]:
+        if self.batched:
+            return self.create_batched_worker(commit)
+
         # XXX(epurkihser): We're going to want to add some form of parallelism
         # here, but we'll need to be careful that we keep tasks grouped by
         # their partitions.
@@ -3,12 +3,14 @@ from __future__ import annotations
 import logging
 import uuid
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Callable, Generator, Mapping
 from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
 from copy import deepcopy
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from functools import partial
-from typing import Any, Literal, NotRequired, TypedDict
+from typing import Any, Literal, NamedTuple, NotRequired, TypedDict
 
 import sentry_sdk
 from arroyo.backends.kafka.consumer import KafkaPayload
@@ -17,16 +19,17 @@ from arroyo.processing.strategies.batching import BatchStep, ValuesBatch
 from arroyo.processing.strategies.commit import CommitOffsets
 from arroyo.processing.strategies.run_task import RunTask
 from arroyo.types import BrokerValue, Commit, FilteredPayload, Message, Partition
-from django.db import router, transaction
+from django.db import connections, router, transaction
 from sentry_kafka_schemas.codecs import Codec
 from sentry_kafka_schemas.schema_types.ingest_monitors_v1 import IngestMonitorMessage
 from sentry_sdk.tracing import Span, Transaction
 
-from sentry import quotas, ratelimits
+from sentry import options, quotas, ratelimits
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
 from sentry.constants import DataCategory, ObjectStatus
 from sentry.db.postgres.transactions import in_test_hide_transaction_boundary
 from sentry.killswitches import killswitch_matches_context
+from sentry.models.environment import Environment
 from sentry.models.project import Project
 from sentry.monitors.clock_dispatch import try_monitor_clock_tick
 from sentry.monitors.constants import PermitCheckInStatus
@@ -40,6 +43,7 @@ from sentry.monitors.models import (
     MonitorEnvironmentLimitsExceeded,
     MonitorEnvironmentValidationFailed,
     MonitorLimitsExceeded,
+    MonitorStatus,
     MonitorType,
 )
 from sentry.monitors.processing_errors.errors import (
@@ -91,15 +95,18 @@ def _ensure_monitor_with_config(
     project: Project,
     monitor_slug: str,
     config: dict[str, Any] | None,
+    prefetched_monitor: Monitor | None = None,
 ) -> Monitor | None:
-    try:
-        monitor = Monitor.objects.get(
-            slug=monitor_slug,
-            project_id=project.id,
-            organization_id=project.organization_id,
-        )
-    except Monitor.DoesNotExist:
-        monitor = None
+    monitor = prefetched_monitor
+    if monitor is None:
+        try:
+            monitor = Monitor.objects.get(
+                slug=monitor_slug,
+                project_id=project.id,
+                organization_id=project.organization_id,
+            )
+        except Monitor.DoesNotExist:
+            monitor = None
 
     if not config:
         return monitor
@@ -218,6 +225,41 @@ def check_ratelimit(metric_kwargs: dict[str, str], item: CheckinItem) -> bool:
     return is_blocked
 
 
+class _PendingCheckin(NamedTuple):
+    item: CheckinItem
+    project: Project
+    check_in: MonitorCheckIn
+    start_time: datetime
+    metric_kwargs: dict[str, str]
+
+
+@dataclass
+class CheckinGroupState:
+    """
+    State shared between the check-ins of a single check-in group (see
+    `CheckinItem.processing_key`) when the group is processed in bulk.
+    """
+
+    monitor_environment: MonitorEnvironment | None = None
+    """
+    The prefetched monitor environment (and monitor) of the group. This is
+    cleared once a check-in of the group is stored individually, since doing
+    so may update the monitor environment in ways not reflected here.
+    """
+
+    existing_guids: frozenset[uuid.UUID] = frozenset()
+    """
+    GUIDs of check-ins in the batch which already exist. Shared by all groups
+    of the batch.
+    """
+
+    pending: dict[uuid.UUID, _PendingCheckin] = field(default_factory=dict)
+    """
+    A run of consecutive OK check-ins which have not been stored yet, keyed by
+    their GUID.
+    """
+
+
 class _CheckinUpdateKwargs(TypedDict):
     status: NotRequired[CheckInStatus]
     duration: int | None
@@ -414,7 +456,218 @@ def update_existing_check_in(
     existing_check_in.update(**updated_checkin)
 
 
-def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
+def _defer_checkin(
+    group_state: CheckinGroupState,
+    item: CheckinItem,
+    project: Project,
+    monitor_environment: MonitorEnvironment,
+    guid: uuid.UUID,
+    status: int,
+    start_time: datetime,
+    duration: int | None,
+    trace_id: str | None,
+    metric_kwargs: dict[str, str],
+) -> None:
+    """
+    Prepare a new OK check-in to be stored with the rest of its run by
+    `flush_pending_checkins`. The prefetched monitor environment is updated in
+    memory the same way `mark_ok` would, so that the following check-ins of the
+    run see the same expected time as when processed individually.
+    """
+    monitor = monitor_environment.monitor
+
+    date_added = start_time
+    if duration is not None:
+        date_added -= timedelta(milliseconds=duration)
+
+    monitor_config = monitor.get_validated_config()
+
+    check_in = MonitorCheckIn(
+        project_id=project.id,
+        monitor=monitor,
+        monitor_environment=monitor_environment,
+        guid=guid,
+        duration=duration,
+        status=status,
+        date_added=date_added,
+        date_clock=item.ts.replace(tzinfo=UTC),
+        date_updated=start_time,
+        expected_time=monitor_environment.next_checkin,
+        timeout_at=get_timeout_at(monitor_config, status, date_added),
+        monitor_config=monitor_config,
+        trace_id=trace_id,
+    )
+    group_state.pending[guid] = _PendingCheckin(item, project, check_in, start_time, metric_kwargs)
+
+    if monitor_environment.last_checkin is None or monitor_environment.last_checkin <= start_time:
+        monitor_environment.last_checkin = date_added
+        monitor_environment.next_checkin = monitor.get_next_expected_checkin(start_time)
+        monitor_environment.next_checkin_latest = monitor.get_next_expected_checkin_latest(
+            start_time
+        )
+
+
+def flush_pending_checkins(group_state: CheckinGroupState) -> None:
+    """
+    Store a run of deferred OK check-ins. The check-ins are created together
+    and only the most recent one is used to mark the monitor environment as OK,
+    which is equivalent to marking each of them in turn since the environment
+    is known to be healthy.
+    """
+    if not group_state.pending:
+        return
+
+    pending = list(group_state.pending.values())
+    group_state.pending = {}
+
+    try:
+        with transaction.atomic(router.db_for_write(MonitorCheckIn)):
+            # Check-ins created since the batch was prefetched (by another
+            # consumer, or a retried message) are left out of the run and
+            # processed individually below, as updates of the existing
+            # check-ins.
+            existing_guids = set(
+                MonitorCheckIn.objects.filter(
+                    guid__in=[p.check_in.guid for p in pending]
+                ).values_list("guid", flat=True)
+            )
+            conflicting = [p for p in pending if p.check_in.guid in existing_guids]
+            stored = [p for p in pending if p.check_in.guid not in existing_guids]
+
+            if stored:
+                # Conflicts may still happen with check-ins created after the
+                # lookup, these are skipped rather than failing the whole run.
+                MonitorCheckIn.objects.bulk_create(
+                    [p.check_in for p in stored], ignore_conflicts=True
+                )
+
+                # Check-ins may arrive slightly out of order, `mark_ok`
+                # ignores check-ins older than the latest one so only that one
+                # needs to be applied.
+                latest = max(reversed(stored), key=lambda p: p.start_time)
+                mark_ok(latest.check_in, succeeded_at=latest.start_time)
+                with in_test_hide_transaction_boundary():
+                    signal_first_checkin(latest.project, latest.check_in.monitor)
+    except Exception:
+        # The in-memory monitor environment can no longer be trusted
+        group_state.monitor_environment = None
+        metrics.incr(
+            "monitors.checkin.result",
+            amount=len(pending),
+            tags={**pending[-1].metric_kwargs, "status": "error"},
+        )
+        logger.exception("Failed to store check-ins")
+        return
+
+    if conflicting:
+        # Updating the existing check-ins may modify the monitor environment
+        group_state.monitor_environment = None
+        metrics.incr("monitors.checkin.bulk.conflicts", amount=len(conflicting))
+        for p in conflicting:
+            process_checkin(p.item)
+
+    if not stored:
+        return
+
+    metrics.incr("monitors.checkin.bulk.stored", amount=len(stored))
+    metrics.incr("monitors.checkin.bulk.collapsed_mark_ok", amount=len(stored) - 1)
+
+    now = datetime.now()
+    for p in stored:
+        track_outcome(
+            org_id=p.project.organization_id,
+            project_id=p.project.id,
+            key_id=None,
+            outcome=Outcome.ACCEPTED,
+            reason=None,
+            timestamp=p.start_time,
+            category=DataCategory.MONITOR,
+        )
+        metrics.incr(
+            "monitors.checkin.result",
+            tags={**p.metric_kwargs, "status": "created_new_checkin"},
+        )
+
+        # See `_process_checkin` for details about these metrics
+        kafka_delay = p.item.ts - p.start_time.replace(tzinfo=None)
+        metrics.gauge("monitors.checkin.relay_kafka_delay", kafka_delay.total_seconds())
+        delay = now - p.item.ts
+        metrics.gauge("monitors.checkin.completion_time", delay.total_seconds())
+
+        metrics.incr(
+            "monitors.checkin.result",
+            tags={**p.metric_kwargs, "status": "complete"},
+        )
+
+
+def prefetch_checkin_groups(
+    checkin_mapping: Mapping[str, list[CheckinItem]],
+) -> dict[str, CheckinGroupState]:
+    """
+    Load the state needed to process each check-in group of a batch in bulk
+    using a fixed number of queries, rather than looking up the monitor and
+    monitor environment for every check-in.
+
+    Groups whose monitor environment does not exist yet are still given a
+    state, their check-ins simply go through the regular lookups.
+    """
+    project_ids: set[int] = set()
+    slugs: set[str] = set()
+    guids: set[uuid.UUID] = set()
+
+    for items in checkin_mapping.values():
+        project_ids.add(int(items[0].message["project_id"]))
+        slugs.add(items[0].valid_monitor_slug)
+        for item in items:
+            check_in_id = item.payload.get("check_in_id")
+            if not isinstance(check_in_id, str):
+                continue
+            try:
+                guids.add(uuid.UUID(check_in_id))
+            except ValueError:
+                pass
+
+    monitor_environments = list(
+        MonitorEnvironment.objects.filter(
+            monitor__project_id__in=project_ids,
+            monitor__slug__in=slugs,
+        ).select_related("monitor")
+    )
+    environment_names = dict(
+        Environment.objects.filter(
+            id__in={env.environment_id for env in monitor_environments}
+        ).values_list("id", "name")
+    )
+    environments_by_key = {
+        (env.monitor.project_id, env.monitor.slug, environment_names.get(env.environment_id)): env
+        for env in monitor_environments
+    }
+
+    existing_guids = frozenset(
+        MonitorCheckIn.objects.filter(guid__in=guids).values_list("guid", flat=True)
+    )
+
+    group_states = {}
+    for processing_key, items in checkin_mapping.items():
+        item = items[0]
+        key = (
+            int(item.message["project_id"]),
+            item.valid_monitor_slug,
+            item.payload.get("environment") or "production",
+        )
+        group_states[processing_key] = CheckinGroupState(
+            monitor_environment=environments_by_key.get(key),
+            existing_guids=existing_guids,
+        )
+
+    return group_states
+
+
+def _process_checkin(
+    item: CheckinItem,
+    txn: Transaction | Span,
+    group_state: CheckinGroupState | None = None,
+) -> None:
     params = item.payload
 
     # XXX: The start_time is when relay recieved the original envelope store
@@ -551,6 +804,8 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
 
     validated_params = validator.validated_data
 
+    prefetched_environment = group_state.monitor_environment if group_state else None
+
     ensure_config_errors: list[ProcessingError] = []
     monitor = None
     # 01
@@ -560,6 +815,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
             project,
             monitor_slug,
             monitor_config,
+            prefetched_environment.monitor if prefetched_environment else None,
         )
     except ProcessingErrorsException as e:
         ensure_config_errors = list(e.processing_errors)
@@ -669,9 +925,12 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
     # 02
     # Retrieve or upsert monitor environment for this check-in
     try:
-        monitor_environment = MonitorEnvironment.objects.ensure_environment(
-            project, monitor, environment
-        )
+        if prefetched_environment and prefetched_environment.monitor_id == monitor.id:
+            monitor_environment = prefetched_environment
+        else:
+            monitor_environment = MonitorEnvironment.objects.ensure_environment(
+                project, monitor, environment
+            )
     except MonitorEnvironmentLimitsExceeded as e:
         metrics.incr(
             "monitors.checkin.result",
@@ -733,13 +992,45 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
 
     # 03
     # Create or update check-in
+    status = getattr(CheckInStatus, validated_params["status"].upper())
+    trace_id = validated_params.get("contexts", {}).get("trace", {}).get("trace_id")
+    duration = validated_params.get("duration")
+
+    if group_state is not None:
+        # 03-0
+        # Defer storing new OK check-ins of a healthy monitor environment so
+        # that consecutive heartbeats are stored together.
+        if (
+            status == CheckInStatus.OK
+            and not use_latest_checkin
+            and monitor_environment is group_state.monitor_environment
+            and monitor_environment.status == MonitorStatus.OK
+            and guid not in group_state.existing_guids
+            and guid not in group_state.pending
+        ):
+            txn.set_tag("outcome", "defer_new_checkin")
+            _defer_checkin(
+                group_state,
+                item,
+                project,
+                monitor_environment,
+                guid,
+                status,
+                start_time,
+                duration,
+                trace_id,
+                metric_kwargs,
+            )
+            return
+
+        # Any deferred check-ins must be stored before this check-in, which
+        # will be processed individually and may modify the monitor
+        # environment.
+        flush_pending_checkins(group_state)
+        group_state.monitor_environment = None
 
     try:
         with transaction.atomic(router.db_for_write(Monitor)):
-            status = getattr(CheckInStatus, validated_params["status"].upper())
-            trace_id = validated_params.get("contexts", {}).get("trace", {}).get("trace_id")
-            duration = validated_params.get("duration")
-
             # 03-A
             # Retrieve existing check-in for update
             try:
@@ -931,7 +1222,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
         logger.exception("Failed to process check-in")
 
 
-def process_checkin(item: CheckinItem) -> None:
+def process_checkin(item: CheckinItem, group_state: CheckinGroupState | None = None) -> None:
     """
     Process an individual check-in
     """
@@ -942,20 +1233,64 @@ def process_checkin(item: CheckinItem) -> None:
         ) as txn:
             # Deepcopy the checkin here so that it's not modified. We need the original when we get a
             # `ProcessingErrorsException`
-            _process_checkin(deepcopy(item), txn)
+            _process_checkin(deepcopy(item), txn, group_state)
     except ProcessingErrorsException as e:
         handle_processing_errors(item, e)
     except Exception:
         logger.exception("Failed to process check-in")
 
 
-def process_checkin_group(items: list[CheckinItem]) -> None:
+def process_checkin_group(
+    items: list[CheckinItem], group_state: CheckinGroupState | None = None
+) -> None:
     """
     Process a group of related check-ins (all part of the same monitor)
     completely serially.
+
+    When a `CheckinGroupState` is provided the group is processed in bulk,
+    consecutive OK check-ins are stored together.
     """
     for item in items:
-        process_checkin(item)
+        process_checkin(item, group_state)
+
+    if group_state is not None:
+        flush_pending_checkins(group_state)
+
+
+class _QueryCounter:
+    """
+    Database execute wrapper counting the queries executed by a thread.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(
+        self, execute: Callable[..., Any], sql: str, params: Any, many: bool, context: Any
+    ) -> Any:
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+@contextmanager
+def _count_queries() -> Generator[_QueryCounter]:
+    """
+    Count the database queries executed by the current thread within the
+    context.
+    """
+    counter = _QueryCounter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        yield counter
+
+
+def _process_checkin_group_counting_queries(
+    items: list[CheckinItem], group_state: CheckinGroupState | None
+) -> int:
+    with _count_queries() as counter:
+        process_checkin_group(items, group_state)
+    return counter.count
 
 
 def process_batch(
@@ -1005,13 +1340,36 @@ def process_batch(
     # Number of check-in groups we've collected to be processed in parallel
     metrics.gauge("monitors.checkin.parallel_batch_groups", len(checkin_mapping))
 
+    bulk = options.get("crons.consumer.bulk-checkin-processing")
+    group_states: dict[str, CheckinGroupState] = {}
+    query_count = 0
+
     # Submit check-in groups for processing
     with sentry_sdk.start_transaction(op="process_batch", name="monitors.monitor_consumer"):
+        if bulk and checkin_mapping:
+            with _count_queries() as counter:
+                group_states = prefetch_checkin_groups(checkin_mapping)
+            query_count += counter.count
+
         futures = [
-            executor.submit(process_checkin_group, group) for group in checkin_mapping.values()
+            executor.submit(
+                _process_checkin_group_counting_queries,
+                group,
+                group_states.get(processing_key),
+            )
+            for processing_key, group in checkin_mapping.items()
         ]
         wait(futures)
 
+    query_count += sum(future.result() for future in futures if future.exception() is None)
+
+    # Number of database queries executed to process the check-ins of this batch
+    metrics.distribution(
+        "monitors.checkin.batch_db_queries",
+        query_count,
+        tags={"mode": "bulk" if bulk else "serial"},
+    )
+
     # Update check in volume for the entire batch we've just processed
     update_check_in_volume(item.timestamp for item in batch if item.timestamp is not None)
 
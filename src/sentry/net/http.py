@@ -3,6 +3,7 @@ from __future__ import annotations
 import socket
 from collections.abc import Callable
 from functools import partial
+from http.cookiejar import DefaultCookiePolicy
 from socket import error as SocketError
 from socket import timeout as SocketTimeout
 from typing import Optional
@@ -216,6 +217,31 @@ class SafeSession(Session):
         self.mount("http://", adapter)
 
 
+class RejectCookiesPolicy(DefaultCookiePolicy):
+    def set_ok(self, cookie, request):
+        return False
+
+
+class KeepAliveSession(SafeSession):
+    """
+    A SafeSession that keeps its connection pools open when it is used as a
+    context manager, so that a single session can be shared by many requests to
+    the same hosts. The session has to be closed explicitly with `close`.
+
+    Cookies set by responses are not kept, as they would otherwise be sent along
+    with unrelated requests sharing the session.
+    """
+
+    def __init__(
+        self, is_ipaddress_permitted: IsIpAddressPermitted = None, max_retries: Retry | None = None
+    ) -> None:
+        super().__init__(is_ipaddress_permitted=is_ipaddress_permitted, max_retries=max_retries)
+        self.cookies.set_policy(RejectCookiesPolicy())
+
+    def __exit__(self, *args):
+        pass
+
+
 class UnixHTTPConnection(HTTPConnection):
     default_socket_options = []
 
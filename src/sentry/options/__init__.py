@@ -18,6 +18,7 @@ from .manager import (
     FLAG_STOREONLY,
     NotWritableReason,
     OptionsManager,
+    OptionsSnapshot,
     UnknownOption,
     UpdateChannel,
 )
@@ -51,7 +52,9 @@ __all__ = (
     "register",
     "unregister",
     "set",
+    "snapshot",
     "OptionsManager",
+    "OptionsSnapshot",
 )
 
 # See notes in ``runner.initializer`` regarding lazy cache configuration.
@@ -74,6 +77,7 @@ is_set_on_disk = default_manager.is_set_on_disk
 lookup_key = default_manager.lookup_key
 get_last_update_channel = default_manager.get_last_update_channel
 can_update = default_manager.can_update
+snapshot = default_manager.snapshot
 
 
 def load_defaults():
@@ -497,6 +497,13 @@ register(
     default=[],
     flags=FLAG_ALLOW_EMPTY | FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Parses recording segments incrementally instead of deserializing them as a whole.
+register(
+    "replay.recording.streaming-parser.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # User Feedback Options
 register(
@@ -1194,6 +1201,25 @@ register("relay.metric-stats.rollout-rate", default=0.0, flags=FLAG_AUTOMATOR_MO
 # Controls whether generic inbound filters are sent to Relay.
 register("relay.emit-generic-inbound-filters", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Controls whether sections of project configs are cached and only rebuilt by the
+# invalidations changing their dependencies.
+register(
+    "relay.project-config-sections.enabled",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# The time in seconds cached sections of project configs are reused for.
+register("relay.project-config-sections.ttl", default=3600, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
+# Controls whether the project configs of an organization are computed in bulk on
+# organization-wide invalidations, fetching the inputs shared by its projects once.
+register(
+    "relay.project-config-bulk-organization.enabled",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Write new kafka headers in eventstream
 register("eventstream:kafka-headers", default=True, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
@@ -2032,12 +2058,52 @@ register("hybridcloud.integrationproxy.retries", default=5, flags=FLAG_AUTOMATOR
 register("hybridcloud.endpoint_flag_logging", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("hybridcloud.rpc.method_retry_overrides", default={}, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("hybridcloud.rpc.method_timeout_overrides", default={}, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Keep values read through `back_with_silo_cache` in a per-process cache, and check their
+# versions once per request.
+register(
+    "hybridcloud.caching.local_cache",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
 # Webhook processing controls
 register(
     "hybridcloud.webhookpayload.worker_threads",
     default=4,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Deliver parallel webhooks through keep-alive sessions per region, with the
+# concurrency and request rate limited per destination (region and provider).
+register(
+    "hybridcloud.webhookpayload.pooled_delivery",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "hybridcloud.webhookpayload.destination_max_concurrency",
+    default=4,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Requests per second sent to a destination, 0 disables the limit.
+register(
+    "hybridcloud.webhookpayload.destination_max_rate",
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Outbox processing controls
+# Number of threads draining the scheduled shards of an outbox batch concurrently.
+# A value of 1 drains shards one after another.
+register(
+    "hybrid_cloud.outbox.parallel_drain_workers",
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Size the batches processed outboxes are deleted in per category, based on how
+# long previous deletes took, instead of using a fixed batch size.
+register(
+    "hybrid_cloud.outbox.adaptive_delete_batch_size",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # Break glass controls
 register("hybrid_cloud.rpc.disabled-service-methods", default=[], flags=FLAG_AUTOMATOR_MODIFIABLE)
@@ -2109,6 +2175,15 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Enables bulk processing of check-in groups in the batched-parallel monitor
+# consumer. Monitor environments are prefetched per batch and runs of OK
+# check-ins are stored together.
+register(
+    "crons.consumer.bulk-checkin-processing",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Temporary killswitch to enable dispatching incident occurrences into the
 # incident_occurrence_consumer
 register(
@@ -2246,6 +2321,23 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Evaluate workflow trigger and action filter condition groups with compiled
+# evaluation plans cached per process, rather than loading their conditions
+# for every event.
+register(
+    "workflow_engine.compiled-condition-groups",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Serve the alert rules and triggers of metric alert subscriptions from a
+# per-process cache when processing batches of subscription updates.
+register(
+    "incidents.subscription-processor.state-cache.enabled",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 register(
     "on_demand.max_alert_specs",
     default=50,
@@ -2463,6 +2555,12 @@ register(
     default=0.0,
     flags=FLAG_AUTOMATOR_MODIFIABLE | FLAG_MODIFIABLE_RATE,
 )
+# Cache the metric specs generated for widget and alert queries, shared by all projects of an org
+register(
+    "on_demand_metrics.metric_specs_cache.enabled",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # Relocation: whether or not the self-serve API for the feature is enabled. When set on a region
 # silo, this flag controls whether or not that region's API will serve relocation requests to
@@ -2772,6 +2870,44 @@ register(
     default={"limit": 1000, "window": 300, "concurrent_limit": 15},
     flags=FLAG_ALLOW_EMPTY | FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Run the threaded attribute loaders of serializers (e.g. the Snuba seen stats queries of
+# issues) concurrently, instead of one after the other.
+register(
+    "api.serializers.concurrent-attribute-loaders",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Serve the results of serializers which opted into caching them from the cache.
+register(
+    "api.serializers.result-cache.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# For how long cached serializer results are served, in seconds. This bounds how stale they get
+# on changes which do not invalidate them, e.g. of feature flags.
+register(
+    "api.serializers.result-cache.ttl",
+    default=60,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Build the stats series of the issue stream from columns of counts aligned with the
+# timestamps, instead of from nested mappings of the Snuba results.
+register(
+    "api.issue-stream.columnar-stats",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Encode and send large API payloads (e.g. of traces) in chunks while they are sent, rather than
+# rendering them at once.
+register(
+    "api.streaming-json-responses",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # TODO: remove once removed from options
 register(
@@ -2889,6 +3025,28 @@ register(
     default=False,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Evaluates the delayed rules of small projects of an organization together,
+# sharing compatible condition queries between them.
+register(
+    "delayed_processing.bulk_evaluation.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "delayed_processing.bulk_evaluation.max_projects",
+    type=Int,
+    default=50,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# The number of threads the condition queries of a bulk evaluation run on. With 1, they run on
+# the task's thread.
+register(
+    "delayed_processing.bulk_evaluation.max_workers",
+    type=Int,
+    default=8,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "delayed_workflow.rollout",
     type=Bool,
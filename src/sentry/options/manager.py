@@ -1,7 +1,9 @@
 import logging
 import sys
-from collections.abc import Sequence
+import threading
+from collections.abc import Iterator, Mapping, Sequence
 from enum import Enum
+from time import monotonic
 
 from django.conf import settings
 
@@ -153,6 +155,39 @@ def _make_cache_key(key):
     return "o:%s" % md5_text(key).hexdigest()
 
 
+class OptionsSnapshot(Mapping[str, Any]):
+    """
+    A read-only view of the options, for code reading many of them often, such as consumers
+    processing batches of messages.
+
+    Each option is looked up through the manager the first time it is read from the snapshot,
+    and the same value is returned for the rest of its lifetime. Later reads are a single dict
+    lookup. Take a new snapshot (see `OptionsManager.snapshot`) to pick up changes.
+    """
+
+    def __init__(self, manager: "OptionsManager") -> None:
+        self._manager = manager
+        self._values: dict[str, Any] = {}
+        self.taken_at = monotonic()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        value = self._values[key] = self._manager.get(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._manager.registry)
+
+    def __len__(self) -> int:
+        return len(self._manager.registry)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._manager.registry
+
+
 class OptionsManager:
     """
     A backend for storing generic configuration within Sentry.
@@ -173,6 +208,8 @@ class OptionsManager:
 
     def __init__(self, store):
         self.store = store
+        self._snapshot: OptionsSnapshot | None = None
+        self._snapshot_lock = threading.Lock()
         self.registry = {}
 
     def set(self, key: str, value, coerce=True, channel: UpdateChannel = UpdateChannel.UNKNOWN):
@@ -438,6 +475,24 @@ class OptionsManager:
         if not opt.type.test(value):
             raise TypeError(f"{key!r}: got {_type(value)!r}, expected {opt.type!r}")
 
+    def snapshot(self, max_age: float = 10) -> OptionsSnapshot:
+        """
+        Return a snapshot of the options, shared with other callers until it is older than
+        `max_age` seconds. Take it once per batch of work, rather than calling `get()` per
+        item, to read options with a dict lookup.
+
+        >>> from sentry import options
+        >>> snapshot = options.snapshot()
+        >>> snapshot['option']
+        """
+        snapshot = self._snapshot
+        if snapshot is None or monotonic() - snapshot.taken_at >= max_age:
+            with self._snapshot_lock:
+                snapshot = self._snapshot
+                if snapshot is None or monotonic() - snapshot.taken_at >= max_age:
+                    snapshot = self._snapshot = OptionsSnapshot(self)
+        return snapshot
+
     def all(self):
         """
         Return an iterator for all keys in the registry.
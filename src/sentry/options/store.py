@@ -16,6 +16,17 @@ from sentry.options.manager import UpdateChannel
 CACHE_FETCH_ERR = "Unable to fetch option cache for %s"
 CACHE_UPDATE_ERR = "Unable to update option cache for %s"
 
+# The global version of the options in the network cache, incremented on every change. With push
+# invalidation, each change is recorded under the version it created, with the cache key of the
+# option it changed.
+VERSION_CACHE_KEY = "o:version"
+CHANGE_CACHE_KEY = "o:change:%s"
+# At most this many changes are looked up to reload only the changed options. When more options
+# changed since the last check, all options in the local cache are reloaded.
+MAX_VERSION_CHANGES = 100
+# The metrics collected by the store are emitted at most once per this many seconds.
+STATS_FLUSH_INTERVAL = 10
+
 logger = logging.getLogger("sentry")
 
 
@@ -51,9 +62,11 @@ class Key:
         return False
 
 
-def _make_cache_value(key, value):
+def _make_cache_value(key, value, ttl=None):
     now = int(time())
-    return (value, now + key.ttl, now + key.ttl + key.grace)
+    if ttl is None:
+        ttl = key.ttl
+    return (value, now + ttl, now + ttl + key.grace)
 
 
 class OptionsStore:
@@ -71,8 +84,28 @@ class OptionsStore:
     def __init__(self, cache=None, ttl=None):
         self.cache = cache
         self.ttl = ttl
+        self.push_invalidation = False
+        self.version_check_interval = 1
+        self.push_ttl = 300
+        self._reset_stats()
+        self._stats_flushed_at = None
+        self.flush_local_cache()
+
+    def configure_push_invalidation(self, enabled, check_interval, ttl):
+        """
+        With push invalidation, options are kept in the local cache for `ttl` seconds rather
+        than for the TTL of their key. Changes are picked up instead by checking the global
+        version of the options at most every `check_interval` seconds, and reloading the
+        options which changed since the last check in bulk.
+        """
+        self.push_invalidation = enabled
+        self.version_check_interval = check_interval
+        self.push_ttl = ttl
         self.flush_local_cache()
 
+    def _make_local_value(self, key, value):
+        return _make_cache_value(key, value, self.push_ttl if self.push_invalidation else None)
+
     @property
     def model(self):
         return self.model_cls()
@@ -115,15 +148,18 @@ class OptionsStore:
             return None
 
         cache_key = key.cache_key
+        start = time()
         try:
             value = self.cache.get(cache_key)
         except Exception:
             if not silent:
                 logger.warning(CACHE_FETCH_ERR, key.name, extra={"key": key.name}, exc_info=True)
             value = None
+        self._stats["network_reads"] += 1
+        self._stats["network_read_time"] += time() - start
 
         if value is not None and key.ttl > 0:
-            self._local_cache[cache_key] = _make_cache_value(key, value)
+            self._local_cache[cache_key] = self._make_local_value(key, value)
 
         return value
 
@@ -137,6 +173,10 @@ class OptionsStore:
         This allows the OptionStore to pave over potential network hiccups
         by returning a stale value.
         """
+        self.maybe_flush_stats()
+        if self.push_invalidation:
+            self.check_version()
+
         try:
             value, expires, grace = self._local_cache[key.cache_key]
         except KeyError:
@@ -146,6 +186,7 @@ class OptionsStore:
 
         # Key is within normal expiry window, so just return it
         if now < expires:
+            self._stats["local_hits"] += 1
             return value
 
         # If we're able to accept within grace window, return it
@@ -234,7 +275,9 @@ class OptionsStore:
         assert self.cache is not None, "cache must be configured before mutating options"
 
         self.set_store(key, value, channel)
-        return self.set_cache(key, value)
+        result = self.set_cache(key, value)
+        self.publish_change(key)
+        return result
 
     def set_store(self, key, value, channel: UpdateChannel):
         from sentry.db.models.query import create_or_update
@@ -256,7 +299,7 @@ class OptionsStore:
         cache_key = key.cache_key
 
         if key.ttl > 0:
-            self._local_cache[cache_key] = _make_cache_value(key, value)
+            self._local_cache[cache_key] = self._make_local_value(key, value)
 
         try:
             self.cache.set(cache_key, value, self.ttl)
@@ -275,7 +318,9 @@ class OptionsStore:
         assert self.cache is not None, "cache must be configured before mutating options"
 
         self.delete_store(key)
-        return self.delete_cache(key)
+        result = self.delete_cache(key)
+        self.publish_change(key)
+        return result
 
     def delete_store(self, key):
         self.model.objects.filter(key=key.name).delete()
@@ -294,6 +339,147 @@ class OptionsStore:
             logger.warning(CACHE_UPDATE_ERR, key.name, extra={"key": key.name}, exc_info=True)
             return False
 
+    def publish_change(self, key):
+        """
+        Increments the global version of the options, and records the change of `key` under
+        it, so that processes with push invalidation reload it.
+        """
+        try:
+            try:
+                version = self.cache.incr(VERSION_CACHE_KEY)
+            except ValueError:
+                # The version was never set or evicted. Readers reload all options when it
+                # goes back, so starting over is safe.
+                if not self.cache.add(VERSION_CACHE_KEY, 1, None):
+                    version = self.cache.incr(VERSION_CACHE_KEY)
+                else:
+                    version = 1
+            self.cache.set(CHANGE_CACHE_KEY % version, key.cache_key, self.ttl)
+        except Exception:
+            logger.warning(CACHE_UPDATE_ERR, key.name, extra={"key": key.name}, exc_info=True)
+
+    def check_version(self):
+        """
+        Reloads the options in the local cache which changed since the last check, if the
+        global version of the options changed. The version is checked at most once every
+        `version_check_interval` seconds.
+        """
+        now = time()
+        if self.cache is None or now - self._version_checked_at < self.version_check_interval:
+            return
+        # Set first, lookups of options while checking must not check again.
+        self._version_checked_at = now
+
+        try:
+            version = self.cache.get(VERSION_CACHE_KEY)
+        except Exception:
+            logger.warning(CACHE_FETCH_ERR, VERSION_CACHE_KEY, exc_info=True)
+            return
+
+        previous, self._version = self._version, version
+        if version == previous or not self._local_cache:
+            return
+
+        changed = None
+        if (
+            previous is not None
+            and version is not None
+            and 0 < version - previous <= MAX_VERSION_CHANGES
+        ):
+            change_keys = [CHANGE_CACHE_KEY % v for v in range(previous + 1, version + 1)]
+            try:
+                changes = self.cache.get_many(change_keys)
+            except Exception:
+                logger.warning(CACHE_FETCH_ERR, VERSION_CACHE_KEY, exc_info=True)
+                changes = {}
+            # A change which expired, or is not recorded yet, could have been any option.
+            if len(changes) == len(change_keys):
+                changed = set(changes.values())
+
+        self._reload(changed)
+
+    def _reload(self, changed):
+        """
+        Reloads the given cache keys, or all of them if `changed` is None, from the network
+        cache into the local cache. Options missing from the network cache are evicted, and
+        fetched from the database on their next lookup.
+        """
+        cache_keys = [
+            cache_key
+            for cache_key in list(self._local_cache)
+            if changed is None or cache_key in changed
+        ]
+        self._stats["reloads"] += 1
+        self._stats["reloaded"] += len(cache_keys)
+        if not cache_keys:
+            return
+
+        try:
+            values = self.cache.get_many(cache_keys)
+        except Exception:
+            logger.warning(CACHE_FETCH_ERR, VERSION_CACHE_KEY, exc_info=True)
+            values = {}
+
+        for cache_key in cache_keys:
+            try:
+                if cache_key in values:
+                    _, expires, grace = self._local_cache[cache_key]
+                    self._local_cache[cache_key] = (values[cache_key], expires, grace)
+                else:
+                    del self._local_cache[cache_key]
+            except KeyError:
+                # Evicted by another thread in the meantime.
+                pass
+
+    def _reset_stats(self):
+        self._stats = {
+            "local_hits": 0,
+            "network_reads": 0,
+            "network_read_time": 0.0,
+            "reloads": 0,
+            "reloaded": 0,
+        }
+
+    def maybe_flush_stats(self):
+        """
+        Flushes the stats once `STATS_FLUSH_INTERVAL` seconds passed since the last flush, so
+        that long running processes which do not handle requests or tasks, such as consumers,
+        emit them as well.
+        """
+        now = time()
+        if self._stats_flushed_at is None:
+            # Metrics may not be set up yet when the first options are read.
+            self._stats_flushed_at = now
+            return
+        if now - self._stats_flushed_at < STATS_FLUSH_INTERVAL:
+            return
+        # Set first, options read while emitting the metrics must not flush again.
+        self._stats_flushed_at = now
+        self.flush_stats()
+
+    def flush_stats(self):
+        """
+        Emits the metrics collected since the last flush.
+        """
+        from sentry.utils import metrics
+
+        stats = self._stats
+        self._reset_stats()
+        tags = {"invalidation": "push" if self.push_invalidation else "ttl"}
+        if stats["local_hits"]:
+            metrics.incr("options.local_cache.hit", amount=stats["local_hits"], tags=tags)
+        if stats["network_reads"]:
+            metrics.incr("options.network_cache.read", amount=stats["network_reads"], tags=tags)
+            metrics.distribution(
+                "options.network_cache.read.duration",
+                stats["network_read_time"] / stats["network_reads"],
+                tags=tags,
+                unit="second",
+            )
+        if stats["reloads"]:
+            metrics.incr("options.reload", amount=stats["reloads"], tags=tags)
+            metrics.incr("options.reload.options", amount=stats["reloaded"], tags=tags)
+
     def clean_local_cache(self):
         """
         Iterate over our local cache items, and
@@ -327,6 +513,8 @@ class OptionsStore:
         Empty store's local in-process cache.
         """
         self._local_cache = {}
+        self._version = None
+        self._version_checked_at = 0.0
 
     def maybe_clean_local_cache(self, **kwargs):
         # Periodically force an expire on the local cache.
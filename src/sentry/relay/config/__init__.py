@@ -37,6 +37,7 @@ from sentry.relay.config.metric_extraction import (
     get_metric_conditional_tagging_rules,
     get_metric_extraction_config,
 )
+from sentry.relay.config.sections import ConfigSections
 from sentry.relay.utils import to_camel_case_name
 from sentry.sentry_metrics.use_case_id_registry import CARDINALITY_LIMIT_USE_CASES
 from sentry.utils import metrics
@@ -80,10 +81,19 @@ MIN_CLUSTERER_RUNS = 10
 logger = logging.getLogger(__name__)
 
 
-def get_exposed_features(project: Project) -> Sequence[str]:
+def get_exposed_features(
+    project: Project, batch_features: Mapping[str, bool | None] | None = None
+) -> Sequence[str]:
+    """Returns the features of `EXPOSABLE_FEATURES` enabled for the project.
+
+    :param batch_features: Flags already resolved for the project, e.g. with
+        `features.batch_has`. Features missing from it are checked one by one.
+    """
     active_features = []
     for feature in EXPOSABLE_FEATURES:
-        if feature.startswith("organizations:"):
+        if batch_features is not None and batch_features.get(feature) is not None:
+            has_feature = bool(batch_features[feature])
+        elif feature.startswith("organizations:"):
             has_feature = features.has(feature, project.organization)
         elif feature.startswith("projects:"):
             has_feature = features.has(feature, project)
@@ -105,6 +115,35 @@ def get_exposed_features(project: Project) -> Sequence[str]:
     return active_features
 
 
+def get_exposed_features_bulk(
+    organization: Organization, projects: Sequence[Project]
+) -> dict[int, Sequence[str]]:
+    """Returns the exposed features of many projects of an organization, keyed by project id.
+
+    Organization features are resolved once for all projects, and project features with a
+    single batch check.
+    """
+    organization_features = [f for f in EXPOSABLE_FEATURES if f.startswith("organizations:")]
+    project_features = [f for f in EXPOSABLE_FEATURES if f.startswith("projects:")]
+
+    organization_results: Mapping[str, bool | None] = {}
+    if organization_features:
+        batch = features.batch_has(organization_features, organization=organization) or {}
+        organization_results = batch.get(f"organization:{organization.id}", {})
+
+    project_batch: Mapping[str, Mapping[str, bool | None]] = {}
+    if project_features and projects:
+        project_batch = features.batch_has(project_features, projects=projects) or {}
+
+    return {
+        project.id: get_exposed_features(
+            project,
+            {**organization_results, **project_batch.get(f"project:{project.id}", {})},
+        )
+        for project in projects
+    }
+
+
 def get_public_key_configs(
     project_keys: Iterable[ProjectKey] | None = None,
 ) -> list[Mapping[str, Any]]:
@@ -277,7 +316,10 @@ def get_metrics_config(timeout: TimeChecker, project: Project) -> Mapping[str, A
 
 
 def get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    sections: ConfigSections | None = None,
+    exposed_features: Sequence[str] | None = None,
 ) -> ProjectConfig:
     """Constructs the ProjectConfig information.
     :param project: The project to load configuration for. Ensure that
@@ -287,6 +329,11 @@ def get_project_config(
         no project keys are provided it is assumed that the config does not
         need to contain auth information (this is the case when used in
         python's StoreView)
+    :param sections: Builds the cached sections of the config, shared between
+        the configs computed together. When omitted all sections are built
+        without caching.
+    :param exposed_features: Pre-computed exposed features of the project,
+        see `get_exposed_features_bulk`.
     :return: a ProjectConfig object for the given project
     """
     with sentry_sdk.isolation_scope() as scope:
@@ -295,7 +342,12 @@ def get_project_config(
             sentry_sdk.start_transaction(name="get_project_config"),
             metrics.timer("relay.config.get_project_config.duration"),
         ):
-            return _get_project_config(project, project_keys=project_keys)
+            return _get_project_config(
+                project,
+                project_keys=project_keys,
+                sections=sections,
+                exposed_features=exposed_features,
+            )
 
 
 def get_dynamic_sampling_config(timeout: TimeChecker, project: Project) -> Mapping[str, Any] | None:
@@ -1014,11 +1066,17 @@ def _get_mobile_performance_profiles(
 
 
 def _get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    sections: ConfigSections | None = None,
+    exposed_features: Sequence[str] | None = None,
 ) -> ProjectConfig:
     if project.status != ObjectStatus.ACTIVE:
         return ProjectConfig(project, disabled=True)
 
+    if sections is None:
+        sections = ConfigSections(use_cache=False)
+
     public_keys = get_public_key_configs(project_keys=project_keys)
 
     with sentry_sdk.start_span(op="get_public_config"):
@@ -1047,13 +1105,17 @@ def _get_project_config(
     config = cfg["config"]
 
     with sentry_sdk.start_span(op="get_exposed_features"):
-        if exposed_features := get_exposed_features(project):
+        if exposed_features is None:
+            exposed_features = get_exposed_features(project)
+        if exposed_features:
             config["features"] = exposed_features
 
     # NOTE: Omitting dynamicSampling because of a failure increases the number
     # of events forwarded by Relay, because dynamic sampling will stop filtering
     # anything.
-    add_experimental_config(config, "sampling", get_dynamic_sampling_config, project)
+    add_experimental_config(
+        config, "sampling", sections.builder("sampling", get_dynamic_sampling_config), project
+    )
 
     # Rules to replace high cardinality transaction names
     add_experimental_config(config, "txNameRules", get_transaction_names_config, project)
@@ -1065,7 +1127,9 @@ def _get_project_config(
 
     config["breakdownsV2"] = project.get_option("sentry:breakdowns")
 
-    add_experimental_config(config, "metrics", get_metrics_config, project)
+    add_experimental_config(
+        config, "metrics", sections.builder("metrics", get_metrics_config), project
+    )
 
     if _should_extract_transaction_metrics(project):
         add_experimental_config(
@@ -1086,7 +1150,9 @@ def _get_project_config(
             project,
         )
 
-        if metric_extraction := get_metric_extraction_config(project):
+        if metric_extraction := sections.get_or_build(
+            "metricExtraction", project, lambda: get_metric_extraction_config(project)
+        ):
             config["metricExtraction"] = metric_extraction
 
     config["sessionMetrics"] = {
@@ -1097,17 +1163,23 @@ def _get_project_config(
         ),
     }
 
-    performance_score_profiles = [
-        *_get_desktop_browser_performance_profiles(project.organization),
-        *_get_mobile_browser_performance_profiles(project.organization),
-        *_get_mobile_performance_profiles(project.organization),
-        *_get_default_browser_performance_profiles(project.organization),
-    ]
+    performance_score_profiles = sections.get_or_build(
+        "performanceScore",
+        project,
+        lambda: [
+            *_get_desktop_browser_performance_profiles(project.organization),
+            *_get_mobile_browser_performance_profiles(project.organization),
+            *_get_mobile_performance_profiles(project.organization),
+            *_get_default_browser_performance_profiles(project.organization),
+        ],
+    )
     if performance_score_profiles:
         config["performanceScore"] = {"profiles": performance_score_profiles}
 
     with sentry_sdk.start_span(op="get_filter_settings"):
-        if filter_settings := get_filter_settings(project):
+        if filter_settings := sections.get_or_build(
+            "filterSettings", project, lambda: get_filter_settings(project)
+        ):
             config["filterSettings"] = filter_settings
     with sentry_sdk.start_span(op="get_grouping_config_dict_for_project"):
         grouping_config = get_grouping_config_dict_for_project(project)
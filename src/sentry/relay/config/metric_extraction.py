@@ -1,5 +1,7 @@
+import hashlib
 import logging
 import random
+import threading
 from collections import defaultdict
 from collections.abc import Sequence
 from dataclasses import dataclass
@@ -7,6 +9,7 @@ from datetime import timedelta
 from typing import Any, Literal, NotRequired, TypedDict
 
 import sentry_sdk
+from cachetools import LRUCache
 from celery.exceptions import SoftTimeLimitExceeded
 from django.utils import timezone
 from sentry_relay.processing import validate_sampling_condition
@@ -65,8 +68,20 @@ _METRIC_EXTRACTION_VERSION = 4
 _WIDGET_QUERY_CARDINALITY_TTL = 3600 * 24  # 24h
 _WIDGET_QUERY_CARDINALITY_SOFT_DEADLINE_TTL = 3600 * 0.5  # 30m
 
+# Version of the cached metric specs, bump it when changing how specs are generated.
+_METRIC_SPECS_CACHE_VERSION = 1
+# TTL of the generated metric specs, which are addressed by their inputs and never go stale.
+_METRIC_SPECS_CACHE_TTL = 3600 * 24  # 24h
+_METRIC_SPECS_LOCAL_CACHE_SIZE = 10_000
+
 HashedMetricSpec = tuple[str, MetricSpec, SpecVersion]
 
+# Specs generated in this process, addressed like in the shared cache.
+_local_metric_specs: LRUCache[str, list[HashedMetricSpec]] = LRUCache(
+    maxsize=_METRIC_SPECS_LOCAL_CACHE_SIZE
+)
+_local_metric_specs_lock = threading.Lock()
+
 
 class HighCardinalityWidgetException(Exception):
     pass
@@ -784,7 +799,104 @@ def _convert_aggregate_and_query_to_metrics(
     ):
         return None
 
+    args = (project, dataset, aggregate, query, environment, prefilling, spec_type, groupbys)
+    if not options.get("on_demand_metrics.metric_specs_cache.enabled"):
+        return _generate_metric_specs_for_versions(*args)[0]
+
+    cache_key = _metric_specs_cache_key(*args)
+    if cache_key is None:
+        metrics.incr("on_demand_metrics.metric_specs_cache", tags={"outcome": "uncacheable"})
+        return _generate_metric_specs_for_versions(*args)[0]
+
+    with _local_metric_specs_lock:
+        local_specs = _local_metric_specs.get(cache_key)
+    if local_specs is not None:
+        metrics.incr("on_demand_metrics.metric_specs_cache", tags={"outcome": "local_hit"})
+        return local_specs
+
+    cached_specs = cache.get(cache_key)
+    if cached_specs is not None:
+        metrics.incr("on_demand_metrics.metric_specs_cache", tags={"outcome": "hit"})
+    else:
+        metrics.incr("on_demand_metrics.metric_specs_cache", tags={"outcome": "miss"})
+        with metrics.timer("on_demand_metrics.metric_specs_generation"):
+            specs, complete = _generate_metric_specs_for_versions(*args)
+        if not complete:
+            # Specs failing to generate are not cached, so that their errors keep being reported.
+            return specs
+        cached_specs = specs
+        cache.set(cache_key, cached_specs, timeout=_METRIC_SPECS_CACHE_TTL)
+
+    with _local_metric_specs_lock:
+        _local_metric_specs[cache_key] = cached_specs
+    return cached_specs
+
+
+def _metric_specs_cache_key(
+    project: Project,
+    dataset: str,
+    aggregate: str,
+    query: str,
+    environment: str | None,
+    prefilling: bool,
+    spec_type: MetricSpecType,
+    groupbys: Sequence[str] | None,
+) -> str | None:
+    """
+    Returns the key addressing the metric specs generated for these inputs, which are shared
+    by all projects of the organization. Editing a widget or alert changes its inputs, so the
+    edited query addresses other specs. Returns None if the specs depend on the project.
+    """
+    try:
+        if OnDemandMetricSpec(
+            field=aggregate,
+            query=query,
+            environment=environment,
+            groupbys=groupbys,
+            spec_type=spec_type,
+        ).is_project_dependent:
+            return None
+    except Exception:
+        # Let the generation of the specs report the error.
+        return None
+
+    spec_versions = [
+        [spec_version.version, sorted(spec_version.flags)]
+        for spec_version in OnDemandMetricSpecVersioning.get_spec_versions()
+    ]
+    inputs = json.dumps(
+        [
+            _METRIC_SPECS_CACHE_VERSION,
+            dataset,
+            aggregate,
+            query,
+            environment,
+            prefilling,
+            spec_type.value,
+            list(groupbys or ()),
+            spec_versions,
+        ]
+    )
+    digest = hashlib.sha256(inputs.encode()).hexdigest()
+    return f"on-demand.metric-specs.{project.organization_id}.{digest}"
+
+
+def _generate_metric_specs_for_versions(
+    project: Project,
+    dataset: str,
+    aggregate: str,
+    query: str,
+    environment: str | None,
+    prefilling: bool,
+    spec_type: MetricSpecType,
+    groupbys: Sequence[str] | None,
+) -> tuple[list[HashedMetricSpec], bool]:
+    """
+    Generates the metric specs of all supported spec versions. Returns the specs and whether
+    all of them could be generated.
+    """
     metric_specs_and_hashes = []
+    complete = True
     extra = {
         "dataset": dataset,
         "aggregate": aggregate,
@@ -823,12 +935,14 @@ def _convert_aggregate_and_query_to_metrics(
                     "on_demand_metrics.invalid_metric_spec", tags={"prefilling": prefilling}
                 )
                 logger.exception("Invalid on-demand metric spec", extra=extra)
+                complete = False
             except Exception:
                 # Since prefilling might include several non-ondemand-compatible alerts, we want to not trigger errors in the
                 metrics.incr("on_demand_metrics.invalid_metric_spec.other")
                 logger.exception("Failed on-demand metric spec creation.", extra=extra)
+                complete = False
 
-    return metric_specs_and_hashes
+    return metric_specs_and_hashes, complete
 
 
 # CONDITIONAL TAGGING
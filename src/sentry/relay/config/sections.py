@@ -0,0 +1,149 @@
+"""
+Independently cached sections of project configs.
+
+Building some sections of a project config is expensive, but most invalidations only change
+the inputs of a few of them. Each cached section declares the dependencies it is built from,
+and an invalidation only rebuilds the sections depending on what its trigger changed. The other
+sections are reused from the cache and merged into the new config.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection
+from typing import Any, TypeVar
+
+from sentry import options
+from sentry.models.project import Project
+from sentry.relay.config.experimental import TimeChecker
+from sentry.utils import metrics
+from sentry.utils.cache import cache
+
+T = TypeVar("T")
+
+#: Dependencies of config sections, changed by invalidation triggers.
+ORGANIZATION_OPTIONS = "organization_options"
+PROJECT_OPTIONS = "project_options"
+DASHBOARDS = "dashboards"
+ALERT_RULES = "alert_rules"
+DYNAMIC_SAMPLING = "dynamic_sampling"
+
+#: The config keys which are cached as sections, with the dependencies they are built from.
+#: A section with no dependencies is only rebuilt by unknown triggers or when it expires.
+SECTION_DEPENDENCIES: dict[str, frozenset[str]] = {
+    "sampling": frozenset({DYNAMIC_SAMPLING, PROJECT_OPTIONS, ORGANIZATION_OPTIONS}),
+    "metrics": frozenset({PROJECT_OPTIONS, ORGANIZATION_OPTIONS}),
+    "metricExtraction": frozenset({DASHBOARDS, ALERT_RULES}),
+    "performanceScore": frozenset(),
+    "filterSettings": frozenset({PROJECT_OPTIONS}),
+}
+
+#: Prefixes of invalidation triggers, with the dependencies changed by them. Triggers which
+#: are not listed here may change anything and rebuild all sections.
+TRIGGER_DEPENDENCIES: list[tuple[str, frozenset[str]]] = [
+    ("projectoption.", frozenset({PROJECT_OPTIONS})),
+    ("organizationoption.", frozenset({ORGANIZATION_OPTIONS})),
+    ("dashboards:", frozenset({DASHBOARDS})),
+    ("alerts:", frozenset({ALERT_RULES})),
+    ("dynamic_sampling", frozenset({DYNAMIC_SAMPLING})),
+    ("releaseproject.", frozenset({DYNAMIC_SAMPLING})),
+    ("teamkeytransaction.", frozenset({DYNAMIC_SAMPLING})),
+    # Project keys only change the public keys and quotas, which are never cached.
+    ("projectkey.", frozenset()),
+]
+
+
+def get_trigger_dependencies(trigger: str | None) -> frozenset[str] | None:
+    """
+    Returns the dependencies changed by an invalidation trigger, or None if the trigger may
+    have changed any of them.
+    """
+    if trigger is None:
+        return None
+    for prefix, dependencies in TRIGGER_DEPENDENCIES:
+        if trigger.startswith(prefix):
+            return dependencies
+    return None
+
+
+def _section_cache_key(project_id: int, section: str) -> str:
+    return f"relayconfig-section:{project_id}:{section}"
+
+
+class ConfigSections:
+    """
+    Builds the cached sections of the project configs computed together, e.g. by a single
+    invalidation task.
+
+    Sections depending on any of the `stale_dependencies` are rebuilt, all of them are rebuilt
+    when they are None. Other sections are reused from the cache if present. A section is
+    built at most once per project, so it is shared between all the keys of a project.
+    """
+
+    def __init__(
+        self, stale_dependencies: Collection[str] | None = None, use_cache: bool = True
+    ) -> None:
+        self.stale_dependencies = (
+            None if stale_dependencies is None else frozenset(stale_dependencies)
+        )
+        self.use_cache = use_cache and options.get("relay.project-config-sections.enabled")
+        self.built = 0
+        self.reused = 0
+        self._sections: dict[tuple[int, str], Any] = {}
+
+    def is_stale(self, section: str) -> bool:
+        if self.stale_dependencies is None:
+            return True
+        return not SECTION_DEPENDENCIES[section].isdisjoint(self.stale_dependencies)
+
+    def get_or_build(self, section: str, project: Project, build: Callable[[], T]) -> T:
+        """
+        Returns the section of the project config, building it with `build` unless it can be
+        reused. Exceptions raised by `build` are propagated and nothing is cached.
+        """
+        if not self.use_cache:
+            return build()
+
+        key = (project.id, section)
+        if key in self._sections:
+            return self._sections[key]
+
+        cache_key = _section_cache_key(project.id, section)
+        if not self.is_stale(section):
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self.reused += 1
+                metrics.incr("relay.config.section", tags={"section": section, "action": "reuse"})
+                self._sections[key] = cached["value"]
+                return cached["value"]
+
+        with metrics.timer("relay.config.section.duration", tags={"section": section}):
+            value = build()
+        self.built += 1
+        metrics.incr("relay.config.section", tags={"section": section, "action": "build"})
+
+        # Wrapped so that sections built as None are cached as well.
+        cache.set(cache_key, {"value": value}, options.get("relay.project-config-sections.ttl"))
+        self._sections[key] = value
+        return value
+
+    def builder(
+        self, section: str, function: Callable[..., T]
+    ) -> Callable[[TimeChecker, Project], T]:
+        """
+        Wraps a config builder taking a timeout and the project, as used with
+        `add_experimental_config`, so that its result is cached as a section.
+        """
+
+        def build(timeout: TimeChecker, project: Project, *args: Any, **kwargs: Any) -> T:
+            return self.get_or_build(
+                section, project, lambda: function(timeout, project, *args, **kwargs)
+            )
+
+        return build
+
+    @property
+    def reuse_ratio(self) -> float | None:
+        total = self.built + self.reused
+        if not total:
+            return None
+        return self.reused / total
@@ -82,6 +82,15 @@ class RedisProjectConfigCache(ProjectConfigCache):
             return json.loads(rv)
         return None
 
+    def exists_many(self, public_keys) -> set[str]:
+        """Returns the public keys which have a config in the cache."""
+        public_keys = list(public_keys)
+        # Note: Those are multiple pipelines, one per cluster node.
+        p = self.cluster_read.pipeline(transaction=False)
+        for public_key in public_keys:
+            p.exists(self.__get_redis_key(public_key))
+        return {public_key for public_key, exists in zip(public_keys, p.execute()) if exists}
+
     def get_rev(self, public_key) -> str | None:
         if value := self.cluster_read.get(self.__get_redis_rev_key(public_key)):
             return value.decode()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import abc
+import itertools
 import logging
 import multiprocessing
+import time
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from concurrent.futures import ThreadPoolExecutor, wait
 from functools import partial
 from typing import Generic, Literal, TypeVar
@@ -53,6 +55,19 @@ class ResultProcessor(abc.ABC, Generic[T, U]):
         except self.subscription_model.DoesNotExist:
             return None
 
+    def get_subscriptions(self, results: Sequence[T]) -> dict[str, U]:
+        """
+        Fetches the subscriptions of many results at once, keyed by subscription id.
+        """
+        subscription_ids = {self.get_subscription_id(result) for result in results}
+        return {
+            subscription.subscription_id: subscription
+            for subscription in self.subscription_model.objects.filter(
+                subscription_id__in=subscription_ids
+            )
+            if subscription.subscription_id is not None
+        }
+
     @abc.abstractmethod
     def get_subscription_id(self, result: T) -> str:
         pass
@@ -61,6 +76,18 @@ class ResultProcessor(abc.ABC, Generic[T, U]):
     def handle_result(self, subscription: U | None, result: T):
         pass
 
+    def handle_results(self, results: Sequence[tuple[U | None, T]]):
+        """
+        Handles the results of distinct subscriptions together, used in batched mode.
+        Processors may override this to share work between the results, by default each
+        result is handled on its own.
+        """
+        for subscription, result in results:
+            try:
+                self.handle_result(subscription, result)
+            except Exception:
+                logger.exception("Failed to process message result")
+
 
 class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T, U]):
     parallel_executor: ThreadPoolExecutor | None = None
@@ -85,13 +112,19 @@ class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T,
     Does the consumer process all messages in parallel.
     """
 
+    batched = False
+    """
+    Does the consumer process batches of messages together, sharing lookups and writes
+    between the results of unrelated subscriptions.
+    """
+
     multiprocessing_pool: MultiprocessingPool | None = None
     input_block_size: int | None = None
     output_block_size: int | None = None
 
     def __init__(
         self,
-        mode: Literal["batched-parallel", "parallel", "serial"] = "serial",
+        mode: Literal["batched", "batched-parallel", "parallel", "serial"] = "serial",
         max_batch_size: int | None = None,
         max_batch_time: int | None = None,
         max_workers: int | None = None,
@@ -108,6 +141,8 @@ class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T,
                 metric_tags["workers"] = "default"
             else:
                 metric_tags["workers"] = str(max_workers)
+        if mode == "batched":
+            self.batched = True
         if mode == "parallel":
             self.parallel = True
             if num_processes is None:
@@ -181,6 +216,8 @@ class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T,
     ) -> ProcessingStrategy[KafkaPayload]:
         if self.batched_parallel:
             return self.create_thread_parallel_worker(commit)
+        if self.batched:
+            return self.create_batched_worker(commit)
         if self.parallel:
             return self.create_multiprocess_worker(commit)
         else:
@@ -216,6 +253,17 @@ class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T,
             next_step=batch_processor,
         )
 
+    def create_batched_worker(self, commit: Commit) -> ProcessingStrategy[KafkaPayload]:
+        batch_processor = RunTask(
+            function=self.process_batch_together,
+            next_step=CommitOffsets(commit),
+        )
+        return BatchStep(
+            max_batch_size=self.max_batch_size,
+            max_batch_time=self.max_batch_time,
+            next_step=batch_processor,
+        )
+
     def partition_message_batch(self, message: Message[ValuesBatch[KafkaPayload]]) -> list[list[T]]:
         """
         Takes a batch of messages and partitions them based on the `build_payload_grouping_key` method.
@@ -287,3 +335,47 @@ class ResultsStrategyFactory(ProcessingStrategyFactory[KafkaPayload], Generic[T,
         """
         for item in items:
             self.result_processor(item)
+
+    def process_batch_together(self, message: Message[ValuesBatch[KafkaPayload]]):
+        """
+        Receives batches of messages and processes them together in the consumer thread. The
+        subscriptions of the whole batch are fetched at once, then the results are handed to
+        `ResultProcessor.handle_results` in rounds. Each round holds at most one result of each
+        group built by `build_payload_grouping_key`, so results within a group are still
+        processed in order.
+        """
+        start = time.monotonic()
+        partitioned_values = self.partition_message_batch(message)
+        results = [result for group in partitioned_values for result in group]
+        if not results:
+            return
+
+        with sentry_sdk.start_transaction(
+            op="process_batch", name=f"monitors.{self.identifier}.result_consumer"
+        ):
+            subscriptions = self.result_processor.get_subscriptions(results)
+            for round_results in itertools.zip_longest(*partitioned_values):
+                self.result_processor.handle_results(
+                    [
+                        (
+                            subscriptions.get(self.result_processor.get_subscription_id(result)),
+                            result,
+                        )
+                        for result in round_results
+                        if result is not None
+                    ]
+                )
+
+        metric_tags = {"identifier": self.identifier, "mode": self.mode}
+        metrics.incr(
+            "remote_subscriptions.result_consumer.batch.results",
+            len(results),
+            tags=metric_tags,
+        )
+        duration = time.monotonic() - start
+        if duration > 0:
+            metrics.distribution(
+                "remote_subscriptions.result_consumer.batch.throughput",
+                len(results) / duration,
+                tags=metric_tags,
+            )
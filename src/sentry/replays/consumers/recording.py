@@ -1,16 +1,33 @@
 import dataclasses
+import time
+from collections import Counter
 from collections.abc import Mapping
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Literal
 
 import sentry_sdk
 from arroyo.backends.kafka.consumer import KafkaPayload
 from arroyo.processing.strategies import RunTask, RunTaskInThreads
 from arroyo.processing.strategies.abstract import ProcessingStrategy, ProcessingStrategyFactory
+from arroyo.processing.strategies.batching import BatchStep, ValuesBatch
 from arroyo.processing.strategies.commit import CommitOffsets
-from arroyo.types import Commit, Message, Partition
+from arroyo.types import BrokerValue, Commit, Message, Partition
+from django.conf import settings
 from sentry_sdk.tracing import Span
 
-from sentry.replays.usecases.ingest import ingest_recording
+from sentry.replays.usecases.ingest import (
+    DropSilently,
+    ProcessedRecordingMessage,
+    emit_recording_message_events,
+    ingest_recording,
+    parse_recording_message,
+    process_recording_message,
+    store_recording_message,
+    track_recording_metadata,
+)
+from sentry.replays.usecases.ingest.event_logger import flush_click_events
+from sentry.utils import metrics
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
 
 
@@ -41,6 +58,7 @@ class ProcessReplayRecordingStrategyFactory(ProcessingStrategyFactory[KafkaPaylo
         output_block_size: int | None,
         num_threads: int = 4,  # Defaults to 4 for self-hosted.
         force_synchronous: bool = False,  # Force synchronous runner (only used in test suite).
+        mode: Literal["default", "batched-parallel"] = "default",
     ) -> None:
         # For information on configuring this consumer refer to this page:
         #   https://getsentry.github.io/arroyo/strategies/run_task_with_multiprocessing.html
@@ -54,12 +72,30 @@ class ProcessReplayRecordingStrategyFactory(ProcessingStrategyFactory[KafkaPaylo
         self.force_synchronous = force_synchronous
         self.pool = MultiprocessingPool(num_processes) if self.use_processes else None
 
+        # In batched-parallel mode messages are collected into batches which are processed as a
+        # whole. Segment uploads are spread over the thread pool and offsets are committed once
+        # every message of the batch has been handled.
+        self.batched_parallel = mode == "batched-parallel"
+        self.parallel_executor = (
+            ThreadPoolExecutor(max_workers=num_threads) if self.batched_parallel else None
+        )
+
     def create_with_partitions(
         self,
         commit: Commit,
         partitions: Mapping[Partition, int],
     ) -> ProcessingStrategy[KafkaPayload]:
-        if self.force_synchronous:
+        if self.batched_parallel:
+            assert self.parallel_executor is not None
+            return BatchStep(
+                max_batch_size=self.max_batch_size,
+                max_batch_time=self.max_batch_time,
+                next_step=RunTask(
+                    function=partial(process_batch, self.parallel_executor),
+                    next_step=CommitOffsets(commit),
+                ),
+            )
+        elif self.force_synchronous:
             return RunTask(
                 function=process_message,
                 next_step=CommitOffsets(commit),
@@ -87,8 +123,93 @@ class ProcessReplayRecordingStrategyFactory(ProcessingStrategyFactory[KafkaPaylo
     def shutdown(self) -> None:
         if self.pool:
             self.pool.close()
+        if self.parallel_executor:
+            self.parallel_executor.shutdown()
 
 
 def process_message(message: Message[KafkaPayload]) -> Any:
     """Move the replay payload to permanent storage."""
     ingest_recording(message.payload.value)
+
+
+def process_batch(
+    executor: ThreadPoolExecutor, message: Message[ValuesBatch[KafkaPayload]]
+) -> None:
+    """
+    Receives batches of recording messages. Messages are decoded and processed serially, their
+    segments are then uploaded to storage concurrently using the executor. Replay events of the
+    whole batch are published afterwards and flushed once.
+
+    As with single messages, only messages raising `DropSilently` are skipped. Other errors are
+    raised, storage errors once every upload of the batch is done, so the batch is not committed
+    and will be consumed again. Storing a segment is idempotent so re-processing a partially
+    stored batch is safe.
+    """
+    batch = message.payload
+
+    partition_counts: Counter[int] = Counter()
+    for item in batch:
+        assert isinstance(item, BrokerValue)
+        partition_counts[item.partition.index] += 1
+
+    for partition, count in partition_counts.items():
+        metrics.incr(
+            "replays.recording_consumer.batch.messages",
+            amount=count,
+            tags={"partition": str(partition)},
+        )
+    metrics.gauge("replays.recording_consumer.batch.size", len(batch))
+
+    with sentry_sdk.start_transaction(
+        name="replays.consumer.recording.process_batch",
+        op="replays.consumer.recording",
+        custom_sampling_context={
+            "sample_rate": getattr(settings, "SENTRY_REPLAY_RECORDINGS_CONSUMER_APM_SAMPLING", 0)
+        },
+    ):
+        start = time.monotonic()
+
+        with metrics.timer("replays.recording_consumer.batch.process_duration"):
+            recordings = [
+                recording
+                for recording in (_process_batch_item(item.payload.value) for item in batch)
+                if recording is not None
+            ]
+
+        with metrics.timer("replays.recording_consumer.batch.store_duration"):
+            futures = [executor.submit(_store_batch_item, recording) for recording in recordings]
+            wait(futures)
+            for future in futures:
+                future.result()
+
+        with metrics.timer("replays.recording_consumer.batch.emit_duration"):
+            for recording in recordings:
+                with sentry_sdk.isolation_scope():
+                    try:
+                        emit_recording_message_events(recording, flush=False)
+                    except DropSilently:
+                        pass
+            flush_click_events()
+
+        for recording in recordings:
+            track_recording_metadata(recording)
+
+        duration = time.monotonic() - start
+        metrics.distribution("replays.recording_consumer.batch.duration", duration, unit="second")
+        if duration > 0:
+            metrics.gauge("replays.recording_consumer.batch.throughput", len(batch) / duration)
+
+
+def _process_batch_item(value: bytes) -> ProcessedRecordingMessage | None:
+    # Each message gets its own isolation scope so that tags set while processing it do not
+    # leak into the next one.
+    with sentry_sdk.isolation_scope():
+        try:
+            return process_recording_message(parse_recording_message(value))
+        except DropSilently:
+            return None
+
+
+def _store_batch_item(recording: ProcessedRecordingMessage) -> None:
+    with sentry_sdk.isolation_scope():
+        store_recording_message(recording)
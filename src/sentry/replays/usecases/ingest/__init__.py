@@ -36,7 +36,11 @@ from sentry.replays.usecases.ingest.event_logger import (
     report_hydration_error,
     report_rage_click,
 )
-from sentry.replays.usecases.ingest.event_parser import ParsedEventMeta, parse_events
+from sentry.replays.usecases.ingest.event_parser import (
+    ParsedEventMeta,
+    parse_events,
+    parse_events_from_bytes,
+)
 from sentry.replays.usecases.pack import pack
 from sentry.signals import first_replay_received
 from sentry.utils import json, metrics
@@ -328,9 +332,15 @@ def emit_replay_events(
     replay_id: str,
     retention_days: int,
     replay_event: dict[str, Any] | None,
+    flush: bool = True,
 ) -> None:
     emit_click_events(
-        event_meta.click_events, project.id, replay_id, retention_days, start_time=time.time()
+        event_meta.click_events,
+        project.id,
+        replay_id,
+        retention_days,
+        start_time=time.time(),
+        flush=flush,
     )
     emit_request_response_metrics(event_meta)
     log_canvas_size(event_meta, org_id, project.id, replay_id)
@@ -425,9 +435,23 @@ def process_recording_message(message: RecordingIngestMessage) -> ProcessedRecor
 
 @sentry_sdk.trace
 def commit_recording_message(recording: ProcessedRecordingMessage) -> None:
+    store_recording_message(recording)
+    emit_recording_message_events(recording)
+
+
+@sentry_sdk.trace
+def store_recording_message(recording: ProcessedRecordingMessage) -> None:
     # Write to GCS.
     storage_kv.set(recording.filename, recording.filedata)
 
+
+@sentry_sdk.trace
+def emit_recording_message_events(recording: ProcessedRecordingMessage, flush: bool = True) -> None:
+    """Track billing outcomes and emit replay events for a stored recording segment.
+
+    Passing `flush=False` leaves emitted click events in the producer buffer. The caller is
+    responsible for calling `flush_click_events` afterwards.
+    """
     try:
         project = Project.objects.get_from_cache(id=recording.project_id)
         assert isinstance(project, Project)
@@ -461,6 +485,7 @@ def commit_recording_message(recording: ProcessedRecordingMessage) -> None:
             recording.replay_id,
             recording.retention_days,
             recording.replay_event,
+            flush=flush,
         )
 
 
@@ -506,6 +531,8 @@ def parse_replay_events(
     message: RecordingIngestMessage, headers: RecordingSegmentHeaders, segment_bytes: bytes
 ) -> ParsedEventMeta | None:
     try:
+        if options.get("replay.recording.streaming-parser.enabled"):
+            return parse_events_from_bytes(segment_bytes)
         return parse_events(json.loads(segment_bytes))
     except Exception:
         logging.exception(
@@ -27,6 +27,7 @@ def emit_click_events(
     replay_id: str,
     retention_days: int,
     start_time: float,
+    flush: bool = True,
 ) -> None:
     clicks: list[ReplayActionsEventPayloadClick] = [
         {
@@ -66,7 +67,13 @@ def emit_click_events(
 
     publisher = _initialize_publisher()
     publisher.publish("ingest-replay-events", json.dumps(action))
-    publisher.flush()
+    if flush:
+        publisher.flush()
+
+
+def flush_click_events() -> None:
+    """Flush click events which were emitted without flushing."""
+    _initialize_publisher().flush()
 
 
 @sentry_sdk.trace
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import random
+import re
+from collections.abc import Container, Iterable, Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -50,12 +52,88 @@ class ParsedEventMeta:
     request_response_sizes: list[tuple[Any, Any]]
 
 
+# RRWeb event types.
+EVENT_TYPE_INCREMENTAL_SNAPSHOT = 3
+EVENT_TYPE_CUSTOM = 5
+
+# A JSON string or a single structural character. Strings are consumed as a whole so brackets
+# inside of them are never mistaken for structure.
+_JSON_TOKEN_RE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]', re.S)
+_JSON_INTEGER_VALUE_RE = re.compile(rb"\s*:\s*(-?\d+)")
+_QUOTE, _OPEN_ARRAY, _CLOSE_ARRAY, _OPEN_OBJECT, _CLOSE_OBJECT = b'"[]{}'
+
+
 @sentry_sdk.trace
-def parse_events(events: list[dict[str, Any]]) -> ParsedEventMeta:
+def parse_events(events: Iterable[dict[str, Any]]) -> ParsedEventMeta:
     return _parse_events(events, sampled=random.randint(0, 499) < 1)
 
 
-def _parse_events(events: list[dict[str, Any]], sampled: bool) -> ParsedEventMeta:
+@sentry_sdk.trace
+def parse_events_from_bytes(segment: bytes) -> ParsedEventMeta:
+    """Parse the indexed events out of a decompressed recording segment.
+
+    Unlike `parse_events` the segment is never deserialized as a whole. Only the events which
+    are indexed are materialized, full snapshots and DOM mutations are skipped over.
+    """
+    sampled = random.randint(0, 499) < 1
+    if sampled:
+        event_types: Container[int] = (EVENT_TYPE_INCREMENTAL_SNAPSHOT, EVENT_TYPE_CUSTOM)
+    else:
+        event_types = (EVENT_TYPE_CUSTOM,)
+
+    return _parse_events(iter_events(segment, event_types), sampled=sampled)
+
+
+def iter_events(segment: bytes, event_types: Container[int]) -> Iterator[dict[str, Any]]:
+    """Yield the events of a JSON encoded RRWeb segment matching the given event types.
+
+    The segment is scanned for the boundaries of its top-level objects and only objects whose
+    "type" key matches are deserialized. The structure of the segment is validated but the
+    contents of skipped events are not. Raises ValueError if the segment is malformed.
+    """
+    stack = bytearray()
+    start = 0
+    event_type: int | None = None
+    closed = False
+
+    for match in _JSON_TOKEN_RE.finditer(segment):
+        if closed:
+            raise ValueError("Unexpected data after the JSON array")
+
+        token = match.group()
+        char = token[0]
+
+        if char == _OPEN_ARRAY or char == _OPEN_OBJECT:
+            if not stack and char != _OPEN_ARRAY:
+                raise ValueError("Expected a JSON array")
+            stack.append(char)
+            if len(stack) == 2:
+                start = match.start()
+        elif char == _CLOSE_ARRAY or char == _CLOSE_OBJECT:
+            opening = _OPEN_ARRAY if char == _CLOSE_ARRAY else _OPEN_OBJECT
+            if not stack or stack.pop() != opening:
+                raise ValueError("Unbalanced JSON brackets")
+
+            if not stack:
+                closed = True
+            elif len(stack) == 1 and char == _CLOSE_OBJECT:
+                if event_type in event_types:
+                    yield json.loads(segment[start : match.end()])
+                event_type = None
+        elif char == _QUOTE:
+            if not stack:
+                raise ValueError("Expected a JSON array")
+            # The keys of an event are the strings found directly inside of its object.
+            if len(stack) == 2 and stack[1] == _OPEN_OBJECT and token == b'"type"':
+                value = _JSON_INTEGER_VALUE_RE.match(segment, match.end())
+                if value is not None:
+                    event_type = int(value.group(1))
+
+    if not closed:
+        raise ValueError("Incomplete JSON array")
+
+
+def _parse_events(events: Iterable[dict[str, Any]], sampled: bool) -> ParsedEventMeta:
     """Return a list of ClickEvent types.
 
     The node object is a partially destructured HTML element with an additional RRWeb
@@ -4,13 +4,12 @@ import abc
 import contextlib
 import logging
 from collections import defaultdict
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Mapping, Sequence
 from datetime import datetime, timedelta
 from typing import Any, Literal, NotRequired, TypedDict
 
 from django import forms
 from django.core.cache import cache
-from django.db.models import QuerySet
 from django.db.models.enums import TextChoices
 from django.utils import timezone
 from snuba_sdk import Op
@@ -237,15 +236,26 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
         raise NotImplementedError
 
     def batch_query(
-        self, group_ids: set[int], start: datetime, end: datetime, environment_id: int
+        self,
+        group_ids: set[int],
+        start: datetime,
+        end: datetime,
+        environment_id: int,
+        groups: Sequence[_QSTypedDict] | None = None,
     ) -> dict[int, int]:
         """
-        Queries Snuba for a unique condition for multiple groups.
+        Queries Snuba for a unique condition for multiple groups. `groups` may be passed if
+        they were already fetched with `get_groups`.
         """
-        return self.batch_query_hook(group_ids, start, end, environment_id)
+        return self.batch_query_hook(group_ids, start, end, environment_id, groups)
 
     def batch_query_hook(
-        self, group_ids: set[int], start: datetime, end: datetime, environment_id: int
+        self,
+        group_ids: set[int],
+        start: datetime,
+        end: datetime,
+        environment_id: int,
+        groups: Sequence[_QSTypedDict] | None = None,
     ) -> dict[int, int]:
         """
         Abstract method that specifies how to query Snuba for multiple groups
@@ -302,6 +312,7 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
         environment_id: int,
         current_time: datetime,
         comparison_interval: timedelta | None,
+        groups: Sequence[_QSTypedDict] | None = None,
     ) -> dict[int, int]:
         """
         Make a batch query for multiple groups. The return value is a dictionary
@@ -323,9 +334,20 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
                 start=start,
                 end=end,
                 environment_id=environment_id,
+                groups=groups,
             )
         return result
 
+    def get_groups(self, group_ids: set[int]) -> list[_QSTypedDict]:
+        """
+        Fetches the fields of the groups which the batch queries depend on.
+        """
+        return list(
+            Group.objects.filter(id__in=group_ids).values(
+                "id", "type", "project_id", "project__organization_id"
+            )
+        )
+
     def get_snuba_query_result(
         self,
         tsdb_function: Callable[..., Any],
@@ -381,7 +403,7 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
 
     def get_error_and_generic_group_ids(
         self,
-        groups: QuerySet[Group, _QSTypedDict],
+        groups: Sequence[_QSTypedDict],
     ) -> tuple[list[int], list[int]]:
         """
         Separate group ids into error group ids and generic group ids
@@ -399,7 +421,7 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
 
     def get_value_from_groups(
         self,
-        groups: QuerySet[Group, _QSTypedDict] | None,
+        groups: Sequence[_QSTypedDict] | None,
         value: Literal["id", "project_id", "project__organization_id"],
     ) -> int | None:
         result = None
@@ -433,12 +455,16 @@ class EventFrequencyCondition(BaseEventFrequencyCondition):
         return sums[event.group_id]
 
     def batch_query_hook(
-        self, group_ids: set[int], start: datetime, end: datetime, environment_id: int
+        self,
+        group_ids: set[int],
+        start: datetime,
+        end: datetime,
+        environment_id: int,
+        groups: Sequence[_QSTypedDict] | None = None,
     ) -> dict[int, int]:
         batch_sums: dict[int, int] = defaultdict(int)
-        groups = Group.objects.filter(id__in=group_ids).values(
-            "id", "type", "project_id", "project__organization_id"
-        )
+        if groups is None:
+            groups = self.get_groups(group_ids)
         error_issue_ids, generic_issue_ids = self.get_error_and_generic_group_ids(groups)
         organization_id = self.get_value_from_groups(groups, "project__organization_id")
 
@@ -496,12 +522,16 @@ class EventUniqueUserFrequencyCondition(BaseEventFrequencyCondition):
         return totals[event.group_id]
 
     def batch_query_hook(
-        self, group_ids: set[int], start: datetime, end: datetime, environment_id: int
+        self,
+        group_ids: set[int],
+        start: datetime,
+        end: datetime,
+        environment_id: int,
+        groups: Sequence[_QSTypedDict] | None = None,
     ) -> dict[int, int]:
         batch_totals: dict[int, int] = defaultdict(int)
-        groups = Group.objects.filter(id__in=group_ids).values(
-            "id", "type", "project_id", "project__organization_id"
-        )
+        if groups is None:
+            groups = self.get_groups(group_ids)
         error_issue_ids, generic_issue_ids = self.get_error_and_generic_group_ids(groups)
         organization_id = self.get_value_from_groups(groups, "project__organization_id")
 
@@ -582,7 +612,12 @@ class EventUniqueUserFrequencyConditionWithConditions(EventUniqueUserFrequencyCo
         return total[event.group.id]
 
     def batch_query_hook(
-        self, group_ids: set[int], start: datetime, end: datetime, environment_id: int
+        self,
+        group_ids: set[int],
+        start: datetime,
+        end: datetime,
+        environment_id: int,
+        groups: Sequence[_QSTypedDict] | None = None,
     ) -> dict[int, int]:
         logger = logging.getLogger(
             "sentry.rules.event_frequency.EventUniqueUserFrequencyConditionWithConditions"
@@ -610,9 +645,8 @@ class EventUniqueUserFrequencyConditionWithConditions(EventUniqueUserFrequencyCo
                 "EventUniqueUserFrequencyConditionWithConditions does not support filter_match == any"
             )
         batch_totals: dict[int, int] = defaultdict(int)
-        groups = Group.objects.filter(id__in=group_ids).values(
-            "id", "type", "project_id", "project__organization_id"
-        )
+        if groups is None:
+            groups = self.get_groups(group_ids)
         error_issue_ids, generic_issue_ids = self.get_error_and_generic_group_ids(groups)
         organization_id = self.get_value_from_groups(groups, "project__organization_id")
 
@@ -898,11 +932,15 @@ class EventFrequencyPercentCondition(BaseEventFrequencyCondition):
         return 0
 
     def batch_query_hook(
-        self, group_ids: set[int], start: datetime, end: datetime, environment_id: int
+        self,
+        group_ids: set[int],
+        start: datetime,
+        end: datetime,
+        environment_id: int,
+        groups: Sequence[_QSTypedDict] | None = None,
     ) -> dict[int, int]:
-        groups = Group.objects.filter(id__in=group_ids).values(
-            "id", "type", "project_id", "project__organization_id"
-        )
+        if groups is None:
+            groups = self.get_groups(group_ids)
         project_id = self.get_value_from_groups(groups, "project_id")
 
         if not project_id:
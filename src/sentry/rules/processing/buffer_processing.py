@@ -2,6 +2,7 @@ import logging
 import math
 import uuid
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from itertools import islice
@@ -13,7 +14,9 @@ from sentry import buffer, options
 from sentry.buffer.base import BufferField
 from sentry.buffer.redis import BufferHookEvent, redis_buffer_registry
 from sentry.db import models
+from sentry.models.project import Project
 from sentry.utils import metrics
+from sentry.utils.iterators import chunked
 from sentry.utils.registry import NoRegistrationExistsError, Registry
 
 logger = logging.getLogger("sentry.delayed_processing")
@@ -47,6 +50,15 @@ class DelayedProcessingBase(ABC):
     def processing_task(self) -> Task:
         raise NotImplementedError
 
+    @property
+    def bulk_processing_task(self) -> Task | None:
+        """
+        An optional task processing multiple projects of one organization at
+        once. It is called with a list of project IDs whose buffers each fit
+        into a single batch.
+        """
+        return None
+
 
 delayed_processing_registry = Registry[type[DelayedProcessingBase]]()
 
@@ -71,7 +83,9 @@ def bucket_num_groups(num_groups: int) -> str:
     return "1"
 
 
-def process_in_batches(project_id: int, processing_type: str) -> None:
+def process_in_batches(
+    project_id: int, processing_type: str, bulk_project_ids: list[int] | None = None
+) -> None:
     """
     This will check the number of alertgroup_to_event_data items in the Redis buffer for a project.
 
@@ -85,6 +99,10 @@ def process_in_batches(project_id: int, processing_type: str) -> None:
     redis doesn't maintain the sort order of the hash keys.
 
     `processing_task` will fetch the batch from redis and process the rules.
+
+    If `bulk_project_ids` is given, a project whose items fit into a single
+    batch is appended to it instead of being scheduled, so that the caller can
+    process it together with other projects.
     """
     batch_size = options.get("delayed_processing.batch_size")
     should_emit_logs = options.get("delayed_processing.emit_logs")
@@ -106,6 +124,9 @@ def process_in_batches(project_id: int, processing_type: str) -> None:
     )
 
     if event_count < batch_size:
+        if bulk_project_ids is not None:
+            bulk_project_ids.append(project_id)
+            return None
         return task.delay(project_id)
 
     if should_emit_logs:
@@ -154,11 +175,46 @@ def process_buffer() -> None:
                 log_name = f"{processing_type}.project_id_list"
                 logger.info(log_name, extra={"project_ids": log_str})
 
+            bulk_project_ids: list[int] | None = None
+            if options.get("delayed_processing.bulk_evaluation.enabled"):
+                bulk_project_ids = []
+
             for project_id, _ in project_ids:
-                process_in_batches(project_id, processing_type)
+                process_in_batches(project_id, processing_type, bulk_project_ids)
+
+            if bulk_project_ids:
+                process_in_bulk(bulk_project_ids, processing_type)
 
             buffer.backend.delete_key(handler.buffer_key, min=0, max=fetch_time.timestamp())
 
 
+def process_in_bulk(project_ids: list[int], processing_type: str) -> None:
+    """
+    Schedules the processing of projects which fit into a single batch,
+    grouped by organization, using the bulk processing task when the handler
+    provides one.
+    """
+    handler = delayed_processing_registry.get(processing_type)
+    max_projects = options.get("delayed_processing.bulk_evaluation.max_projects")
+
+    org_to_project_ids: defaultdict[int, list[int]] = defaultdict(list)
+    for project_id, organization_id in Project.objects.filter(id__in=project_ids).values_list(
+        "id", "organization_id"
+    ):
+        org_to_project_ids[organization_id].append(project_id)
+
+    metrics.incr(f"{processing_type}.bulk.num_orgs", amount=len(org_to_project_ids))
+
+    for org_project_ids in org_to_project_ids.values():
+        for project_id_chunk in chunked(org_project_ids, max_projects):
+            processing_info = handler(project_id_chunk[0])
+            bulk_task = processing_info.bulk_processing_task
+            if bulk_task is not None and len(project_id_chunk) > 1:
+                bulk_task.delay(project_id_chunk)
+            else:
+                for project_id in project_id_chunk:
+                    handler(project_id).processing_task.delay(project_id)
+
+
 if not redis_buffer_registry.has(BufferHookEvent.FLUSH):
     redis_buffer_registry.add_handler(BufferHookEvent.FLUSH, process_buffer)
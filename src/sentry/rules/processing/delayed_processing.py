@@ -2,14 +2,17 @@ import logging
 import random
 import uuid
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import Any, DefaultDict, NamedTuple
 
 from celery import Task
+from django.db import connections
 from django.db.models import OuterRef, Subquery
 
-from sentry import buffer, nodestore
+from sentry import buffer, nodestore, options
 from sentry.buffer.base import BufferField
 from sentry.db import models
 from sentry.eventstore.models import Event, GroupEvent
@@ -25,7 +28,9 @@ from sentry.rules.conditions.event_frequency import (
     DEFAULT_COMPARISON_INTERVAL,
     BaseEventFrequencyCondition,
     ComparisonType,
+    EventFrequencyCondition,
     EventFrequencyConditionData,
+    EventUniqueUserFrequencyCondition,
     percent_increase,
 )
 from sentry.rules.processing.buffer_processing import (
@@ -53,6 +58,12 @@ logger = logging.getLogger("sentry.rules.delayed_processing")
 EVENT_LIMIT = 100
 COMPARISON_INTERVALS_VALUES = {k: v[1] for k, v in COMPARISON_INTERVALS.items()}
 
+# Conditions whose bulk queries only depend on the group IDs, interval and environment. Their
+# queries can be shared by the rules of all projects within an organization.
+CROSS_PROJECT_CONDITION_IDS = frozenset(
+    [EventFrequencyCondition.id, EventUniqueUserFrequencyCondition.id]
+)
+
 
 class UniqueConditionQuery(NamedTuple):
     """
@@ -309,56 +320,217 @@ def get_group_to_groupevent(
     )
 
 
+def get_condition_instance(
+    unique_condition: UniqueConditionQuery,
+    data_and_groups: DataAndGroups,
+    project: Project,
+) -> BaseEventFrequencyCondition | None:
+    """
+    Instantiates the condition of a unique condition query. Returns None if
+    the condition cannot be queried in bulk.
+    """
+    condition_data, _, rule_id = data_and_groups
+    project_id = project.id
+
+    cls_id = unique_condition.cls_id
+    condition_cls = rules.get(cls_id)
+    if condition_cls is None:
+        logger.warning(
+            "Unregistered condition %r",
+            cls_id,
+            extra={"project_id": project_id},
+        )
+        return None
+
+    if rule_id:
+        # Conditions with filters check the features of the rule's organization.
+        rule = Rule.objects.select_related("project__organization").get(id=rule_id)
+    else:
+        rule = None
+
+    condition_inst = condition_cls(
+        project=project, data=condition_data, rule=rule  # type: ignore[arg-type]
+    )
+
+    if not isinstance(condition_inst, BaseEventFrequencyCondition):
+        logger.warning("Unregistered condition %r", cls_id, extra={"project_id": project_id})
+        return None
+
+    return condition_inst
+
+
+def query_condition(
+    condition_inst: BaseEventFrequencyCondition,
+    unique_condition: UniqueConditionQuery,
+    group_ids: set[int],
+    current_time: datetime,
+    groups: Sequence[Any] | None = None,
+) -> dict[int, int]:
+    """
+    Runs the Snuba query of a single unique condition query. `groups` may be
+    passed if they were already fetched with the condition's `get_groups`.
+    """
+    _, duration = condition_inst.intervals[unique_condition.interval]
+
+    comparison_interval: timedelta | None = None
+    if unique_condition.comparison_interval is not None:
+        comparison_interval = COMPARISON_INTERVALS_VALUES.get(unique_condition.comparison_interval)
+
+    result = safe_execute(
+        condition_inst.get_rate_bulk,
+        duration=duration,
+        group_ids=group_ids,
+        environment_id=unique_condition.environment_id,
+        current_time=current_time,
+        comparison_interval=comparison_interval,
+        groups=groups,
+    )
+    return result or {}
+
+
+def get_condition_query_result(
+    unique_condition: UniqueConditionQuery,
+    data_and_groups: DataAndGroups,
+    project: Project,
+    current_time: datetime,
+) -> dict[int, int] | None:
+    """
+    Runs the Snuba query of a single unique condition query. Returns None if
+    the condition cannot be queried in bulk.
+    """
+    condition_inst = get_condition_instance(unique_condition, data_and_groups, project)
+    if condition_inst is None:
+        return None
+    return query_condition(
+        condition_inst, unique_condition, data_and_groups.group_ids, current_time
+    )
+
+
 def get_condition_group_results(
     condition_groups: dict[UniqueConditionQuery, DataAndGroups], project: Project
 ) -> dict[UniqueConditionQuery, dict[int, int]] | None:
     condition_group_results = {}
     current_time = datetime.now(tz=timezone.utc)
-    project_id = project.id
 
-    for unique_condition, (condition_data, group_ids, rule_id) in condition_groups.items():
-        cls_id = unique_condition.cls_id
-        condition_cls = rules.get(cls_id)
-        if condition_cls is None:
-            logger.warning(
-                "Unregistered condition %r",
-                cls_id,
-                extra={"project_id": project_id},
-            )
-            continue
+    for unique_condition, data_and_groups in condition_groups.items():
+        result = get_condition_query_result(
+            unique_condition, data_and_groups, project, current_time
+        )
+        if result is not None:
+            condition_group_results[unique_condition] = result
 
-        if rule_id:
-            rule = Rule.objects.get(id=rule_id)
-        else:
-            rule = None
+    return condition_group_results
 
-        condition_inst = condition_cls(
-            project=project, data=condition_data, rule=rule  # type: ignore[arg-type]
-        )
 
-        if not isinstance(condition_inst, BaseEventFrequencyCondition):
-            logger.warning("Unregistered condition %r", cls_id, extra={"project_id": project_id})
-            continue
+def _run_threaded_condition_query(query: Callable[[], dict[int, int]]) -> dict[int, int]:
+    try:
+        return query()
+    finally:
+        # Snuba queries look up the projects of the groups they filter on. Connections
+        # are per thread, don't leave them open in the pool.
+        connections.close_all()
+
+
+def get_condition_group_results_bulk(
+    condition_groups_by_project: Mapping[Project, dict[UniqueConditionQuery, DataAndGroups]],
+    max_workers: int,
+) -> dict[int, dict[UniqueConditionQuery, dict[int, int]]]:
+    """
+    Evaluate the unique condition queries of multiple projects at once.
+
+    Queries of conditions in CROSS_PROJECT_CONDITION_IDS are merged across
+    projects of the same organization, so that a single Snuba query is made
+    per condition, interval, environment and comparison interval. All other
+    queries remain scoped to their project. The queries are run concurrently
+    on a pool of up to `max_workers` threads, or on the calling thread if
+    `max_workers` is 1.
+
+    Returns the condition group results of each project by project ID. Group
+    IDs are unique across projects, so merged results may contain the results
+    of other projects' groups. Projects for which a query failed are left out.
+    """
+    current_time = datetime.now(tz=timezone.utc)
+
+    def query_key(project: Project, unique_condition: UniqueConditionQuery) -> tuple[int, int]:
+        if unique_condition.cls_id in CROSS_PROJECT_CONDITION_IDS:
+            return (project.organization_id, 0)
+        return (project.organization_id, project.id)
+
+    merged_queries: dict[
+        tuple[tuple[int, int], UniqueConditionQuery], tuple[Project, DataAndGroups]
+    ] = {}
+    for project, condition_groups in condition_groups_by_project.items():
+        for unique_condition, data_and_groups in condition_groups.items():
+            key = (query_key(project, unique_condition), unique_condition)
+            if merged := merged_queries.get(key):
+                merged[1].group_ids.update(data_and_groups.group_ids)
+            else:
+                merged_queries[key] = (
+                    project,
+                    data_and_groups._replace(group_ids=set(data_and_groups.group_ids)),
+                )
 
-        _, duration = condition_inst.intervals[unique_condition.interval]
+    metrics.incr(
+        "delayed_processing.bulk.condition_queries",
+        amount=len(merged_queries),
+    )
 
-        comparison_interval: timedelta | None = None
-        if unique_condition.comparison_interval is not None:
-            comparison_interval = COMPARISON_INTERVALS_VALUES.get(
-                unique_condition.comparison_interval
+    # Rules and groups are looked up on this thread, only the Snuba queries run in the pool.
+    queries: dict[tuple[tuple[int, int], UniqueConditionQuery], Callable[[], dict[int, int]]] = {}
+    failed_queries: set[tuple[tuple[int, int], UniqueConditionQuery]] = set()
+    for key, (project, data_and_groups) in merged_queries.items():
+        try:
+            condition_inst = get_condition_instance(key[1], data_and_groups, project)
+            if condition_inst is not None:
+                groups = condition_inst.get_groups(data_and_groups.group_ids)
+                queries[key] = partial(
+                    query_condition,
+                    condition_inst,
+                    key[1],
+                    data_and_groups.group_ids,
+                    current_time,
+                    groups,
+                )
+        except Exception:
+            logger.exception(
+                "delayed_processing.bulk.condition_query_failed",
+                extra={"project_id": merged_queries[key][0].id, "condition": key[1].cls_id},
+            )
+            failed_queries.add(key)
+
+    get_results: Mapping[
+        tuple[tuple[int, int], UniqueConditionQuery], Callable[[], dict[int, int]]
+    ] = queries
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                key: executor.submit(_run_threaded_condition_query, query)
+                for key, query in queries.items()
+            }
+        get_results = {key: future.result for key, future in futures.items()}
+
+    query_results: dict[tuple[tuple[int, int], UniqueConditionQuery], dict[int, int]] = {}
+    for key, get_result in get_results.items():
+        try:
+            query_results[key] = get_result()
+        except Exception:
+            logger.exception(
+                "delayed_processing.bulk.condition_query_failed",
+                extra={"project_id": merged_queries[key][0].id, "condition": key[1].cls_id},
             )
+            failed_queries.add(key)
 
-        result = safe_execute(
-            condition_inst.get_rate_bulk,
-            duration=duration,
-            group_ids=group_ids,
-            environment_id=unique_condition.environment_id,
-            current_time=current_time,
-            comparison_interval=comparison_interval,
-        )
-        condition_group_results[unique_condition] = result or {}
+    results: dict[int, dict[UniqueConditionQuery, dict[int, int]]] = {}
+    for project, condition_groups in condition_groups_by_project.items():
+        keys = [
+            (query_key(project, unique_condition), unique_condition)
+            for unique_condition in condition_groups
+        ]
+        if failed_queries.intersection(keys):
+            continue
+        results[project.id] = {key[1]: query_results[key] for key in keys if key in query_results}
 
-    return condition_group_results
+    return results
 
 
 def passes_comparison(
@@ -512,6 +684,24 @@ def apply_delayed(project_id: int, batch_key: str | None = None, *args: Any, **k
     with metrics.timer("delayed_processing.get_condition_group_results.duration"):
         condition_group_results = get_condition_group_results(condition_groups, project)
 
+    fire_delayed_rules(
+        project,
+        rulegroup_to_event_data,
+        rules_to_groups,
+        alert_rules,
+        condition_group_results,
+    )
+    cleanup_redis_buffer(project_id, rules_to_groups, batch_key)
+
+
+def fire_delayed_rules(
+    project: Project,
+    rulegroup_to_event_data: dict[str, str],
+    rules_to_groups: DefaultDict[int, set[int]],
+    alert_rules: list[Rule],
+    condition_group_results: dict[UniqueConditionQuery, dict[int, int]] | None,
+) -> None:
+    project_id = project.id
     rules_to_slow_conditions = defaultdict(list)
     for rule in alert_rules:
         rules_to_slow_conditions[rule].extend(get_slow_conditions(rule))
@@ -531,7 +721,85 @@ def apply_delayed(project_id: int, batch_key: str | None = None, *args: Any, **k
     with metrics.timer("delayed_processing.fire_rules.duration"):
         fire_rules(rules_to_fire, parsed_rulegroup_to_event_data, alert_rules, project)
 
-    cleanup_redis_buffer(project_id, rules_to_groups, batch_key)
+
+class ProjectDelayedRules(NamedTuple):
+    project: Project
+    rulegroup_to_event_data: dict[str, str]
+    rules_to_groups: DefaultDict[int, set[int]]
+    alert_rules: list[Rule]
+    condition_groups: dict[UniqueConditionQuery, DataAndGroups]
+
+
+@instrumented_task(
+    name="sentry.rules.processing.delayed_processing_bulk",
+    queue="delayed_rules",
+    default_retry_delay=5,
+    max_retries=5,
+    # Processes up to delayed_processing.bulk_evaluation.max_projects projects.
+    soft_time_limit=170,
+    time_limit=180,
+    silo_mode=SiloMode.REGION,
+)
+def apply_delayed_bulk(project_ids: list[int], *args: Any, **kwargs: Any) -> None:
+    """
+    Like `apply_delayed` for multiple projects of the same organization whose
+    buffers each fit in a single batch. Compatible condition queries of all
+    projects are merged and evaluated concurrently.
+
+    Failures are logged per project. The buffer of a project that failed is
+    kept, so that it is processed again by the next run.
+    """
+    projects_rules: list[ProjectDelayedRules] = []
+    with metrics.timer("delayed_processing.bulk.fetch.duration"):
+        for project_id in project_ids:
+            try:
+                project = fetch_project(project_id)
+                if not project:
+                    continue
+
+                rulegroup_to_event_data = fetch_rulegroup_to_event_data(project_id)
+                rules_to_groups = get_rules_to_groups(rulegroup_to_event_data)
+                alert_rules = fetch_alert_rules(list(rules_to_groups.keys()))
+                condition_groups = get_condition_query_groups(alert_rules, rules_to_groups)
+            except Exception:
+                logger.exception(
+                    "delayed_processing.bulk.fetch_failed", extra={"project_id": project_id}
+                )
+                continue
+            projects_rules.append(
+                ProjectDelayedRules(
+                    project, rulegroup_to_event_data, rules_to_groups, alert_rules, condition_groups
+                )
+            )
+
+    with metrics.timer("delayed_processing.bulk.get_condition_group_results.duration"):
+        condition_group_results = get_condition_group_results_bulk(
+            {
+                project_rules.project: project_rules.condition_groups
+                for project_rules in projects_rules
+            },
+            options.get("delayed_processing.bulk_evaluation.max_workers"),
+        )
+
+    with metrics.timer("delayed_processing.bulk.fire_rules.duration"):
+        for project_rules in projects_rules:
+            project_id = project_rules.project.id
+            if project_id not in condition_group_results:
+                continue
+            try:
+                fire_delayed_rules(
+                    project_rules.project,
+                    project_rules.rulegroup_to_event_data,
+                    project_rules.rules_to_groups,
+                    project_rules.alert_rules,
+                    condition_group_results[project_id],
+                )
+            except Exception:
+                logger.exception(
+                    "delayed_processing.bulk.fire_rules_failed", extra={"project_id": project_id}
+                )
+                continue
+            cleanup_redis_buffer(project_id, project_rules.rules_to_groups, None)
 
 
 @delayed_processing_registry.register("delayed_processing")  # default delayed processing
@@ -546,3 +814,7 @@ class DelayedRule(DelayedProcessingBase):
     @property
     def processing_task(self) -> Task:
         return apply_delayed
+
+    @property
+    def bulk_processing_task(self) -> Task | None:
+        return apply_delayed_bulk
@@ -526,6 +526,11 @@ def bind_cache_to_option_store() -> None:
     from sentry.options import default_store
 
     default_store.set_cache_impl(default_cache)
+    default_store.configure_push_invalidation(
+        enabled=settings.SENTRY_OPTIONS_PUSH_INVALIDATION,
+        check_interval=settings.SENTRY_OPTIONS_VERSION_CHECK_INTERVAL,
+        ttl=settings.SENTRY_OPTIONS_PUSH_TTL,
+    )
 
 
 def apply_legacy_settings(settings: Any) -> None:
@@ -92,7 +92,14 @@ class RegionSiloClient(BaseApiClient):
     logger = logging.getLogger("sentry.silo.client.region")
     silo_client_name = "region"
 
-    def __init__(self, region: Region, retry: bool = False) -> None:
+    def __init__(
+        self, region: Region, retry: bool = False, session: SafeSession | None = None
+    ) -> None:
+        """
+        If a session is given, requests are sent through it instead of a session
+        built for each request. The caller owns the session and is responsible for
+        closing it, see `KeepAliveSession`.
+        """
         super().__init__()
         if SiloMode.get_current_mode() not in self.access_modes:
             access_mode_str = ", ".join(str(m) for m in self.access_modes)
@@ -108,6 +115,7 @@ class RegionSiloClient(BaseApiClient):
         self.region = get_region_by_name(region.name)
         self.base_url = self.region.address
         self.retry = retry
+        self.session = session
 
     def proxy_request(self, incoming_request: HttpRequest) -> HttpResponse:
         """
@@ -179,6 +187,9 @@ class RegionSiloClient(BaseApiClient):
         Generates a safe Requests session for the API client to use.
         This injects a custom is_ipaddress_permitted function to allow only connections to Region Silo IP addresses.
         """
+        if self.session is not None:
+            return self.session
+
         if not self.retry:
             return build_session(
                 is_ipaddress_permitted=validate_region_ip_address,
@@ -1318,6 +1318,11 @@ class OnDemandMetricSpec:
         is extracted."""
         return self._process_query()
 
+    @property
+    def is_project_dependent(self) -> bool:
+        """Whether the metric spec depends on the project it is built for, beyond the query."""
+        return self.op in _ONDEMAND_OP_TO_PROJECT_SPEC_GENERATOR
+
     def tags_conditions(self, project: Project) -> list[TagSpec]:
         """Returns a list of tag conditions that will specify how tags are injected into metrics by Relay, and a bool if those specs may be project specific."""
         tags_specs_generator = _ONDEMAND_OP_TO_SPEC_GENERATOR.get(self.op)
@@ -1,6 +1,8 @@
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import timezone
+from typing import NamedTuple
 
 import sentry_sdk
 from dateutil.parser import parse as parse_date
@@ -17,7 +19,12 @@ from sentry.utils import metrics
 logger = logging.getLogger(__name__)
 TQuerySubscriptionCallable = Callable[[QuerySubscriptionUpdate, QuerySubscription], None]
 
+TQuerySubscriptionBatchCallable = Callable[
+    [Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]]], None
+]
+
 subscriber_registry: dict[str, TQuerySubscriptionCallable] = {}
+batch_subscriber_registry: dict[str, TQuerySubscriptionBatchCallable] = {}
 
 
 def register_subscriber(
@@ -32,6 +39,25 @@ def register_subscriber(
     return inner
 
 
+def register_batch_subscriber(
+    subscriber_key: str,
+) -> Callable[[TQuerySubscriptionBatchCallable], TQuerySubscriptionBatchCallable]:
+    """
+    Registers a handler which processes many updates of the given subscription
+    type at once. The updates are passed in the order they were received.
+    Subscription types without a batch handler fall back to the handler
+    registered with `register_subscriber`, one update at a time.
+    """
+
+    def inner(func: TQuerySubscriptionBatchCallable) -> TQuerySubscriptionBatchCallable:
+        if subscriber_key in batch_subscriber_registry:
+            raise Exception("Batch handler already registered for %s" % subscriber_key)
+        batch_subscriber_registry[subscriber_key] = func
+        return func
+
+    return inner
+
+
 def parse_message_value(
     value: bytes, jsoncodec: Codec[SubscriptionResult]
 ) -> QuerySubscriptionUpdate:
@@ -107,47 +133,14 @@ def handle_message(
                     metrics.incr("snuba_query_subscriber.subscription_inactive")
                     return
         except QuerySubscription.DoesNotExist:
-            metrics.incr(
-                "snuba_query_subscriber.subscription_doesnt_exist", tags={"dataset": dataset}
-            )
-            logger.warning(
-                "Received subscription update, but subscription does not exist",
-                extra={
-                    "offset": message_offset,
-                    "partition": message_partition,
-                    "value": message_value,
-                },
+            _handle_missing_subscription(
+                contents, message_value, message_offset, message_partition, topic, dataset
             )
-            try:
-                if topic in topic_to_dataset:
-                    _delete_from_snuba(
-                        topic_to_dataset[topic],
-                        contents["subscription_id"],
-                        EntityKey(contents["entity"]),
-                    )
-                else:
-                    logger.exception(
-                        "Topic not registered with QuerySubscriptionConsumer, can't remove "
-                        "non-existent subscription from Snuba",
-                        extra={"topic": topic, "subscription_id": contents["subscription_id"]},
-                    )
-            except InvalidMessageError as e:
-                logger.exception(str(e))
-            except Exception:
-                logger.exception("Failed to delete unused subscription from snuba.")
             return
 
         if subscription.type not in subscriber_registry:
-            metrics.incr(
-                "snuba_query_subscriber.subscription_type_not_registered", tags={"dataset": dataset}
-            )
-            logger.error(
-                "Received subscription update, but no subscription handler registered",
-                extra={
-                    "offset": message_offset,
-                    "partition": message_partition,
-                    "value": message_value,
-                },
+            _handle_unregistered_subscription_type(
+                message_value, message_offset, message_partition, dataset
             )
             return
 
@@ -176,6 +169,190 @@ def handle_message(
             callback(contents, subscription)
 
 
+class SubscriptionResultMessage(NamedTuple):
+    value: bytes
+    offset: int
+    partition: int
+
+
+def handle_messages(
+    messages: Sequence[SubscriptionResultMessage],
+    topic: str,
+    dataset: str,
+    jsoncodec: Codec[SubscriptionResult],
+    executor: ThreadPoolExecutor,
+    parallelism: int,
+) -> None:
+    """
+    Batched version of `handle_message`. All messages are parsed and the
+    subscriptions they reference are fetched with a single query. Updates are
+    then grouped by subscription, preserving their order, and the groups are
+    spread over up to `parallelism` tasks run by the executor, so that updates
+    of the same subscription are never processed concurrently or out of order.
+
+    Each task passes the updates of a subscription type to its batch handler
+    when one is registered, see `register_batch_subscriber`, and to the handler
+    registered with `register_subscriber` one update at a time otherwise.
+    """
+    parsed: list[tuple[SubscriptionResultMessage, QuerySubscriptionUpdate]] = []
+    for message in messages:
+        try:
+            with metrics.timer(
+                "snuba_query_subscriber.parse_message_value", tags={"dataset": dataset}
+            ):
+                parsed.append((message, parse_message_value(message.value, jsoncodec)))
+        except InvalidMessageError:
+            logger.exception(
+                "Subscription update could not be parsed",
+                extra={
+                    "offset": message.offset,
+                    "partition": message.partition,
+                    "value": message.value,
+                },
+            )
+
+    if not parsed:
+        return
+
+    with metrics.timer("snuba_query_subscriber.fetch_subscriptions", tags={"dataset": dataset}):
+        subscriptions = {
+            subscription.subscription_id: subscription
+            for subscription in QuerySubscription.objects.filter(
+                subscription_id__in={contents["subscription_id"] for _, contents in parsed}
+            ).select_related("snuba_query", "project")
+        }
+
+    groups: dict[int, list[tuple[QuerySubscriptionUpdate, QuerySubscription]]] = {}
+    for message, contents in parsed:
+        subscription = subscriptions.get(contents["subscription_id"])
+        if subscription is None:
+            _handle_missing_subscription(
+                contents, message.value, message.offset, message.partition, topic, dataset
+            )
+            continue
+        if subscription.status != QuerySubscription.Status.ACTIVE.value:
+            metrics.incr("snuba_query_subscriber.subscription_inactive")
+            continue
+        if subscription.type not in subscriber_registry:
+            _handle_unregistered_subscription_type(
+                message.value, message.offset, message.partition, dataset
+            )
+            continue
+        groups.setdefault(subscription.id, []).append((contents, subscription))
+
+    # Number of subscriptions with updates in this batch
+    metrics.distribution("snuba_query_subscriber.batch.subscriptions", len(groups))
+
+    shards: list[list[tuple[QuerySubscriptionUpdate, QuerySubscription]]] = [
+        [] for _ in range(min(parallelism, len(groups)))
+    ]
+    for i, group in enumerate(groups.values()):
+        shards[i % len(shards)].extend(group)
+
+    futures = [executor.submit(_dispatch_updates, shard, dataset) for shard in shards]
+    wait(futures)
+
+
+def _dispatch_updates(
+    updates: Sequence[tuple[QuerySubscriptionUpdate, QuerySubscription]], dataset: str
+) -> None:
+    updates_by_type: dict[str, list[tuple[QuerySubscriptionUpdate, QuerySubscription]]] = {}
+    for contents, subscription in updates:
+        updates_by_type.setdefault(subscription.type, []).append((contents, subscription))
+
+    for subscription_type, type_updates in updates_by_type.items():
+        with metrics.timer(
+            "snuba_query_subscriber.callback.duration",
+            instance=subscription_type,
+            tags={"dataset": dataset, "batched": "true"},
+        ):
+            if subscription_type in batch_subscriber_registry:
+                try:
+                    batch_subscriber_registry[subscription_type](type_updates)
+                except Exception:
+                    # As in `process_message`, make sure that a failing handler does
+                    # not block the consumer.
+                    logger.exception(
+                        "Unexpected error while handling subscription updates. Skipping updates.",
+                        extra={"subscription_type": subscription_type, "dataset": dataset},
+                    )
+            else:
+                callback = subscriber_registry[subscription_type]
+                for contents, subscription in type_updates:
+                    _dispatch_update(callback, contents, subscription, dataset)
+
+
+def _dispatch_update(
+    callback: TQuerySubscriptionCallable,
+    contents: QuerySubscriptionUpdate,
+    subscription: QuerySubscription,
+    dataset: str,
+) -> None:
+    with sentry_sdk.isolation_scope() as scope:
+        scope.set_tag("project_id", subscription.project_id)
+        scope.set_tag("query_subscription_id", contents["subscription_id"])
+        try:
+            callback(contents, subscription)
+        except Exception:
+            # A failing update must not prevent the following ones from being handled.
+            logger.exception(
+                "Unexpected error while handling subscription update. Skipping update.",
+                extra={"subscription_id": subscription.id, "dataset": dataset},
+            )
+
+
+def _handle_missing_subscription(
+    contents: QuerySubscriptionUpdate,
+    message_value: bytes,
+    message_offset: int,
+    message_partition: int,
+    topic: str,
+    dataset: str,
+) -> None:
+    metrics.incr("snuba_query_subscriber.subscription_doesnt_exist", tags={"dataset": dataset})
+    logger.warning(
+        "Received subscription update, but subscription does not exist",
+        extra={
+            "offset": message_offset,
+            "partition": message_partition,
+            "value": message_value,
+        },
+    )
+    try:
+        if topic in topic_to_dataset:
+            _delete_from_snuba(
+                topic_to_dataset[topic],
+                contents["subscription_id"],
+                EntityKey(contents["entity"]),
+            )
+        else:
+            logger.error(
+                "Topic not registered with QuerySubscriptionConsumer, can't remove "
+                "non-existent subscription from Snuba",
+                extra={"topic": topic, "subscription_id": contents["subscription_id"]},
+            )
+    except InvalidMessageError as e:
+        logger.exception(str(e))
+    except Exception:
+        logger.exception("Failed to delete unused subscription from snuba.")
+
+
+def _handle_unregistered_subscription_type(
+    message_value: bytes, message_offset: int, message_partition: int, dataset: str
+) -> None:
+    metrics.incr(
+        "snuba_query_subscriber.subscription_type_not_registered", tags={"dataset": dataset}
+    )
+    logger.error(
+        "Received subscription update, but no subscription handler registered",
+        extra={
+            "offset": message_offset,
+            "partition": message_partition,
+            "value": message_value,
+        },
+    )
+
+
 class InvalidMessageError(Exception):
     pass
 
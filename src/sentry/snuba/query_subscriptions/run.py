@@ -1,6 +1,10 @@
 import logging
+import os
+import time
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from typing import Literal
 
 import sentry_sdk
 from arroyo.backends.kafka.consumer import KafkaPayload
@@ -10,6 +14,7 @@ from arroyo.processing.strategies import (
     ProcessingStrategyFactory,
     RunTask,
 )
+from arroyo.processing.strategies.batching import BatchStep, ValuesBatch
 from arroyo.types import BrokerValue, Commit, Message, Partition
 from sentry_kafka_schemas import get_codec
 
@@ -33,6 +38,8 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         input_block_size: int | None,
         output_block_size: int | None,
         multi_proc: bool = True,
+        mode: Literal["serial", "batched-parallel"] = "serial",
+        max_workers: int | None = None,
     ):
         self.dataset = Dataset(dataset)
         self.logical_topic = dataset_to_logical_topic[self.dataset]
@@ -43,12 +50,34 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         self.output_block_size = output_block_size
         self.multi_proc = multi_proc
         self.pool = MultiprocessingPool(num_processes)
+        self.parallel_executor: ThreadPoolExecutor | None = None
+        if mode == "batched-parallel":
+            self.parallel_executor = ThreadPoolExecutor(max_workers=max_workers)
+            # Matches the default number of threads of the executor
+            self.parallelism = max_workers or min(32, (os.cpu_count() or 1) + 4)
 
     def create_with_partitions(
         self,
         commit: Commit,
         partitions: Mapping[Partition, int],
     ) -> ProcessingStrategy[KafkaPayload]:
+        if self.parallel_executor is not None:
+            return BatchStep(
+                max_batch_size=self.max_batch_size,
+                max_batch_time=self.max_batch_time,
+                next_step=RunTask(
+                    partial(
+                        process_batch,
+                        self.dataset,
+                        self.topic,
+                        self.logical_topic,
+                        self.parallel_executor,
+                        self.parallelism,
+                    ),
+                    CommitOffsets(commit),
+                ),
+            )
+
         callable = partial(process_message, self.dataset, self.topic, self.logical_topic)
         if self.multi_proc:
             return run_task_with_multiprocessing(
@@ -65,6 +94,8 @@ class QuerySubscriptionStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
 
     def shutdown(self) -> None:
         self.pool.close()
+        if self.parallel_executor is not None:
+            self.parallel_executor.shutdown()
 
 
 def process_message(
@@ -107,3 +138,68 @@ def process_message(
                     "value": message_value,
                 },
             )
+
+
+def process_batch(
+    dataset: Dataset,
+    topic: str,
+    logical_topic: str,
+    executor: ThreadPoolExecutor,
+    parallelism: int,
+    message: Message[ValuesBatch[KafkaPayload]],
+) -> None:
+    """
+    Receives batches of subscription results, see `handle_messages`.
+    """
+    from sentry.snuba.query_subscriptions.consumer import SubscriptionResultMessage, handle_messages
+    from sentry.utils import metrics
+
+    messages = []
+    latest_partition_ts: dict[int, float] = {}
+    partition_counts: dict[int, int] = {}
+    for item in message.payload:
+        assert isinstance(item, BrokerValue)
+        partition = item.partition.index
+        messages.append(SubscriptionResultMessage(item.payload.value, item.offset, partition))
+        partition_counts[partition] = partition_counts.get(partition, 0) + 1
+        latest_partition_ts[partition] = max(
+            latest_partition_ts.get(partition, 0), item.timestamp.timestamp()
+        )
+
+    with (
+        sentry_sdk.start_transaction(
+            op="handle_message",
+            name="query_subscription_consumer_process_batch",
+            custom_sampling_context={"sample_rate": options.get("subscriptions-query.sample-rate")},
+        ),
+        metrics.timer("snuba_query_subscriber.handle_batch", tags={"dataset": dataset.value}),
+    ):
+        try:
+            handle_messages(
+                messages,
+                topic,
+                dataset.value,
+                get_codec(logical_topic),
+                executor,
+                parallelism,
+            )
+        except Exception:
+            # Same failsafe as `process_message`, for the batch as a whole.
+            logger.exception(
+                "Unexpected error while handling batch in QuerySubscriptionStrategy. Skipping batch.",
+                extra={"size": len(messages)},
+            )
+
+    now = time.time()
+    for partition, count in partition_counts.items():
+        tags = {"dataset": dataset.value, "partition": str(partition)}
+        # Number of subscription results processed per partition
+        metrics.incr("snuba_query_subscriber.batch.messages", amount=count, tags=tags)
+        # Time between the latest result of the partition being produced and
+        # it being processed
+        metrics.distribution(
+            "snuba_query_subscriber.batch.lag",
+            now - latest_partition_ts[partition],
+            tags=tags,
+            unit="second",
+        )
@@ -1,6 +1,6 @@
 import logging
 import uuid
-from collections.abc import Mapping, Sequence, Set
+from collections.abc import Sequence
 from copy import deepcopy
 from typing import Any
 
@@ -20,6 +20,7 @@ from sentry.issues.grouptype import PerformanceStreamedSpansGroupTypeExperimenta
 from sentry.issues.issue_occurrence import IssueOccurrence
 from sentry.issues.producer import PayloadType, produce_occurrence_to_kafka
 from sentry.models.project import Project
+from sentry.spans.consumers.process_segments.tree import SpanTree
 from sentry.utils import metrics
 from sentry.utils.dates import to_datetime
 
@@ -59,64 +60,6 @@ def _send_occurrence_to_platform(jobs: Sequence[Job], projects: ProjectsMapping)
             )
 
 
-def build_tree(spans):
-    span_tree = {}
-    root_span_id = None
-
-    for span in spans:
-        span_id = span["span_id"]
-        is_root = span["is_segment"]
-        if is_root:
-            root_span_id = span_id
-        if span_id not in span_tree:
-            span_tree[span_id] = span
-            span_tree[span_id]["children"] = []
-
-    for span in span_tree.values():
-        parent_id = span.get("parent_span_id")
-        if parent_id is not None and parent_id in span_tree:
-            parent_span = span_tree[parent_id]
-            children = parent_span["children"]
-            children.append(span)
-
-    return span_tree, root_span_id
-
-
-def dfs(visited, flattened_spans, tree, span_id):
-    stack = [span_id]
-
-    while len(stack):
-        span_id = stack.pop()
-
-        span = deepcopy(tree[span_id])
-        children = span.pop("children")
-
-        if span_id not in visited:
-            flattened_spans.append(span)
-            tree.pop(span_id)
-            visited.add(span_id)
-
-        for child in sorted(children, key=lambda span: span["start_timestamp"], reverse=True):
-            if child["span_id"] not in visited:
-                stack.append(child["span_id"])
-
-
-def flatten_tree(tree, root_span_id):
-    visited: Set[str] = set()
-    flattened_spans: list[Mapping[str, Any]] = []
-
-    if root_span_id:
-        dfs(visited, flattened_spans, tree, root_span_id)
-
-    # Catch all for orphan spans
-    remaining = sorted(tree.items(), key=lambda span: span[1]["start_timestamp"])
-    for span_id, _ in remaining:
-        if span_id not in visited:
-            dfs(visited, flattened_spans, tree, span_id)
-
-    return flattened_spans
-
-
 def _update_occurrence_group_type(jobs: Sequence[Job], projects: ProjectsMapping) -> None:
     """
     Exclusive to the segments consumer: Updates group type and fingerprint of
@@ -175,8 +118,10 @@ def transform_spans_to_event_dict(spans):
     # So we build a tree and flatten it depth first.
     # TODO: See if we can update the detectors to work without this assumption so we can
     # just pass it a list of spans.
-    tree, root_span_id = build_tree(processed_spans)
-    flattened_spans = flatten_tree(tree, root_span_id)
+    tree = SpanTree(processed_spans)
+    # Shallow copies keep writes from the event pipeline (e.g. span grouping
+    # hashes) out of the spans that are produced downstream.
+    flattened_spans = [dict(span) for span in tree.flatten()]
     event["spans"] = flattened_spans
 
     root_span = flattened_spans[0]
@@ -189,7 +134,7 @@ def transform_spans_to_event_dict(spans):
 
 
 def prepare_event_for_occurrence_consumer(event):
-    event_light = deepcopy(event)
+    event_light = deepcopy({key: value for key, value in event.items() if key != "spans"})
     event_light["spans"] = []
     event_light["timestamp"] = event["datetime"]
     return event_light
@@ -0,0 +1,101 @@
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+Span = Mapping[str, Any]
+
+NO_PARENT = -1
+
+
+class SpanTree:
+    """
+    Array-backed parent/child index over the spans of a single segment.
+
+    Spans are addressed by their position in ``spans``. Rather than nesting
+    span dicts into each other, the tree is kept in flat lists indexed by that
+    position, so building it does not copy or mutate the input spans and
+    traversals are iterative regardless of how deep the segment is:
+
+    - ``index`` maps a span id to its position. Duplicate span ids are
+      dropped, the first occurrence wins.
+    - ``parents`` holds the position of each span's parent, or ``NO_PARENT``
+      if the parent is not part of the segment.
+    - ``order`` is the depth-first order in which spans are flattened: the
+      segment span and its descendants first, followed by orphaned subtrees
+      ordered by start timestamp. Siblings are ordered by start timestamp.
+    - ``depths`` holds the distance of each span from the root of the subtree
+      it was reached from in ``order``.
+    """
+
+    __slots__ = ("spans", "index", "parents", "root", "order", "depths")
+
+    def __init__(self, spans: Sequence[Span]):
+        index: dict[str, int] = {}
+        unique: list[Span] = []
+        root_span_id = None
+
+        for span in spans:
+            span_id = span["span_id"]
+            if span["is_segment"]:
+                root_span_id = span_id
+            if span_id not in index:
+                index[span_id] = len(unique)
+                unique.append(span)
+
+        parents = [NO_PARENT] * len(unique)
+        children: dict[int, list[int]] = {}
+        for i, span in enumerate(unique):
+            parent_id = span.get("parent_span_id")
+            if parent_id is not None:
+                parent = index.get(parent_id, NO_PARENT)
+                if parent != NO_PARENT:
+                    parents[i] = parent
+                    children.setdefault(parent, []).append(i)
+
+        self.spans = unique
+        self.index = index
+        self.parents = parents
+        self.root = index[root_span_id] if root_span_id is not None else NO_PARENT
+        self.order: list[int] = []
+        self.depths = [0] * len(unique)
+
+        visited = [False] * len(unique)
+        if self.root != NO_PARENT:
+            self._walk(self.root, children, visited)
+
+        # Catch all for orphan spans
+        for i in sorted(range(len(unique)), key=self._start_timestamp):
+            if not visited[i]:
+                self._walk(i, children, visited)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def _start_timestamp(self, i: int) -> float:
+        return self.spans[i]["start_timestamp"]
+
+    def _walk(self, start: int, children: Mapping[int, list[int]], visited: list[bool]) -> None:
+        order = self.order
+        depths = self.depths
+        depths[start] = 0
+        stack = [start]
+
+        while stack:
+            i = stack.pop()
+            if visited[i]:
+                continue
+
+            visited[i] = True
+            order.append(i)
+
+            # Children are pushed latest first so that they are popped in
+            # ascending start timestamp order.
+            depth = depths[i] + 1
+            for child in sorted(children.get(i, ()), key=self._start_timestamp, reverse=True):
+                if not visited[child]:
+                    depths[child] = depth
+                    stack.append(child)
+
+    def flatten(self) -> list[Span]:
+        """Returns the spans in depth-first order, see ``order``."""
+        spans = self.spans
+        return [spans[i] for i in self.order]
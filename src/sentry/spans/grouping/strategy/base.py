@@ -1,10 +1,13 @@
 import re
-from collections.abc import Callable, Sequence
-from dataclasses import dataclass
+import threading
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass, field
 from typing import Any, NotRequired, Optional, TypedDict
 
+from cachetools import LRUCache
+
 from sentry.spans.grouping.utils import Hash, parse_fingerprint_var
-from sentry.utils import urls
+from sentry.utils import metrics, urls
 
 
 class Span(TypedDict):
@@ -29,16 +32,79 @@ class Span(TypedDict):
 # return a list of strings that will serve as the span fingerprint.
 CallableStrategy = Callable[[Span], Optional[Sequence[str]]]
 
+# The maximum number of span groups memoized per strategy. Span groups only
+# depend on the op, description and fingerprint of a span, which repeat a lot
+# across transactions of the same application.
+SPAN_GROUP_CACHE_SIZE = 10_000
+
+
+class SpanGroupCache:
+    """A thread safe LRU cache of span group keys to span group hashes."""
+
+    def __init__(self, maxsize: int = SPAN_GROUP_CACHE_SIZE) -> None:
+        self._cache: LRUCache[Hashable, str] = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> str | None:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: Hashable, value: str) -> None:
+        with self._lock:
+            self._cache[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+def get_span_group_key(span: Span) -> Hashable:
+    """Returns all inputs that a span group is computed from."""
+    fingerprint = span.get("fingerprint")
+    return (
+        span.get("op"),
+        span.get("description"),
+        tuple(fingerprint) if fingerprint else None,
+    )
+
 
 @dataclass(frozen=True)
 class SpanGroupingStrategy:
     name: str
     # The strategies to use with the default fingerprint
     strategies: Sequence[CallableStrategy]
+    cache: SpanGroupCache = field(
+        default_factory=SpanGroupCache, init=False, repr=False, compare=False
+    )
 
     def execute(self, event_data: Any) -> dict[str, str]:
         spans = event_data.get("spans", [])
-        span_groups = {span["span_id"]: self.get_span_group(span) for span in spans}
+
+        # Spans sharing a key are hashed once per transaction, and keys are
+        # looked up in the cache shared by all transactions of this strategy.
+        groups_by_key: dict[Hashable, str] = {}
+        hits = misses = 0
+        span_groups = {}
+        for span in spans:
+            key = get_span_group_key(span)
+            span_group = groups_by_key.get(key)
+            if span_group is None:
+                span_group = self.cache.get(key)
+                if span_group is None:
+                    misses += 1
+                    span_group = self.get_span_group(span)
+                    self.cache.set(key, span_group)
+                else:
+                    hits += 1
+                groups_by_key[key] = span_group
+            else:
+                hits += 1
+            span_groups[span["span_id"]] = span_group
+
+        if spans:
+            tags = {"strategy": self.name}
+            metrics.incr("spans.grouping.cache.hit", amount=hits, tags=tags)
+            metrics.incr("spans.grouping.cache.miss", amount=misses, tags=tags)
 
         # make sure to get the group id for the transaction root span
         span_id = event_data["contexts"]["trace"]["span_id"]
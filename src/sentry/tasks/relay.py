@@ -1,9 +1,11 @@
 import logging
 import time
+from collections import defaultdict
 
 import sentry_sdk
 from django.db import router, transaction
 
+from sentry import options
 from sentry.models.organization import Organization
 from sentry.relay import projectconfig_cache, projectconfig_debounce_cache
 from sentry.silo.base import SiloMode
@@ -47,7 +49,10 @@ def build_project_config(public_key=None, **kwargs):
             # avoid creating more tasks for it.
             projectconfig_cache.backend.set_many({public_key: {"disabled": True}})
         else:
-            config = compute_projectkey_config(key)
+            from sentry.relay.config.sections import ConfigSections
+
+            # All sections are rebuilt, caching them for later invalidations to reuse.
+            config = compute_projectkey_config(key, sections=ConfigSections())
             projectconfig_cache.backend.set_many({public_key: config})
 
     finally:
@@ -102,21 +107,27 @@ def validate_args(organization_id=None, project_id=None, public_key=None):
         raise TypeError("Must provide exactly one of organzation_id, project_id or public_key")
 
 
-def compute_configs(organization_id=None, project_id=None, public_key=None):
+def compute_configs(organization_id=None, project_id=None, public_key=None, trigger=None):
     """Computes all configs for the org, project or single public key.
 
     You must only provide one single argument, not all.
 
+    :param trigger: The reason for the invalidation. Sections of the configs which do not
+       depend on what the trigger changed are reused from the cache when possible.
     :returns: A dict mapping all affected public keys to their config.  The dict will not
        contain keys which should be retained in the cache unchanged.
     """
     from sentry.models.project import Project
     from sentry.models.projectkey import ProjectKey
+    from sentry.relay.config.sections import ConfigSections, get_trigger_dependencies
 
     validate_args(organization_id, project_id, public_key)
     configs = {}
+    sections = ConfigSections(get_trigger_dependencies(trigger))
 
-    if organization_id:
+    if organization_id and options.get("relay.project-config-bulk-organization.enabled"):
+        configs = compute_organization_configs(organization_id, sections=sections)
+    elif organization_id:
         # We want to re-compute all projects in an organization, instead of simply
         # removing the configs and rely on relay requests to lazily re-compute them.  This
         # is done because we do want want to delete project configs in `invalidate_project_config`
@@ -132,7 +143,7 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
                     # recalculate it.  If the config was not there at all, we leave it and avoid the
                     # cost of re-computation.
                     if projectconfig_cache.backend.get(key.public_key) is not None:
-                        configs[key.public_key] = compute_projectkey_config(key)
+                        configs[key.public_key] = compute_projectkey_config(key, sections=sections)
                         action = "recompute"
                     else:
                         action = "not-cached"
@@ -148,7 +159,7 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
                 # recalculate it.  If the config was not there at all, we leave it and avoid the
                 # cost of re-computation.
                 if projectconfig_cache.backend.get(key.public_key) is not None:
-                    configs[key.public_key] = compute_projectkey_config(key)
+                    configs[key.public_key] = compute_projectkey_config(key, sections=sections)
                     action = "recompute"
                 else:
                     action = "not-cached"
@@ -170,17 +181,99 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
             # bug was fixed in https://github.com/getsentry/sentry/pull/35671
             configs[public_key] = {"disabled": True}
         else:
-            configs[public_key] = compute_projectkey_config(key)
+            configs[public_key] = compute_projectkey_config(key, sections=sections)
 
     else:
         raise TypeError("One of the arguments must not be None")
 
+    if (reuse_ratio := sections.reuse_ratio) is not None:
+        metrics.distribution(
+            "relay.projectconfig_cache.invalidation.section_reuse_ratio",
+            reuse_ratio,
+            tags={"trigger": trigger},
+        )
+
+    return configs
+
+
+def compute_organization_configs(organization_id, sections=None):
+    """Computes the configs of all cached public keys of an organization at once.
+
+    Unlike computing every project key config on its own, the inputs shared by the projects
+    of the organization are fetched once upfront: the project keys, whether their configs are
+    cached, the project options and the exposed features. The configs are then assembled
+    project by project from those.
+
+    :param sections: Builds the cached sections of the configs, see
+       :class:`sentry.relay.config.sections.ConfigSections`.
+    :returns: A dict mapping all cached public keys of the organization to their config.
+    """
+    from sentry.models.options.project_option import ProjectOption
+    from sentry.models.project import Project
+    from sentry.models.projectkey import ProjectKey
+    from sentry.relay.config import get_exposed_features_bulk
+
+    try:
+        organization = Organization.objects.get(id=organization_id)
+    except Organization.DoesNotExist:
+        return {}
+
+    projects = {
+        project.id: project for project in Project.objects.filter(organization_id=organization_id)
+    }
+    keys_by_project = defaultdict(list)
+    for key in ProjectKey.objects.filter(project_id__in=projects.keys()):
+        keys_by_project[key.project_id].append(key)
+
+    # If we find the config in the cache it means it was active.  As such we want to
+    # recalculate it.  If the config was not there at all, we leave it and avoid the
+    # cost of re-computation.
+    cached_public_keys = projectconfig_cache.backend.exists_many(
+        key.public_key for keys in keys_by_project.values() for key in keys
+    )
+    metrics.incr(
+        "relay.projectconfig_cache.invalidation.recompute",
+        amount=len(cached_public_keys),
+        tags={"action": "recompute", "scope": "organization"},
+    )
+    metrics.incr(
+        "relay.projectconfig_cache.invalidation.recompute",
+        amount=sum(len(keys) for keys in keys_by_project.values()) - len(cached_public_keys),
+        tags={"action": "not-cached", "scope": "organization"},
+    )
+
+    active_projects = [
+        project
+        for project_id, project in projects.items()
+        if any(key.public_key in cached_public_keys for key in keys_by_project[project_id])
+    ]
+    if not active_projects:
+        return {}
+
+    for project in active_projects:
+        project.set_cached_field_value("organization", organization)
+    ProjectOption.objects.prefetch_all_values([project.id for project in active_projects])
+    exposed_features = get_exposed_features_bulk(organization, active_projects)
+
+    configs = {}
+    for project in active_projects:
+        for key in keys_by_project[project.id]:
+            if key.public_key not in cached_public_keys:
+                continue
+            key.set_cached_field_value("project", project)
+            configs[key.public_key] = compute_projectkey_config(
+                key, sections=sections, exposed_features=exposed_features[project.id]
+            )
+
     return configs
 
 
-def compute_projectkey_config(key):
+def compute_projectkey_config(key, sections=None, exposed_features=None):
     """Computes a single config for the given :class:`ProjectKey`.
 
+    :param sections: Builds the cached sections of the configs computed together, see
+       :class:`sentry.relay.config.sections.ConfigSections`.
+    :param exposed_features: Pre-computed exposed features of the key's project.
     :returns: A dict with the project config.
     """
     from sentry.models.projectkey import ProjectKeyStatus
@@ -189,7 +282,12 @@ def compute_projectkey_config(key):
     if key.status != ProjectKeyStatus.ACTIVE:
         return {"disabled": True}
     else:
-        return get_project_config(key.project, project_keys=[key]).to_dict()
+        return get_project_config(
+            key.project,
+            project_keys=[key],
+            sections=sections,
+            exposed_features=exposed_features,
+        ).to_dict()
 
 
 @instrumented_task(
@@ -239,7 +337,10 @@ def invalidate_project_config(
     sentry_sdk.set_context("kwargs", kwargs)
 
     updated_configs = compute_configs(
-        organization_id=organization_id, project_id=project_id, public_key=public_key
+        organization_id=organization_id,
+        project_id=project_id,
+        public_key=public_key,
+        trigger=trigger,
     )
     projectconfig_cache.backend.set_many(updated_configs)
 
@@ -8,6 +8,7 @@ from copy import deepcopy
 from datetime import datetime
 from typing import Any
 
+from dateutil.parser import parse as parse_datetime
 from snuba_sdk import (
     Column,
     Direction,
@@ -261,6 +262,7 @@ class SnubaTSDB(BaseTSDB):
         jitter_value=None,
         tenant_ids: dict[str, str | int] | None = None,
         referrer_suffix: str | None = None,
+        columnar: bool = False,
     ):
         if model in self.non_outcomes_snql_query_settings:
             # no way around having to explicitly map legacy condition format to SnQL since this function
@@ -298,8 +300,10 @@ class SnubaTSDB(BaseTSDB):
                 is_grouprelease=(model == TSDBModel.frequent_releases_by_group),
                 tenant_ids=tenant_ids,
                 referrer_suffix=referrer_suffix,
+                columnar=columnar,
             )
         else:
+            assert not columnar, f"Columnar results are not supported for {model.name}"
             return self.__get_data_legacy(
                 model,
                 keys,
@@ -335,10 +339,14 @@ class SnubaTSDB(BaseTSDB):
         is_grouprelease: bool = False,
         tenant_ids: dict[str, str | int] | None = None,
         referrer_suffix: str | None = None,
+        columnar: bool = False,
     ):
         """
         Similar to __get_data_legacy but uses the SnQL format. For future additions, prefer using this impl over
         the legacy format.
+
+        `columnar`: return the series and the counts of each key aligned with it, see
+        `get_range_columns`.
         """
         model_query_settings = self.model_query_settings.get(model)
 
@@ -453,6 +461,10 @@ class SnubaTSDB(BaseTSDB):
                 referrer += f".{referrer_suffix}"
 
             query_result = raw_snql_query(snql_request, referrer, use_cache=use_cache)
+            if columnar:
+                return series, self._count_columns(
+                    query_result["data"], model_group, keys, series, aggregated_as
+                )
             if manual_group_on_time:
                 translated_results = {"data": query_result["data"]}
             else:
@@ -462,6 +474,8 @@ class SnubaTSDB(BaseTSDB):
         else:
             # don't bother querying snuba since we probably won't have the proper filter conditions to return
             # reasonable data (invalid query)
+            if columnar:
+                return series, {}
             result = {}
 
         if group_on_time:
@@ -631,6 +645,37 @@ class SnubaTSDB(BaseTSDB):
         else:
             return result
 
+    @staticmethod
+    def _count_columns(
+        rows: Sequence[Mapping[str, Any]],
+        key_column: str,
+        keys: Sequence[TSDBKey],
+        series: Sequence[int],
+        aggregated_as: str,
+    ) -> dict[TSDBKey, list[int]]:
+        """
+        Builds the zero-filled counts of each key from result rows grouped by key and time, with
+        the counts of a key aligned with the series.
+        """
+        index = {timestamp: i for i, timestamp in enumerate(series)}
+        # Times are ISO strings, as translated by `get_snuba_translators`, unless grouped on
+        # manually. They are parsed once per bucket rather than once per row.
+        time_index: dict[Any, int | None] = {}
+        columns = {key: [0] * len(series) for key in keys}
+        for row in rows:
+            column = columns.get(row[key_column])
+            if column is None:
+                continue
+            time = row["time"]
+            try:
+                i = time_index[time]
+            except KeyError:
+                timestamp = int(parse_datetime(time).timestamp()) if isinstance(time, str) else time
+                i = time_index[time] = index.get(timestamp)
+            if i is not None:
+                column[i] = row[aggregated_as]
+        return columns
+
     def zerofill(self, result, groups, flat_keys):
         """
         Fills in missing keys in the nested result with zeroes.
@@ -746,6 +791,48 @@ class SnubaTSDB(BaseTSDB):
         #    {group: [(timestamp, count), ...]}
         return {k: sorted(result[k].items()) for k in result}
 
+    def get_range_columns(
+        self,
+        model: TSDBModel,
+        keys: Sequence[TSDBKey],
+        start: datetime,
+        end: datetime,
+        rollup: int | None = None,
+        environment_ids: Sequence[int] | None = None,
+        conditions=None,
+        use_cache: bool = False,
+        tenant_ids: dict[str, str | int] | None = None,
+        referrer_suffix: str | None = None,
+    ) -> tuple[list[int], dict[TSDBKey, list[int]]]:
+        """
+        Like `get_range`, but returns the timestamps of the series once, along with the counts of
+        each key as a list aligned with them. The counts are read straight from the rows of the
+        Snuba response instead of going through nested mappings, which is noticeably cheaper for
+        many keys and long series.
+
+        Only models counting events per key, such as ``TSDBModel.group``, are supported.
+        """
+        model_query_settings = self.model_query_settings.get(model)
+        assert model_query_settings is not None, f"Unsupported TSDBModel: {model.name}"
+        assert (
+            model_query_settings.aggregate is None
+        ), f"Columnar results are not supported for {model.name}"
+
+        return self.get_data(
+            model,
+            keys,
+            start,
+            end,
+            rollup,
+            environment_ids,
+            group_on_time=True,
+            conditions=conditions,
+            use_cache=use_cache,
+            tenant_ids=tenant_ids,
+            referrer_suffix=referrer_suffix,
+            columnar=True,
+        )
+
     def get_distinct_counts_series(
         self,
         model,
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import logging
 import random
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from typing import Any
 from uuid import UUID
 
 from arroyo import Topic as ArroyoTopic
@@ -67,6 +70,11 @@ ACTIVE_THRESHOLD_REDIS_TTL = timedelta(minutes=60)
 SNUBA_UPTIME_RESULTS_CODEC: Codec[SnubaUptimeResult] = get_topic_codec(Topic.SNUBA_UPTIME_RESULTS)
 # We want to limit cardinality for provider tags. This controls how many tags we should include
 TOTAL_PROVIDERS_TO_INCLUDE_AS_TAGS = 30
+# Modes in which a project subscription creates and resolves issues
+ACTIVE_MODES = (
+    ProjectUptimeSubscriptionMode.AUTO_DETECTED_ACTIVE,
+    ProjectUptimeSubscriptionMode.MANUAL,
+)
 
 
 def _get_snuba_uptime_checks_producer() -> KafkaProducer:
@@ -104,6 +112,23 @@ def get_active_recovery_threshold():
     return options.get("uptime.active-recovery-threshold")
 
 
+@dataclass
+class UptimeResultBatch:
+    """
+    State shared by the results processed together by `UptimeResultProcessor.handle_results`.
+    Each project subscription appears at most once in a batch.
+    """
+
+    pipeline: Any
+    """Redis pipeline collecting the writes of the batch, executed once it is processed"""
+
+    status_counts: dict[str, int] = field(default_factory=dict)
+    """Counts of the consecutive status keys read for the batch, before its results"""
+
+    snuba_messages: list[tuple[KafkaPayload, dict[str, str]]] = field(default_factory=list)
+    """Snuba results produced once the writes of the batch are executed"""
+
+
 class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
     subscription_model = UptimeSubscription
 
@@ -176,6 +201,92 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
         return result["region"] in shadow_region_slugs
 
     def handle_result(self, subscription: UptimeSubscription | None, result: CheckResult):
+        prepared = self.prepare_result(subscription, result)
+        if prepared is None:
+            return
+        project_subscriptions, metric_tags = prepared
+
+        cluster = _get_cluster()
+        last_updates: list[str | None] = cluster.mget(
+            build_last_update_key(sub) for sub in project_subscriptions
+        )
+
+        for last_update_raw, project_subscription in zip(last_updates, project_subscriptions):
+            last_update_ms = 0 if last_update_raw is None else int(last_update_raw)
+            self.handle_result_for_project(
+                project_subscription,
+                result,
+                last_update_ms,
+                metric_tags.copy(),
+            )
+
+    def handle_results(self, results: Sequence[tuple[UptimeSubscription | None, CheckResult]]):
+        """
+        Handles the results of distinct subscriptions together. The last updates and
+        consecutive status counts of all their project subscriptions are read with a single
+        Redis command, their Redis writes are pipelined and their Snuba results are produced
+        once the writes are executed.
+        """
+        to_handle: list[tuple[ProjectUptimeSubscription, CheckResult, dict[str, str]]] = []
+        for subscription, result in results:
+            try:
+                prepared = self.prepare_result(subscription, result)
+            except Exception:
+                logger.exception("Failed to process message result")
+                continue
+            if prepared is None:
+                continue
+            project_subscriptions, metric_tags = prepared
+            to_handle.extend(
+                (project_subscription, result, metric_tags)
+                for project_subscription in project_subscriptions
+            )
+
+        if not to_handle:
+            return
+
+        cluster = _get_cluster()
+        status_keys = [
+            build_active_consecutive_status_key(project_subscription, result["status"])
+            for project_subscription, result, _ in to_handle
+            if project_subscription.mode in ACTIVE_MODES
+            and result["status"] in (CHECKSTATUS_FAILURE, CHECKSTATUS_SUCCESS)
+        ]
+        values: list[str | None] = cluster.mget(
+            [build_last_update_key(sub) for sub, _, _ in to_handle] + status_keys
+        )
+        last_updates = values[: len(to_handle)]
+        batch = UptimeResultBatch(
+            pipeline=cluster.pipeline(),
+            status_counts={
+                key: int(value)
+                for key, value in zip(status_keys, values[len(to_handle) :])
+                if value is not None
+            },
+        )
+
+        for (project_subscription, result, metric_tags), last_update_raw in zip(
+            to_handle, last_updates
+        ):
+            last_update_ms = 0 if last_update_raw is None else int(last_update_raw)
+            try:
+                self.handle_result_for_project(
+                    project_subscription, result, last_update_ms, metric_tags.copy(), batch
+                )
+            except Exception:
+                logger.exception("Failed to process message result")
+
+        batch.pipeline.execute()
+        self._produce_snuba_uptime_results(batch)
+
+    def prepare_result(
+        self, subscription: UptimeSubscription | None, result: CheckResult
+    ) -> tuple[list[ProjectUptimeSubscription], dict[str, str]] | None:
+        """
+        Runs the checks of a result that apply to its subscription as a whole. Returns the
+        project subscriptions the result needs to be handled for and the metric tags of the
+        result, or None if the result should not be handled further.
+        """
         if random.random() < 0.01:
             logger.info("process_result", extra=result)
 
@@ -188,7 +299,7 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
                 sample_rate=1.0,
                 tags={"uptime_region": result.get("region", "default")},
             )
-            return
+            return None
 
         metric_tags = {
             "host_provider": self.get_host_provider_if_valid(subscription),
@@ -201,25 +312,12 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
             metrics.incr(
                 "uptime.result_processor.dropped_shadow_result", sample_rate=1.0, tags=metric_tags
             )
-            return
+            return None
 
         self.check_and_update_regions(subscription, result, subscription_regions)
 
         project_subscriptions = get_project_subscriptions_for_uptime_subscription(subscription.id)
-
-        cluster = _get_cluster()
-        last_updates: list[str | None] = cluster.mget(
-            build_last_update_key(sub) for sub in project_subscriptions
-        )
-
-        for last_update_raw, project_subscription in zip(last_updates, project_subscriptions):
-            last_update_ms = 0 if last_update_raw is None else int(last_update_raw)
-            self.handle_result_for_project(
-                project_subscription,
-                result,
-                last_update_ms,
-                metric_tags.copy(),
-            )
+        return project_subscriptions, metric_tags
 
     def handle_result_for_project(
         self,
@@ -227,6 +325,7 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
         result: CheckResult,
         last_update_ms: int,
         metric_tags: dict[str, str],
+        batch: UptimeResultBatch | None = None,
     ):
         if features.has(
             "organizations:uptime-detailed-logging", project_subscription.project.organization
@@ -306,19 +405,16 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
                 self.handle_result_for_project_auto_onboarding_mode(
                     project_subscription, result, metric_tags.copy()
                 )
-            elif project_subscription.mode in (
-                ProjectUptimeSubscriptionMode.AUTO_DETECTED_ACTIVE,
-                ProjectUptimeSubscriptionMode.MANUAL,
-            ):
+            elif project_subscription.mode in ACTIVE_MODES:
                 self.handle_result_for_project_active_mode(
-                    project_subscription, result, metric_tags.copy()
+                    project_subscription, result, metric_tags.copy(), batch
                 )
         except Exception:
             logger.exception("Failed to process result for uptime project subscription")
 
         # Now that we've processed the result for this project subscription we track the last update date
-        cluster = _get_cluster()
-        cluster.set(
+        redis = _get_cluster() if batch is None else batch.pipeline
+        redis.set(
             build_last_update_key(project_subscription),
             int(result["scheduled_check_time_ms"]),
             ex=LAST_UPDATE_REDIS_TTL,
@@ -326,7 +422,9 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
 
         # After processing the result and updating Redis, produce message to Kafka
         if options.get("uptime.snuba_uptime_results.enabled"):
-            self._produce_snuba_uptime_result(project_subscription, result, metric_tags.copy())
+            self._produce_snuba_uptime_result(
+                project_subscription, result, metric_tags.copy(), batch
+            )
 
         # The amount of time it took for a check result to get from the checker to this consumer and be processed
         metrics.distribution(
@@ -415,8 +513,9 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
         project_subscription: ProjectUptimeSubscription,
         result: CheckResult,
         metric_tags: dict[str, str],
+        batch: UptimeResultBatch | None = None,
     ):
-        redis = _get_cluster()
+        redis = _get_cluster() if batch is None else batch.pipeline
         delete_status = (
             CHECKSTATUS_FAILURE if result["status"] == CHECKSTATUS_SUCCESS else CHECKSTATUS_SUCCESS
         )
@@ -428,7 +527,7 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
             and result["status"] == CHECKSTATUS_FAILURE
         ):
             if not self.has_reached_status_threshold(
-                project_subscription, result["status"], metric_tags
+                project_subscription, result["status"], metric_tags, batch
             ):
                 return
 
@@ -475,7 +574,7 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
             and result["status"] == CHECKSTATUS_SUCCESS
         ):
             if not self.has_reached_status_threshold(
-                project_subscription, result["status"], metric_tags
+                project_subscription, result["status"], metric_tags, batch
             ):
                 return
 
@@ -503,12 +602,19 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
         project_subscription: ProjectUptimeSubscription,
         status: str,
         metric_tags: dict[str, str],
+        batch: UptimeResultBatch | None = None,
     ) -> bool:
-        pipeline = _get_cluster().pipeline()
         key = build_active_consecutive_status_key(project_subscription, status)
-        pipeline.incr(key)
-        pipeline.expire(key, ACTIVE_THRESHOLD_REDIS_TTL)
-        status_count = int(pipeline.execute()[0])
+        if batch is None:
+            pipeline = _get_cluster().pipeline()
+            pipeline.incr(key)
+            pipeline.expire(key, ACTIVE_THRESHOLD_REDIS_TTL)
+            status_count = int(pipeline.execute()[0])
+        else:
+            # The count was read for the whole batch, the increment is applied with its writes
+            status_count = batch.status_counts.get(key, 0) + 1
+            batch.pipeline.incr(key)
+            batch.pipeline.expire(key, ACTIVE_THRESHOLD_REDIS_TTL)
         result = (
             status == CHECKSTATUS_FAILURE and status_count >= get_active_failure_threshold()
         ) or (status == CHECKSTATUS_SUCCESS and status_count >= get_active_recovery_threshold())
@@ -525,6 +631,7 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
         project_subscription: ProjectUptimeSubscription,
         result: CheckResult,
         metric_tags: dict[str, str],
+        batch: UptimeResultBatch | None = None,
     ) -> None:
         """
         Produces a message to Snuba's Kafka topic for uptime check results.
@@ -532,6 +639,7 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
         Args:
             project_subscription: The project subscription associated with the result
             result: The check result to be sent to Snuba
+            batch: When given, the message is added to the batch and produced along with it
         """
         try:
             project = project_subscription.project
@@ -564,9 +672,12 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
                 "region": result["region"],
             }
 
-            topic = get_topic_definition(Topic.SNUBA_UPTIME_RESULTS)["real_topic_name"]
             payload = KafkaPayload(None, SNUBA_UPTIME_RESULTS_CODEC.encode(snuba_message), [])
+            if batch is not None:
+                batch.snuba_messages.append((payload, metric_tags))
+                return
 
+            topic = get_topic_definition(Topic.SNUBA_UPTIME_RESULTS)["real_topic_name"]
             _snuba_uptime_checks_producer.produce(ArroyoTopic(topic), payload)
 
             metrics.incr(
@@ -583,6 +694,27 @@ class UptimeResultProcessor(ResultProcessor[CheckResult, UptimeSubscription]):
                 tags=metric_tags,
             )
 
+    def _produce_snuba_uptime_results(self, batch: UptimeResultBatch) -> None:
+        if not batch.snuba_messages:
+            return
+
+        topic = ArroyoTopic(get_topic_definition(Topic.SNUBA_UPTIME_RESULTS)["real_topic_name"])
+        for payload, metric_tags in batch.snuba_messages:
+            try:
+                _snuba_uptime_checks_producer.produce(topic, payload)
+                metrics.incr(
+                    "uptime.result_processor.snuba_message_produced",
+                    sample_rate=1.0,
+                    tags=metric_tags,
+                )
+            except Exception:
+                logger.exception("Failed to produce Snuba message for uptime result")
+                metrics.incr(
+                    "uptime.result_processor.snuba_message_failed",
+                    sample_rate=1.0,
+                    tags=metric_tags,
+                )
+
 
 class UptimeResultsStrategyFactory(ResultsStrategyFactory[CheckResult, UptimeSubscription]):
     result_processor_cls = UptimeResultProcessor
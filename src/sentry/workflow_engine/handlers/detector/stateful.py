@@ -1,4 +1,6 @@
 import abc
+import dataclasses
+from collections.abc import Sequence
 from datetime import timedelta
 from typing import Any, TypeVar
 
@@ -36,6 +38,9 @@ class StatefulDetectorHandler(DetectorHandler[T], abc.ABC):
         self.dedupe_updates: dict[DetectorGroupKey, int] = {}
         self.counter_updates: dict[DetectorGroupKey, dict[str, int | None]] = {}
         self.state_updates: dict[DetectorGroupKey, tuple[bool, DetectorPriorityLevel]] = {}
+        # `DetectorState` rows loaded by `bulk_evaluate`, reused when committing state updates.
+        # Group keys without a row are mapped to `None`.
+        self.loaded_detector_states: dict[DetectorGroupKey, DetectorState | None] = {}
 
     @property
     @abc.abstractmethod
@@ -85,28 +90,39 @@ class StatefulDetectorHandler(DetectorHandler[T], abc.ABC):
         If data isn't currently stored, falls back to default values.
         """
         group_key_detectors = self.bulk_get_detector_state(group_keys)
-        dedupe_keys = [self.build_dedupe_value_key(gk) for gk in group_keys]
         pipeline = get_redis_client().pipeline()
+        self.enqueue_state_data_reads(pipeline, group_keys)
+        return self.build_state_data(group_keys, pipeline.execute(), group_key_detectors)
 
-        for dk in dedupe_keys:
-            pipeline.get(dk)
+    def enqueue_state_data_reads(self, pipeline: Any, group_keys: list[DetectorGroupKey]) -> None:
+        """
+        Queues the reads of the Redis state of the passed `group_keys` into `pipeline`. The
+        results are parsed by `build_state_data`.
+        """
+        for gk in group_keys:
+            pipeline.get(self.build_dedupe_value_key(gk))
 
+        for gk in group_keys:
+            for name in self.counter_names:
+                pipeline.get(self.build_counter_value_key(gk, name))
+
+    def build_state_data(
+        self,
+        group_keys: list[DetectorGroupKey],
+        redis_values: Sequence[Any],
+        group_key_detectors: dict[DetectorGroupKey, DetectorState],
+    ) -> dict[DetectorGroupKey, DetectorStateData]:
+        """
+        Builds the `DetectorStateData` of the passed `group_keys` from the results of the reads
+        queued by `enqueue_state_data_reads` and the fetched `DetectorState` rows.
+        """
         group_key_dedupe_values = {
-            gk: int(dv) if dv else 0 for gk, dv in zip(group_keys, pipeline.execute())
+            gk: int(dv) if dv else 0 for gk, dv in zip(group_keys, redis_values)
         }
 
-        pipeline.reset()
         counter_updates = {}
-
         if self.counter_names:
-            counter_keys = [
-                self.build_counter_value_key(gk, name)
-                for gk in group_keys
-                for name in self.counter_names
-            ]
-            for ck in counter_keys:
-                pipeline.get(ck)
-            vals = [int(val) if val is not None else val for val in pipeline.execute()]
+            vals = [int(val) if val is not None else val for val in redis_values[len(group_keys) :]]
             counter_updates = {
                 gk: dict(zip(self.counter_names, values))
                 for gk, values in zip(group_keys, chunked(vals, len(self.counter_names)))
@@ -272,6 +288,13 @@ class StatefulDetectorHandler(DetectorHandler[T], abc.ABC):
 
     def _bulk_commit_redis_state(self):
         pipeline = get_redis_client().pipeline()
+        self.enqueue_redis_state_updates(pipeline)
+        pipeline.execute()
+
+    def enqueue_redis_state_updates(self, pipeline: Any) -> None:
+        """
+        Queues the pending dedupe and counter updates into `pipeline` and clears them.
+        """
         if self.dedupe_updates:
             for group_key, dedupe_value in self.dedupe_updates.items():
                 pipeline.set(self.build_dedupe_value_key(group_key), dedupe_value, ex=REDIS_TTL)
@@ -285,15 +308,37 @@ class StatefulDetectorHandler(DetectorHandler[T], abc.ABC):
                     else:
                         pipeline.set(key_name, counter_value, ex=REDIS_TTL)
 
-        pipeline.execute()
         self.dedupe_updates.clear()
         self.counter_updates.clear()
 
     def _bulk_commit_detector_state(self):
-        # TODO: We should already have these loaded from earlier, figure out how to cache and reuse
-        detector_state_lookup = self.bulk_get_detector_state(
-            [update for update in self.state_updates.keys()]
-        )
+        created_detector_states, updated_detector_states = self.build_detector_state_updates()
+
+        if created_detector_states:
+            DetectorState.objects.bulk_create(created_detector_states)
+
+        if updated_detector_states:
+            DetectorState.objects.bulk_update(updated_detector_states, ["active", "state"])
+
+    def build_detector_state_updates(self) -> tuple[list[DetectorState], list[DetectorState]]:
+        """
+        Applies the pending state updates to `DetectorState` instances, returning the ones to
+        create and the ones to update, and clears them. Rows loaded by `bulk_evaluate` are
+        reused, any other rows are fetched.
+        """
+        missing_group_keys = [
+            group_key
+            for group_key in self.state_updates.keys()
+            if group_key not in self.loaded_detector_states
+        ]
+        detector_state_lookup: dict[DetectorGroupKey, DetectorState | None] = {
+            group_key: self.loaded_detector_states[group_key]
+            for group_key in self.state_updates.keys()
+            if group_key in self.loaded_detector_states
+        }
+        if missing_group_keys:
+            detector_state_lookup.update(self.bulk_get_detector_state(missing_group_keys))
+
         created_detector_states = []
         updated_detector_states = []
         for group_key, (active, priority) in self.state_updates.items():
@@ -312,9 +357,138 @@ class StatefulDetectorHandler(DetectorHandler[T], abc.ABC):
                 detector_state.state = priority
                 updated_detector_states.append(detector_state)
 
-        if created_detector_states:
-            DetectorState.objects.bulk_create(created_detector_states)
+        # The loaded rows now reflect the committed state
+        for detector_state in created_detector_states:
+            if detector_state.detector_group_key in self.loaded_detector_states:
+                self.loaded_detector_states[detector_state.detector_group_key] = detector_state
 
-        if updated_detector_states:
-            DetectorState.objects.bulk_update(updated_detector_states, ["active", "state"])
         self.state_updates.clear()
+        return created_detector_states, updated_detector_states
+
+
+def bulk_evaluate(
+    items: Sequence[tuple[StatefulDetectorHandler[Any], DataPacket[Any]]],
+) -> list[dict[DetectorGroupKey, DetectorEvaluationResult]]:
+    """
+    Evaluates many data packets for many stateful detectors at once, returning the results of
+    each item in order.
+
+    The state of every detector and group key in the batch is loaded with a single Redis
+    pipeline and a single `DetectorState` query. Packets are then evaluated in order, with the
+    state updates of each packet applied in memory before evaluating the next one, so that
+    several packets for the same detector behave as if they were evaluated and committed one
+    after the other. State updates are left enqueued on the handlers, see
+    `bulk_commit_state_updates`.
+
+    State is tracked per detector. When several handler instances are given for the same
+    detector, the first one evaluates the packets of all of them and holds their state updates.
+    """
+    # Handlers by detector ID
+    handlers: dict[int, StatefulDetectorHandler[Any]] = {}
+    extracted: list[tuple[int, int, dict[DetectorGroupKey, int]]] = []
+    handler_group_keys: dict[int, dict[DetectorGroupKey, None]] = {}
+    for handler, data_packet in items:
+        detector_id = handler.detector.id
+        handler = handlers.setdefault(detector_id, handler)
+        group_values = handler.get_group_key_values(data_packet)
+        extracted.append((detector_id, handler.get_dedupe_value(data_packet), group_values))
+        handler_group_keys.setdefault(detector_id, {}).update(dict.fromkeys(group_values))
+
+    state_data = _bulk_get_state_data(handlers, handler_group_keys)
+
+    results: list[dict[DetectorGroupKey, DetectorEvaluationResult]] = []
+    for detector_id, dedupe_value, group_values in extracted:
+        handler = handlers[detector_id]
+        handler_state_data = state_data[detector_id]
+        packet_results = {}
+        for group_key, group_value in group_values.items():
+            result = handler.evaluate_group_key_value(
+                group_key, group_value, handler_state_data[group_key], dedupe_value
+            )
+            if result:
+                packet_results[result.group_key] = result
+
+            active, status = handler.state_updates.get(
+                group_key,
+                (handler_state_data[group_key].active, handler_state_data[group_key].status),
+            )
+            handler_state_data[group_key] = dataclasses.replace(
+                handler_state_data[group_key],
+                active=active,
+                status=status,
+                dedupe_value=handler.dedupe_updates.get(
+                    group_key, handler_state_data[group_key].dedupe_value
+                ),
+            )
+        results.append(packet_results)
+
+    return results
+
+
+def _bulk_get_state_data(
+    handlers: dict[int, StatefulDetectorHandler[Any]],
+    handler_group_keys: dict[int, dict[DetectorGroupKey, None]],
+) -> dict[int, dict[DetectorGroupKey, DetectorStateData]]:
+    query_filter = Q()
+    for detector_id, group_keys in handler_group_keys.items():
+        detector_filter = Q(
+            detector_group_key__in=[group_key for group_key in group_keys if group_key is not None]
+        )
+        if None in group_keys:
+            detector_filter |= Q(detector_group_key__isnull=True)
+        query_filter |= Q(detector_id=detector_id) & detector_filter
+
+    detector_states: dict[tuple[int, DetectorGroupKey], DetectorState] = {}
+    if handler_group_keys:
+        detector_states = {
+            (detector_state.detector_id, detector_state.detector_group_key): detector_state
+            for detector_state in DetectorState.objects.filter(query_filter)
+        }
+
+    pipeline = get_redis_client().pipeline()
+    for detector_id, group_keys in handler_group_keys.items():
+        handlers[detector_id].enqueue_state_data_reads(pipeline, list(group_keys))
+    redis_values = pipeline.execute()
+
+    state_data = {}
+    offset = 0
+    for detector_id, group_keys in handler_group_keys.items():
+        handler = handlers[detector_id]
+        read_count = len(group_keys) * (1 + len(handler.counter_names))
+        group_key_detectors = {
+            group_key: detector_states[(handler.detector.id, group_key)]
+            for group_key in group_keys
+            if (handler.detector.id, group_key) in detector_states
+        }
+        handler.loaded_detector_states.update(
+            {group_key: group_key_detectors.get(group_key) for group_key in group_keys}
+        )
+        state_data[detector_id] = handler.build_state_data(
+            list(group_keys), redis_values[offset : offset + read_count], group_key_detectors
+        )
+        offset += read_count
+
+    return state_data
+
+
+def bulk_commit_state_updates(handlers: Sequence[StatefulDetectorHandler[Any]]) -> None:
+    """
+    Commits the enqueued state updates of many handlers with a single Redis pipeline, a single
+    `DetectorState` bulk create and a single bulk update.
+    """
+    created_detector_states: list[DetectorState] = []
+    updated_detector_states: list[DetectorState] = []
+    pipeline = get_redis_client().pipeline()
+    for handler in {id(handler): handler for handler in handlers}.values():
+        created, updated = handler.build_detector_state_updates()
+        created_detector_states.extend(created)
+        updated_detector_states.extend(updated)
+        handler.enqueue_redis_state_updates(pipeline)
+
+    if created_detector_states:
+        DetectorState.objects.bulk_create(created_detector_states)
+
+    if updated_detector_states:
+        DetectorState.objects.bulk_update(updated_detector_states, ["active", "state"])
+
+    pipeline.execute()
@@ -1,5 +1,6 @@
 import logging
 import operator
+from collections.abc import Callable
 from enum import StrEnum
 from typing import Any, TypeVar, cast
 
@@ -129,7 +130,11 @@ class DataCondition(DefaultFieldsModel):
 
         return None
 
-    def evaluate_value(self, value: T) -> DataConditionResult:
+    def get_comparator(self) -> Callable[[Any, Any], Any] | None:
+        """
+        Returns the function that compares a value against `comparison`, or `None` if the
+        condition type is invalid or has no registered handler.
+        """
         try:
             condition_type = Condition(self.type)
         except ValueError:
@@ -141,9 +146,7 @@ class DataCondition(DefaultFieldsModel):
 
         if condition_type in CONDITION_OPS:
             # If the condition is a base type, handle it directly
-            op = CONDITION_OPS[Condition(self.type)]
-            result = op(cast(Any, value), self.comparison)
-            return self.get_condition_result() if result else None
+            return CONDITION_OPS[condition_type]
 
         # Otherwise, we need to get the handler and evaluate the value
         try:
@@ -155,7 +158,14 @@ class DataCondition(DefaultFieldsModel):
             )
             return None
 
-        result = handler.evaluate_value(value, self.comparison)
+        return handler.evaluate_value
+
+    def evaluate_value(self, value: T) -> DataConditionResult:
+        comparator = self.get_comparator()
+        if comparator is None:
+            return None
+
+        result = comparator(cast(Any, value), self.comparison)
         return self.get_condition_result() if result else None
 
 
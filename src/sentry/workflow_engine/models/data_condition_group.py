@@ -1,7 +1,10 @@
+import uuid
 from enum import StrEnum
-from typing import ClassVar, Self
+from typing import Any, ClassVar, Self
 
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
 
 from sentry.backup.scopes import RelocationScope
 from sentry.db.models import DefaultFieldsModel, region_silo_model, sane_repr
@@ -45,3 +48,33 @@ def get_slow_conditions(dcg: DataConditionGroup) -> list[DataCondition]:
     Get all conditions that are considered slow for a given data condition group
     """
     return [condition for condition in dcg.conditions.all() if is_slow_condition(condition)]
+
+
+CONDITION_GROUP_VERSION_KEY = "workflow_engine:condition_group_version:%s"
+CONDITION_GROUP_VERSION_TTL = 60 * 60 * 24
+
+
+def build_condition_group_version_key(condition_group_id: int) -> str:
+    return CONDITION_GROUP_VERSION_KEY % condition_group_id
+
+
+def bump_condition_group_version(instance: DataCondition | DataConditionGroup, **kwargs: Any):
+    """
+    Replaces the version token of a data condition group whenever the group or one of its
+    conditions changes, invalidating compiled copies of the group held by other processes.
+    """
+    if isinstance(instance, DataCondition):
+        condition_group_id = instance.condition_group_id
+    else:
+        condition_group_id = instance.id
+    cache.set(
+        build_condition_group_version_key(condition_group_id),
+        uuid.uuid4().hex,
+        CONDITION_GROUP_VERSION_TTL,
+    )
+
+
+post_save.connect(bump_condition_group_version, sender=DataConditionGroup)
+post_delete.connect(bump_condition_group_version, sender=DataConditionGroup)
+post_save.connect(bump_condition_group_version, sender=DataCondition)
+post_delete.connect(bump_condition_group_version, sender=DataCondition)
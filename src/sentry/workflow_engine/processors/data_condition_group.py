@@ -1,8 +1,17 @@
 import logging
-from typing import TypeVar
+import threading
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
 
+from cachetools import LRUCache
+from django.core.cache import cache
+
+from sentry.utils import metrics
 from sentry.utils.function_cache import cache_func_for_models
 from sentry.workflow_engine.models import DataCondition, DataConditionGroup
+from sentry.workflow_engine.models.data_condition_group import build_condition_group_version_key
 from sentry.workflow_engine.processors.data_condition import split_conditions_by_speed
 from sentry.workflow_engine.types import DataConditionResult, ProcessedDataConditionResult
 
@@ -128,3 +137,186 @@ def process_data_condition_group(
         remaining_conditions = []
 
     return (logic_result, condition_results), remaining_conditions
+
+
+@dataclass(frozen=True)
+class CompiledCondition:
+    condition: DataCondition
+    comparator: Callable[[Any, Any], Any] | None
+    comparison: Any
+    result: DataConditionResult
+
+    def evaluate_value(self, value: Any) -> DataConditionResult:
+        """
+        Equivalent to `DataCondition.evaluate_value`, without resolving the condition type,
+        handler and result on every evaluation.
+        """
+        if self.comparator is None:
+            return None
+        return self.result if self.comparator(value, self.comparison) else None
+
+
+@dataclass(frozen=True)
+class CompiledConditionGroup:
+    """
+    An evaluation plan for a `DataConditionGroup`. The conditions of the group are resolved
+    to their comparators and split by speed ahead of time, so evaluating the group only
+    compares values.
+    """
+
+    id: int
+    logic_type: DataConditionGroup.Type
+    fast_conditions: tuple[CompiledCondition, ...]
+    slow_conditions: tuple[DataCondition, ...]
+
+    @classmethod
+    def compile(
+        cls, group: DataConditionGroup, conditions: Sequence[DataCondition]
+    ) -> "CompiledConditionGroup | None":
+        try:
+            logic_type = DataConditionGroup.Type(group.logic_type)
+        except ValueError:
+            logger.exception(
+                "Invalid DataConditionGroup.logic_type found in process_data_condition_group",
+                extra={"logic_type": group.logic_type},
+            )
+            return None
+
+        fast_conditions, slow_conditions = split_conditions_by_speed(list(conditions))
+        return cls(
+            id=group.id,
+            logic_type=logic_type,
+            fast_conditions=tuple(
+                CompiledCondition(
+                    condition=condition,
+                    comparator=condition.get_comparator(),
+                    comparison=condition.comparison,
+                    result=condition.get_condition_result(),
+                )
+                for condition in fast_conditions
+            ),
+            slow_conditions=tuple(slow_conditions),
+        )
+
+    def evaluate(self, value: T) -> DataConditionGroupResult:
+        """
+        Evaluates the fast conditions of the group, see `process_data_condition_group`. The
+        slow conditions are returned as remaining conditions unless the result of the group
+        is already known.
+        """
+        logic_type = self.logic_type
+        results: list[tuple[bool, DataConditionResult]] = []
+
+        for compiled_condition in self.fast_conditions:
+            evaluation_result = compiled_condition.evaluate_value(value)
+            is_condition_triggered = evaluation_result is not None
+
+            if is_condition_triggered:
+                if logic_type == DataConditionGroup.Type.ANY_SHORT_CIRCUIT:
+                    return (True, [evaluation_result]), list(self.slow_conditions)
+                if logic_type == DataConditionGroup.Type.NONE:
+                    return (False, []), list(self.slow_conditions)
+            elif logic_type == DataConditionGroup.Type.ALL:
+                # The group can no longer pass, skip the remaining conditions
+                return (False, []), []
+
+            results.append((is_condition_triggered, evaluation_result))
+
+        if not self.fast_conditions:
+            logic_result, condition_results = True, []
+        else:
+            logic_result, condition_results = evaluate_condition_group_results(results, logic_type)
+
+        if logic_result and logic_type == DataConditionGroup.Type.ANY:
+            return (logic_result, condition_results), []
+
+        return (logic_result, condition_results), list(self.slow_conditions)
+
+
+def compile_condition_groups(
+    data_condition_group_ids: Sequence[int],
+) -> dict[int, CompiledConditionGroup]:
+    """
+    Compiles the passed data condition groups with one query for the groups and one for
+    their conditions. Groups which don't exist or are invalid are omitted.
+    """
+    if not data_condition_group_ids:
+        return {}
+
+    conditions_by_group: dict[int, list[DataCondition]] = {}
+    for condition in DataCondition.objects.filter(
+        condition_group_id__in=data_condition_group_ids
+    ).order_by("id"):
+        conditions_by_group.setdefault(condition.condition_group_id, []).append(condition)
+
+    compiled_groups = {}
+    for group in DataConditionGroup.objects.filter(id__in=data_condition_group_ids):
+        compiled_group = CompiledConditionGroup.compile(
+            group, conditions_by_group.get(group.id, [])
+        )
+        if compiled_group is not None:
+            compiled_groups[group.id] = compiled_group
+
+    return compiled_groups
+
+
+class CompiledConditionGroupCache:
+    """
+    Per-process cache of compiled data condition groups.
+
+    Entries are validated against version tokens which are replaced whenever a group or one
+    of its conditions is saved or deleted (see `bump_condition_group_version`), so that
+    edits are picked up by every process. Validating the entries of any number of groups
+    takes a single cache round trip, and all missing groups are compiled together. Entries
+    also expire after `ttl` seconds in case a version token was evicted.
+    """
+
+    def __init__(self, max_size: int = 50_000, ttl: int = 300) -> None:
+        self.ttl = ttl
+        self._entries: LRUCache[int, tuple[float, Any, CompiledConditionGroup]] = LRUCache(
+            maxsize=max_size
+        )
+        self._lock = threading.Lock()
+
+    def get_many(
+        self, data_condition_group_ids: Sequence[int]
+    ) -> dict[int, CompiledConditionGroup]:
+        versions = cache.get_many(
+            [build_condition_group_version_key(group_id) for group_id in data_condition_group_ids]
+        )
+
+        now = time.monotonic()
+        result = {}
+        missing = []
+        with self._lock:
+            for group_id in data_condition_group_ids:
+                entry = self._entries.get(group_id)
+                version = versions.get(build_condition_group_version_key(group_id))
+                if entry is not None and entry[0] > now and entry[1] == version:
+                    result[group_id] = entry[2]
+                else:
+                    missing.append(group_id)
+
+        metrics.incr("workflow_engine.compiled_condition_groups.hit", amount=len(result))
+        metrics.incr("workflow_engine.compiled_condition_groups.miss", amount=len(missing))
+        if not missing:
+            return result
+
+        # The versions were read before compiling, so that a change made while compiling is
+        # never cached as current.
+        compiled_groups = compile_condition_groups(missing)
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            for group_id, compiled_group in compiled_groups.items():
+                version = versions.get(build_condition_group_version_key(group_id))
+                self._entries[group_id] = (expires_at, version, compiled_group)
+
+        result.update(compiled_groups)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+compiled_condition_group_cache = CompiledConditionGroupCache()
@@ -1,10 +1,12 @@
 import logging
+import time
 from enum import StrEnum
+from typing import Any
 
 import sentry_sdk
 from django.db import router, transaction
 
-from sentry import buffer
+from sentry import buffer, options
 from sentry.db.models.manager.base_query_set import BaseQuerySet
 from sentry.eventstore.models import GroupEvent
 from sentry.utils import json, metrics
@@ -16,13 +18,20 @@ from sentry.workflow_engine.models import (
     Workflow,
 )
 from sentry.workflow_engine.processors.action import filter_recently_fired_workflow_actions
-from sentry.workflow_engine.processors.data_condition_group import process_data_condition_group
+from sentry.workflow_engine.processors.data_condition_group import (
+    CompiledConditionGroup,
+    DataConditionGroupResult,
+    compiled_condition_group_cache,
+    process_data_condition_group,
+)
 from sentry.workflow_engine.processors.detector import get_detector_by_event
 from sentry.workflow_engine.types import WorkflowJob
 
 logger = logging.getLogger(__name__)
 
 WORKFLOW_ENGINE_BUFFER_LIST_KEY = "workflow_engine_delayed_processing_buffer"
+# The trigger duration of single workflows is emitted for this share of the workflows evaluated.
+WORKFLOW_TRIGGER_DURATION_SAMPLE_RATE = 0.1
 
 
 class WorkflowDataConditionGroupType(StrEnum):
@@ -57,8 +66,43 @@ def enqueue_workflow(
 def evaluate_workflow_triggers(workflows: set[Workflow], job: WorkflowJob) -> set[Workflow]:
     triggered_workflows: set[Workflow] = set()
 
+    if options.get("workflow_engine.compiled-condition-groups"):
+        compiled_groups = compiled_condition_group_cache.get_many(
+            [
+                workflow.when_condition_group_id
+                for workflow in workflows
+                if workflow.when_condition_group_id is not None
+            ]
+        )
+    else:
+        compiled_groups = None
+
+    mode = "default" if compiled_groups is None else "compiled"
+    total_duration = 0.0
+    slowest: tuple[float, int] | None = None
     for workflow in workflows:
-        evaluation, remaining_conditions = workflow.evaluate_trigger_conditions(job)
+        start = time.perf_counter()
+        if compiled_groups is None:
+            evaluation, remaining_conditions = workflow.evaluate_trigger_conditions(job)
+        elif workflow.when_condition_group_id is None:
+            evaluation, remaining_conditions = True, []
+        else:
+            job["workflow"] = workflow
+            (evaluation, _), remaining_conditions = _evaluate_compiled_group(
+                compiled_groups, workflow.when_condition_group_id, job
+            )
+        duration = time.perf_counter() - start
+
+        metrics.distribution(
+            "workflow_engine.process_workflows.workflow_trigger_duration",
+            duration,
+            tags={"mode": mode},
+            sample_rate=WORKFLOW_TRIGGER_DURATION_SAMPLE_RATE,
+            unit="second",
+        )
+        total_duration += duration
+        if slowest is None or duration > slowest[0]:
+            slowest = (duration, workflow.id)
 
         if remaining_conditions:
             enqueue_workflow(
@@ -71,9 +115,35 @@ def evaluate_workflow_triggers(workflows: set[Workflow], job: WorkflowJob) -> se
             if evaluation:
                 triggered_workflows.add(workflow)
 
+    if slowest is not None:
+        metrics.distribution(
+            "workflow_engine.process_workflows.workflow_triggers_duration",
+            total_duration,
+            tags={"mode": mode},
+            unit="second",
+        )
+        span = sentry_sdk.get_current_span()
+        if span is not None:
+            span.set_data("slowest_workflow_id", slowest[1])
+            span.set_data("slowest_workflow_duration", slowest[0])
+
     return triggered_workflows
 
 
+def _evaluate_compiled_group(
+    compiled_groups: dict[int, CompiledConditionGroup], data_condition_group_id: int, value: Any
+) -> DataConditionGroupResult:
+    compiled_group = compiled_groups.get(data_condition_group_id)
+    if compiled_group is None:
+        # Same as `process_data_condition_group` for missing or invalid groups
+        logger.error(
+            "DataConditionGroup does not exist or is invalid",
+            extra={"id": data_condition_group_id},
+        )
+        return (False, []), []
+    return compiled_group.evaluate(value)
+
+
 def evaluate_workflows_action_filters(
     workflows: set[Workflow],
     job: WorkflowJob,
@@ -87,11 +157,23 @@ def evaluate_workflows_action_filters(
         workflowdataconditiongroup__workflow_id__in=workflow_ids
     ).distinct()
 
-    for action_condition in action_conditions:
-        (evaluation, result), remaining_conditions = process_data_condition_group(
-            action_condition.id, job
+    compiled_groups = None
+    if options.get("workflow_engine.compiled-condition-groups"):
+        action_conditions = list(action_conditions)
+        compiled_groups = compiled_condition_group_cache.get_many(
+            [action_condition.id for action_condition in action_conditions]
         )
 
+    for action_condition in action_conditions:
+        if compiled_groups is None:
+            (evaluation, result), remaining_conditions = process_data_condition_group(
+                action_condition.id, job
+            )
+        else:
+            (evaluation, result), remaining_conditions = _evaluate_compiled_group(
+                compiled_groups, action_condition.id, job
+            )
+
         if remaining_conditions:
             # If there are remaining conditions for the action filter to evaluate,
             # then return the list of conditions to enqueue
@@ -10,6 +10,7 @@ from sentry.issues.grouptype import GroupCategory, ProfileFileIOGroupType
 from sentry.models.environment import Environment
 from sentry.testutils.cases import BaseMetricsTestCase, PerformanceIssueTestCase, TestCase
 from sentry.testutils.helpers.datetime import before_now, freeze_time
+from sentry.testutils.helpers.options import override_options
 from tests.sentry.issues.test_utils import SearchIssueTestMixin
 
 
@@ -82,3 +83,24 @@ class StreamGroupSerializerTestCase(
         assert serialized["issueType"] == str(ProfileFileIOGroupType.slug)
         assert [stat[1] for stat in serialized["stats"]["24h"][:-1]] == [0] * 23
         assert serialized["stats"]["24h"][-1][1] == 1
+
+    @freeze_time(before_now(days=1).replace(hour=13, minute=30, second=0, microsecond=0))
+    def test_columnar_stats(self):
+        error_group = self.store_event(
+            data={"timestamp": before_now(minutes=5).isoformat(), "fingerprint": ["group-1"]},
+            project_id=self.project.id,
+        ).group
+        performance_group = self.create_performance_issue().group
+        groups = [error_group, performance_group]
+        serializer = StreamGroupSerializerSnuba(stats_period="24h", organization_id=1)
+
+        serialized = serialize(groups, serializer=serializer, request=self.make_request())
+        with override_options({"api.issue-stream.columnar-stats": True}):
+            columnar = serialize(groups, serializer=serializer, request=self.make_request())
+
+        assert [result["stats"] for result in columnar] == [
+            result["stats"] for result in serialized
+        ]
+        for result in columnar:
+            assert [stat[1] for stat in result["stats"]["24h"][:-1]] == [0] * 23
+            assert result["stats"]["24h"][-1][1] == 1
@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+
+from sentry.api.serializers.loaders import AttributeLoaders
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.pytest.fixtures import django_db_all
+
+
+@django_db_all
+def test_load_serially():
+    loaders = AttributeLoaders()
+    assert not loaders.concurrent
+
+    thread_ids = {}
+
+    def loader(name):
+        thread_ids[name] = threading.get_ident()
+        return name
+
+    loaders.add("a", lambda: loader("a"))
+    loaders.add("b", lambda: loader("b"), threaded=True)
+
+    assert loaders.load() == {"a": "a", "b": "b"}
+    assert thread_ids == {"a": threading.get_ident(), "b": threading.get_ident()}
+
+
+@django_db_all
+@override_options({"api.serializers.concurrent-attribute-loaders": True})
+def test_load_concurrently():
+    loaders = AttributeLoaders()
+    assert loaders.concurrent
+
+    # The threaded loader only completes once the other one has started, it would time out
+    # if they ran one after the other.
+    started = threading.Event()
+    thread_ids = {}
+
+    def threaded_loader():
+        assert started.wait(timeout=5)
+        thread_ids["threaded"] = threading.get_ident()
+        return 1
+
+    def loader():
+        started.set()
+        thread_ids["serial"] = threading.get_ident()
+        return 2
+
+    loaders.add("threaded", threaded_loader, threaded=True)
+    loaders.add("serial", loader)
+
+    assert loaders.load() == {"threaded": 1, "serial": 2}
+    assert thread_ids["serial"] == threading.get_ident()
+    assert thread_ids["threaded"] != threading.get_ident()
+
+
+def test_load_propagates_errors():
+    def fail():
+        raise ValueError("boom")
+
+    for concurrent in (False, True):
+        loaders = AttributeLoaders(concurrent=concurrent)
+        loaders.add("a", lambda: 1)
+        loaders.add("b", fail, threaded=True)
+        with pytest.raises(ValueError, match="boom"):
+            loaders.load()
+
+
+def test_add_duplicate():
+    loaders = AttributeLoaders(concurrent=False)
+    loaders.add("a", lambda: 1)
+    with pytest.raises(ValueError):
+        loaders.add("a", lambda: 2)
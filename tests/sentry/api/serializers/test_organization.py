@@ -9,6 +9,7 @@ from sentry.api.serializers import (
     DetailedOrganizationSerializer,
     DetailedOrganizationSerializerWithProjectsAndTeams,
     OnboardingTasksSerializer,
+    OrganizationSerializer,
     serialize,
 )
 from sentry.api.serializers.models.organization import ORGANIZATION_OPTIONS_AS_FEATURES
@@ -24,6 +25,7 @@ from sentry.models.organizationonboardingtask import (
 )
 from sentry.models.releaseprojectenvironment import ReleaseProjectEnvironment
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.skips import requires_snuba
 
 pytestmark = [requires_snuba]
@@ -143,6 +145,51 @@ class OrganizationSerializerTest(TestCase):
         for feature, _func in mock_options_as_features["sentry:set_with_func_fail"]:
             assert feature not in features
 
+    @override_options({"api.serializers.result-cache.enabled": True})
+    def test_result_cache(self):
+        user = self.create_user()
+        other_user = self.create_user()
+        organization = self.create_organization(owner=user, name="before")
+
+        with mock.patch.object(
+            OrganizationSerializer,
+            "get_attrs",
+            autospec=True,
+            side_effect=OrganizationSerializer.get_attrs,
+        ) as mock_get_attrs:
+            assert serialize(organization, user)["name"] == "before"
+            assert serialize(organization, user)["name"] == "before"
+            assert mock_get_attrs.call_count == 1
+
+            # Results are cached per viewer.
+            assert serialize(organization, other_user)["name"] == "before"
+            assert mock_get_attrs.call_count == 2
+
+            organization.name = "after"
+            organization.save()
+            assert serialize(organization, user)["name"] == "after"
+            assert mock_get_attrs.call_count == 3
+
+            OrganizationOption.objects.set_value(organization, "sentry:set_no_value", {})
+            serialize(organization, user)
+            assert mock_get_attrs.call_count == 4
+
+    @override_options({"api.serializers.result-cache.enabled": True})
+    def test_result_cache_skipped_with_access(self):
+        user = self.create_user()
+        organization = self.create_organization(owner=user)
+        acc = access.from_user(user, organization)
+
+        with mock.patch.object(
+            OrganizationSerializer,
+            "get_attrs",
+            autospec=True,
+            side_effect=OrganizationSerializer.get_attrs,
+        ) as mock_get_attrs:
+            assert "access" in serialize(organization, user, OrganizationSerializer(), access=acc)
+            assert "access" in serialize(organization, user, OrganizationSerializer(), access=acc)
+            assert mock_get_attrs.call_count == 2
+
 
 class DetailedOrganizationSerializerTest(TestCase):
     def test_detailed(self):
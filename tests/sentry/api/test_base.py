@@ -11,8 +11,9 @@ from sentry_sdk import Scope
 
 from sentry.api.base import Endpoint, EndpointSiloLimit
 from sentry.api.exceptions import SuperuserRequired
-from sentry.api.paginator import GenericOffsetPaginator
+from sentry.api.paginator import GenericOffsetPaginator, MissingPaginationError
 from sentry.api.permissions import SuperuserPermission
+from sentry.api.streaming import StreamingJSONResponse
 from sentry.deletions.tasks.hybrid_cloud import schedule_hybrid_cloud_foreign_key_jobs
 from sentry.models.apikey import ApiKey
 from sentry.silo.base import FunctionSiloLimit, SiloMode
@@ -21,6 +22,7 @@ from sentry.testutils.helpers.options import override_options
 from sentry.testutils.outbox import outbox_runner
 from sentry.testutils.silo import all_silo_test, assume_test_silo_mode, create_test_regions
 from sentry.types.region import subdomain_is_region
+from sentry.utils import json
 from sentry.utils.cursors import Cursor
 from sentry.utils.security.orgauthtoken_token import generate_token, hash_token
 
@@ -119,6 +121,31 @@ class DummyPaginationStreamingEndpoint(Endpoint):
         )
 
 
+class DummyPaginationStreamingJSONEndpoint(Endpoint):
+    permission_classes = ()
+
+    def get(self, request):
+        values = [{"id": x, "date": datetime(2024, 1, 1)} for x in range(0, 100)]
+
+        def data_fn(offset, limit):
+            page_offset = offset * limit
+            return values[page_offset : page_offset + limit]
+
+        return self.paginate(
+            request=request,
+            paginator=GenericOffsetPaginator(data_fn),
+            on_results=lambda results: {"data": results, "meta": {"count": len(results)}},
+            response_cls=self.get_streaming_response_cls(),
+        )
+
+
+class DummyUnpaginatedStreamingEndpoint(Endpoint):
+    permission_classes = ()
+
+    def get(self, request):
+        return self.respond_streaming([1, 2, 3])
+
+
 _dummy_endpoint = DummyEndpoint.as_view()
 _dummy_streaming_endpoint = DummyPaginationStreamingEndpoint.as_view()
 
@@ -510,6 +537,41 @@ class PaginateTest(APITestCase):
         assert response.has_header("content-type")
 
 
+class StreamingJSONResponseTest(APITestCase):
+    view = staticmethod(DummyPaginationStreamingJSONEndpoint.as_view())
+
+    def make_cors_request(self, **kwargs):
+        org = self.create_organization()
+        with assume_test_silo_mode(SiloMode.CONTROL):
+            apikey = ApiKey.objects.create(organization_id=org.id, allowed_origins="*")
+        request = self.make_request(method="GET", **kwargs)
+        request.META["HTTP_ORIGIN"] = "http://example.com"
+        request.META["HTTP_AUTHORIZATION"] = self.create_basic_auth_header(apikey.key)
+        return request
+
+    def test_matches_default_response(self):
+        response = self.view(self.make_cors_request(GET={"per_page": "10"}))
+        response.render()
+        assert not isinstance(response, StreamingJSONResponse)
+
+        with override_options({"api.streaming-json-responses": True}):
+            streaming_response = self.view(self.make_cors_request(GET={"per_page": "10"}))
+        assert isinstance(streaming_response, StreamingJSONResponse)
+        assert streaming_response.status_code == response.status_code == 200
+
+        assert json.loads(b"".join(streaming_response.streaming_content)) == json.loads(
+            response.content
+        )
+        for header in ("Content-Type", "Link", "Access-Control-Allow-Origin"):
+            assert streaming_response[header] == response[header], header
+
+    @override_settings(ENFORCE_PAGINATION=True)
+    @override_options({"api.streaming-json-responses": True})
+    def test_enforces_pagination(self):
+        with raises(MissingPaginationError):
+            DummyUnpaginatedStreamingEndpoint.as_view()(self.make_request(method="GET"))
+
+
 @all_silo_test(regions=create_test_regions("us", "eu"))
 class CustomerDomainTest(APITestCase):
     def test_resolve_region(self):
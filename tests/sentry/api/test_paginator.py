@@ -19,6 +19,7 @@ from snuba_sdk import (
 )
 
 from sentry.api.paginator import (
+    MAX_HITS_LIMIT,
     BadPaginationError,
     CallbackPaginator,
     ChainPaginator,
@@ -26,6 +27,7 @@ from sentry.api.paginator import (
     CombinedQuerysetPaginator,
     DateTimePaginator,
     GenericOffsetPaginator,
+    KeysetPaginator,
     OffsetPaginator,
     Paginator,
     SequencePaginator,
@@ -37,7 +39,7 @@ from sentry.models.rule import Rule
 from sentry.testutils.cases import APITestCase, SnubaTestCase, TestCase
 from sentry.testutils.silo import control_silo_test
 from sentry.users.models.user import User
-from sentry.utils.cursors import Cursor
+from sentry.utils.cursors import Cursor, StringCursor
 from sentry.utils.snuba import raw_snql_query
 
 
@@ -197,6 +199,97 @@ class OffsetPaginatorTest(TestCase):
             paginator.get_result()
 
 
+@control_silo_test
+class KeysetPaginatorTest(TestCase):
+    def get_result(self, paginator, cursor, limit=1):
+        # Cursors make a round trip through links in the API.
+        if cursor is not None:
+            cursor = StringCursor.from_string(str(cursor))
+        return paginator.get_result(limit=limit, cursor=cursor)
+
+    def test_simple(self):
+        res1 = self.create_user("foo@example.com")
+        res2 = self.create_user("bar@example.com")
+        res3 = self.create_user("baz@example.com")
+
+        paginator = KeysetPaginator(User.objects.all(), "id")
+        result1 = self.get_result(paginator, None)
+        assert list(result1) == [res1]
+        assert result1.next
+        assert not result1.prev
+
+        result2 = self.get_result(paginator, result1.next)
+        assert list(result2) == [res2]
+        assert result2.next
+        assert result2.prev
+
+        result3 = self.get_result(paginator, result2.next)
+        assert list(result3) == [res3]
+        assert not result3.next
+        assert result3.prev
+
+        result4 = self.get_result(paginator, result3.prev)
+        assert list(result4) == [res2]
+        assert result4.next
+        assert result4.prev
+
+        result5 = self.get_result(paginator, result4.prev)
+        assert list(result5) == [res1]
+        assert result5.next
+        assert not result5.prev
+
+    def test_order_by_multiple(self):
+        res1 = self.create_user("foo@example.com")
+        res2 = self.create_user("bar@example.com")
+        res3 = self.create_user("baz@example.com")
+        res2.update(is_active=False)
+
+        paginator = KeysetPaginator(User.objects.all(), ("is_active", "-id"))
+        result = self.get_result(paginator, None, limit=2)
+        assert list(result) == [res2, res3]
+        assert result.next
+
+        result = self.get_result(paginator, result.next, limit=2)
+        assert list(result) == [res1]
+        assert not result.next
+
+        result = self.get_result(paginator, result.prev, limit=2)
+        assert list(result) == [res2, res3]
+        assert not result.prev
+
+    def test_rows_inserted_between_pages(self):
+        res1 = self.create_user("foo@example.com")
+        res2 = self.create_user("bar@example.com")
+
+        paginator = KeysetPaginator(User.objects.all(), "-id")
+        result = self.get_result(paginator, None)
+        assert list(result) == [res2]
+
+        # Unlike offsets, keys are not shifted by new rows.
+        self.create_user("baz@example.com")
+        result = self.get_result(paginator, result.next)
+        assert list(result) == [res1]
+
+    def test_invalid_cursor(self):
+        paginator = KeysetPaginator(User.objects.all(), "id")
+        with pytest.raises(BadPaginationError):
+            paginator.get_result(cursor=StringCursor("invalid", 0, False))
+
+    def test_hits(self):
+        self.create_user("foo@example.com")
+        self.create_user("bar@example.com")
+        queryset = User.objects.filter(email__endswith="@example.com")
+
+        result = KeysetPaginator(queryset, "id").get_result(limit=1, count_hits=True)
+        assert result.hits == 2
+        assert result.max_hits == MAX_HITS_LIMIT
+
+        paginator = KeysetPaginator(queryset, "id", approximate_hits=True)
+        result = paginator.get_result(limit=1, count_hits=True)
+        assert isinstance(result.hits, int)
+        assert result.max_hits is None
+
+
 @control_silo_test
 class DateTimePaginatorTest(TestCase):
     def test_ascending(self):
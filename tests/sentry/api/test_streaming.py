@@ -0,0 +1,62 @@
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from rest_framework.renderers import JSONRenderer
+
+from sentry.api.streaming import StreamingJSONResponse, iter_json
+from sentry.utils import json
+
+PAYLOAD = {
+    "transactions": [
+        {
+            "id": i,
+            "event_id": uuid.UUID(int=i),
+            "timestamp": datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=i),
+            "date": date(2024, 1, 1),
+            "duration": Decimal("1.5"),
+            "tags": {1: "one", "key": "line\u2028separator"},
+            "children": [],
+        }
+        for i in range(100)
+    ],
+    "orphan_errors": (),
+    "meta": None,
+}
+
+
+def render(data):
+    return b"".join(iter_json(data, chunk_size=1024))
+
+
+def test_matches_renderer():
+    for data in (PAYLOAD, PAYLOAD["transactions"], [], {}, "text", 1):
+        assert render(data) == JSONRenderer().render(data)
+
+
+def test_floats():
+    data = [1.5, 1e16, 1e-7, float("nan"), float("inf")]
+    assert json.loads(render(data[:3])) == json.loads(JSONRenderer().render(data[:3]))
+    assert json.loads(render(data[3:])) == [None, None]
+
+
+def test_chunks():
+    chunks = list(iter_json(PAYLOAD, chunk_size=1024))
+    assert len(chunks) > 1
+    assert all(len(chunk) >= 1024 for chunk in chunks[:-1])
+    assert json.loads(b"".join(chunks))["transactions"][0]["id"] == 0
+
+
+def test_iterator():
+    assert render(iter([1, 2, 3])) == b"[1,2,3]"
+    assert render({"a": (i for i in range(3))}) == b'{"a":[0,1,2]}'
+
+
+def test_response():
+    response = StreamingJSONResponse(PAYLOAD, status=201, headers={"X-Hits": "100"})
+    assert response.status_code == 201
+    assert response["Content-Type"] == "application/json"
+    assert response["X-Hits"] == "100"
+    assert b"".join(response.streaming_content) == JSONRenderer().render(PAYLOAD)
+
+    assert b"".join(StreamingJSONResponse().streaming_content) == b""
@@ -11,13 +11,15 @@ from django.test import RequestFactory
 from pytest import raises
 
 from sentry.hybridcloud.models.outbox import (
+    AdaptiveBatchSize,
     ControlOutbox,
     OutboxFlushError,
     RegionOutbox,
+    delete_batch_sizes,
     outbox_context,
 )
 from sentry.hybridcloud.outbox.category import OutboxCategory, OutboxScope
-from sentry.hybridcloud.tasks.deliver_from_outbox import enqueue_outbox_jobs
+from sentry.hybridcloud.tasks.deliver_from_outbox import enqueue_outbox_jobs, process_outbox_batch
 from sentry.models.organization import Organization
 from sentry.models.organizationmember import OrganizationMember
 from sentry.models.organizationmemberteam import OrganizationMemberTeam
@@ -171,6 +173,49 @@ class OutboxDrainTest(TransactionTestCase):
 
             assert mock_send.call_count == 1
 
+    @patch("sentry.hybridcloud.models.outbox.process_region_outbox.send")
+    def test_parallel_drain(self, mock_send: Mock) -> None:
+        with outbox_context(flush=False):
+            for org_id in range(1, 6):
+                Organization(id=org_id).outbox_for_update().save()
+                OrganizationMember(id=org_id, organization_id=org_id).outbox_for_update().save()
+                OrganizationMember(id=org_id, organization_id=org_id).outbox_for_update().save()
+
+        hi = RegionOutbox.objects.latest("id").id + 1
+        with self.options({"hybrid_cloud.outbox.parallel_drain_workers": 3}):
+            assert process_outbox_batch(hi, 0, RegionOutbox) == 5
+
+        assert RegionOutbox.objects.count() == 0
+        # One signal per organization and per coalesced member
+        assert mock_send.call_count == 10
+
+    @patch("sentry.hybridcloud.models.outbox.process_region_outbox.send")
+    def test_parallel_drain_surfaces_errors(self, mock_send: Mock) -> None:
+        mock_send.side_effect = ValueError("This is just a test mock exception")
+        with outbox_context(flush=False):
+            Organization(id=1).outbox_for_update().save()
+            Organization(id=2).outbox_for_update().save()
+
+        with (
+            self.options({"hybrid_cloud.outbox.parallel_drain_workers": 2}),
+            raises(OutboxFlushError),
+        ):
+            process_outbox_batch(RegionOutbox.objects.latest("id").id + 1, 0, RegionOutbox)
+
+    @patch("sentry.hybridcloud.models.outbox.process_region_outbox.send")
+    def test_adaptive_delete_batch_size(self, mock_send: Mock) -> None:
+        delete_batch_sizes.clear()
+        with outbox_context(flush=False):
+            for _ in range(120):
+                OrganizationMember(id=1, organization_id=1).outbox_for_update().save()
+
+        with self.options({"hybrid_cloud.outbox.adaptive_delete_batch_size": True}):
+            RegionOutbox.objects.first().drain_shard(flush_all=True)
+
+        assert RegionOutbox.objects.count() == 0
+        assert mock_send.call_count == 1
+        delete_batch_sizes.clear()
+
     def test_drain_shard_not_flush_all__upper_bound(self) -> None:
         outbox1 = Organization(id=1).outbox_for_update()
         outbox2 = Organization(id=1).outbox_for_update()
@@ -642,3 +687,28 @@ class OutboxAggregationTest(TestCase):
 
     def test_total_count(self) -> None:
         assert ControlOutbox.get_total_outbox_count() == 7 + 4 + 1
+
+
+class AdaptiveBatchSizeTest(TestCase):
+    def test_adapts_to_duration(self) -> None:
+        batch_size = AdaptiveBatchSize(initial=50, minimum=10, maximum=150, target_duration=0.1)
+        category = OutboxCategory.ORGANIZATION_UPDATE
+
+        assert batch_size.get(category) == 50
+        assert batch_size.record(category, 50, 0.01) == 100
+        # Partial batches say nothing about how a full batch would perform
+        assert batch_size.record(category, 20, 0.01) == 100
+        assert batch_size.record(category, 100, 0.07) == 100
+        assert batch_size.record(category, 100, 0.01) == 150
+        assert batch_size.record(category, 150, 0.01) == 150
+
+        assert batch_size.record(category, 150, 0.2) == 75
+        assert batch_size.record(category, 75, 0.2) == 37
+        assert batch_size.record(category, 37, 0.2) == 18
+        assert batch_size.record(category, 18, 0.2) == 10
+
+        # Categories are tracked independently
+        assert batch_size.get(OutboxCategory.ORGANIZATION_MEMBER_UPDATE) == 50
+
+        batch_size.clear()
+        assert batch_size.get(category) == 50
@@ -1,8 +1,12 @@
 from collections.abc import Generator, Iterator
 from random import Random
+from unittest.mock import patch
 
 from django.core.cache import cache
+from django.http import HttpRequest
 
+from sentry import app
+from sentry.hybridcloud.models.cacheversion import RegionCacheVersion
 from sentry.hybridcloud.rpc.caching import (
     back_with_silo_cache,
     back_with_silo_cache_list,
@@ -10,7 +14,7 @@ from sentry.hybridcloud.rpc.caching import (
     control_caching_service,
     region_caching_service,
 )
-from sentry.hybridcloud.rpc.caching.impl import CacheBackend, _consume_generator
+from sentry.hybridcloud.rpc.caching.impl import CacheBackend, _consume_generator, clear_local_cache
 from sentry.organizations.services.organization.model import (
     RpcOrganizationMember,
     RpcOrganizationSummary,
@@ -18,6 +22,7 @@ from sentry.organizations.services.organization.model import (
 from sentry.organizations.services.organization.service import organization_service
 from sentry.silo.base import SiloMode
 from sentry.testutils.factories import Factories
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.testutils.silo import assume_test_silo_mode, control_silo_test, no_silo_test
 from sentry.types.region import get_local_region
@@ -327,3 +332,99 @@ def test_caching_list() -> None:
 
     cached_members = get_org_members(org.id)
     assert len(cached_members) == 0, "with members updated none are owners"
+
+
+@django_db_all(transaction=True)
+def test_caching_function_get_many() -> None:
+    cache.clear()
+    fetched: list[list[int]] = []
+
+    def get_users(user_ids: list[int]) -> list[RpcUser]:
+        fetched.append(user_ids)
+        return user_service.get_many(filter=dict(user_ids=user_ids))
+
+    @back_with_silo_cache(
+        base_key="my-test-key", silo_mode=SiloMode.REGION, t=RpcUser, many_cb=get_users
+    )
+    def get_user(user_id: int) -> RpcUser | None:
+        users = user_service.get_many(filter=dict(user_ids=[user_id]))
+        return users[0] if users else None
+
+    users = [Factories.create_user() for _ in range(3)]
+    user_ids = [u.id for u in users]
+
+    # Populates the cache used by get_one
+    assert get_user(user_ids[0])
+
+    missing_id = max(user_ids) + 100
+    results = get_user.get_many([*user_ids, missing_id])
+    assert [r.id for r in results] == user_ids
+    assert fetched == [[user_ids[1], user_ids[2], missing_id]]
+
+    # Records fetched by get_many are cached for both methods
+    assert get_user.get_many(user_ids) == results
+    assert fetched == [[user_ids[1], user_ids[2], missing_id]]
+    assert get_user.get_one(user_ids[2]) == results[2]
+
+
+@django_db_all(transaction=True)
+@override_options({"hybridcloud.caching.local_cache": True})
+def test_local_cache() -> None:
+    cache.clear()
+    clear_local_cache()
+
+    @back_with_silo_cache(base_key="my-test-key", silo_mode=SiloMode.REGION, t=RpcUser)
+    def get_user(user_id: int) -> RpcUser:
+        return user_service.get_many(filter=dict(user_ids=[user_id]))[0]
+
+    user = Factories.create_user()
+    cached_user = get_user(user.id)
+
+    with patch("sentry.hybridcloud.rpc.caching.impl.cache") as mock_cache:
+        assert get_user(user.id) == cached_user
+        assert mock_cache.get_many.call_count == 0
+
+    with assume_test_silo_mode(SiloMode.CONTROL):
+        user.update(username=user.username + "moocow")
+
+    # Bumping the version of a key from any process leaves its local entries unreachable
+    RegionCacheVersion.incr_version(get_user.key_from(user.id))
+    updated_user = get_user(user.id)
+    assert updated_user
+    assert updated_user.username == user.username
+
+    clear_local_cache()
+
+
+@django_db_all(transaction=True)
+@override_options({"hybridcloud.caching.local_cache": True})
+def test_local_cache_request_versions() -> None:
+    cache.clear()
+    clear_local_cache()
+
+    @back_with_silo_cache(base_key="my-test-key", silo_mode=SiloMode.REGION, t=RpcUser)
+    def get_user(user_id: int) -> RpcUser:
+        return user_service.get_many(filter=dict(user_ids=[user_id]))[0]
+
+    user = Factories.create_user()
+    app.env.request = HttpRequest()
+    try:
+        cached_user = get_user(user.id)
+
+        # Versions are checked once per request
+        with patch.object(RegionCacheVersion.objects, "filter") as mock_filter:
+            assert get_user(user.id) == cached_user
+            assert mock_filter.call_count == 0
+
+        # Keys cleared within the request are read at their new version
+        with assume_test_silo_mode(SiloMode.CONTROL):
+            user.update(username=user.username + "moocow")
+        region_caching_service.clear_key(
+            region_name=get_local_region().name, key=get_user.key_from(user.id)
+        )
+        updated_user = get_user(user.id)
+        assert updated_user
+        assert updated_user.username == user.username
+    finally:
+        app.env.clear()
+        clear_local_cache()
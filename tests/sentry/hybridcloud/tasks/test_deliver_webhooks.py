@@ -11,12 +11,15 @@ from sentry.hybridcloud.models.webhookpayload import MAX_ATTEMPTS, WebhookPayloa
 from sentry.hybridcloud.tasks import deliver_webhooks
 from sentry.hybridcloud.tasks.deliver_webhooks import (
     MAX_MAILBOX_DRAIN,
+    DeliveryDestination,
+    delivery_engine,
     drain_mailbox,
     drain_mailbox_parallel,
     schedule_webhook_delivery,
 )
 from sentry.testutils.cases import TestCase
 from sentry.testutils.factories import Factories
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.region import override_regions
 from sentry.testutils.silo import control_silo_test
 from sentry.types.region import Region, RegionCategory, RegionResolutionError
@@ -687,3 +690,116 @@ class DrainMailboxParallelTest(TestCase):
         assert hook.attempts == 1
 
         assert len(responses.calls) == 1
+
+
+@control_silo_test
+@override_options({"hybridcloud.webhookpayload.pooled_delivery": True})
+class DrainMailboxPooledTest(TestCase):
+    def setUp(self) -> None:
+        delivery_engine.close()
+        self.addCleanup(delivery_engine.close)
+
+    @responses.activate
+    @override_regions(region_config)
+    def test_drain_success_reuses_session(self) -> None:
+        responses.add(
+            responses.POST,
+            "http://us.testserver/extensions/github/webhook/",
+            status=200,
+            body="",
+        )
+        records = create_payloads(3, "github:123")
+        session = delivery_engine.get_session("us")
+        with patch.object(session, "close") as mock_close:
+            drain_mailbox_parallel(records[0].id)
+            assert mock_close.call_count == 0
+
+        assert not WebhookPayload.objects.filter().exists()
+        assert len(responses.calls) == 3
+        assert delivery_engine.get_session("us") is session
+        assert delivery_engine.get_destination(records[0]).in_flight == 0
+
+    @responses.activate
+    @override_regions(region_config)
+    def test_drain_does_not_keep_cookies(self) -> None:
+        responses.add(
+            responses.POST,
+            "http://us.testserver/extensions/github/webhook/",
+            status=200,
+            body="",
+            headers={"Set-Cookie": "sessionid=abc; Path=/"},
+        )
+        records = create_payloads(2, "github:123")
+        drain_mailbox_parallel(records[0].id)
+
+        assert len(responses.calls) == 2
+        assert not delivery_engine.get_session("us").cookies
+        assert "Cookie" not in responses.calls[1].request.headers
+
+    @responses.activate
+    @override_regions(region_config)
+    def test_drain_failure_backs_off_destination(self) -> None:
+        responses.add(
+            responses.POST, "http://us.testserver/extensions/github/webhook/", body=ReadTimeout()
+        )
+        webhook_one = self.create_webhook_payload(
+            mailbox_name="github:123",
+            region_name="us",
+        )
+        drain_mailbox_parallel(webhook_one.id)
+        assert len(responses.calls) == 1
+        hook = WebhookPayload.objects.get(id=webhook_one.id)
+        assert hook.attempts == 1
+
+        # Other mailboxes of the destination yield without spending attempts
+        webhook_two = self.create_webhook_payload(
+            mailbox_name="github:256",
+            region_name="us",
+        )
+        drain_mailbox_parallel(webhook_two.id)
+        assert len(responses.calls) == 1
+        hook = WebhookPayload.objects.get(id=webhook_two.id)
+        assert hook.attempts == 0
+
+        # Other providers are unaffected
+        webhook_three = self.create_webhook_payload(
+            mailbox_name="gitlab:123",
+            region_name="us",
+        )
+        drain_mailbox_parallel(webhook_three.id)
+        assert len(responses.calls) == 2
+
+    def test_destination_backoff(self) -> None:
+        destination = DeliveryDestination("us", "github", max_concurrency=2, max_rate=0)
+        assert destination.backoff_remaining() == 0
+
+        destination.record_failure()
+        first_backoff = destination.backoff_remaining()
+        assert 0 < first_backoff <= 5
+
+        destination.record_failure()
+        assert first_backoff < destination.backoff_remaining() <= 10
+
+        destination.record_success()
+        assert destination.backoff_remaining() == 0
+
+    @patch("sentry.hybridcloud.tasks.deliver_webhooks.metrics.gauge")
+    def test_destination_in_flight_gauge(self, mock_gauge) -> None:
+        destination = DeliveryDestination("us", "github", max_concurrency=2, max_rate=0)
+        with destination.acquire():
+            assert destination.in_flight == 1
+        assert destination.in_flight == 0
+
+        # The gauge goes back to 0 once the request is done.
+        assert [call.args[1] for call in mock_gauge.call_args_list] == [1, 0]
+
+    def test_destination_limits_from_options(self) -> None:
+        payload = create_payloads(1, "github:123")[0]
+        destination = delivery_engine.get_destination(payload)
+        assert destination.max_concurrency == 4
+        assert delivery_engine.get_destination(payload) is destination
+
+        with override_options({"hybridcloud.webhookpayload.destination_max_rate": 10}):
+            replaced = delivery_engine.get_destination(payload)
+        assert replaced is not destination
+        assert replaced.max_rate == 10
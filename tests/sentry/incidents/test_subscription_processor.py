@@ -40,13 +40,16 @@ from sentry.incidents.models.incident import (
     TriggerStatus,
 )
 from sentry.incidents.subscription_processor import (
+    AlertRuleStateCache,
     SubscriptionProcessor,
     build_alert_rule_stat_keys,
     build_alert_rule_trigger_stat_key,
     build_trigger_stat_keys,
     get_alert_rule_stats,
+    get_alert_rule_stats_many,
     get_redis_client,
     partition,
+    process_subscription_updates,
     update_alert_rule_stats,
 )
 from sentry.incidents.utils.types import DATA_SOURCE_SNUBA_QUERY_SUBSCRIPTION
@@ -68,6 +71,7 @@ from sentry.testutils.factories import DEFAULT_EVENT_DATA
 from sentry.testutils.helpers.alert_rule import TemporaryAlertRuleTriggerActionRegistry
 from sentry.testutils.helpers.datetime import freeze_time
 from sentry.testutils.helpers.features import with_feature
+from sentry.testutils.helpers.options import override_options
 from sentry.types.group import PriorityLevel
 from sentry.utils import json
 
@@ -1015,6 +1019,86 @@ class ProcessUpdateTest(ProcessUpdateBaseClass):
             [(trigger.alert_threshold + 1, IncidentStatus.CRITICAL, mock.ANY)],
         )
 
+    def test_process_subscription_updates(self):
+        # Updates of the same subscription within a batch are processed in
+        # order, sharing the trigger counts of a single processor
+        rule = self.rule
+        trigger = self.trigger
+        rule.update(threshold_period=2)
+        updates = [
+            (
+                self.build_subscription_update(
+                    subscription, value=trigger.alert_threshold + 1, time_delta=time_delta
+                ),
+                subscription,
+            )
+            for time_delta in (timedelta(minutes=-2), timedelta(minutes=-1))
+            for subscription in (self.sub, self.other_sub)
+        ]
+        with (
+            self.feature(["organizations:incidents", "organizations:performance-view"]),
+            self.capture_on_commit_callbacks(execute=True),
+        ):
+            process_subscription_updates(updates)
+
+        incident = self.assert_active_incident(rule)
+        self.assert_trigger_exists_with_status(incident, trigger, TriggerStatus.ACTIVE)
+        self.assert_active_incident(rule, self.other_sub)
+        for subscription in (self.sub, self.other_sub):
+            last_update, alert_counts, _ = get_alert_rule_stats(rule, subscription, [trigger])
+            assert last_update == timezone.now().replace(microsecond=0) - timedelta(minutes=1)
+            assert alert_counts[trigger.id] == 0
+
+    @override_options({"incidents.subscription-processor.state-cache.enabled": True})
+    def test_process_subscription_updates_state_cache(self):
+        rule = self.rule
+        trigger = self.trigger
+        rule.update(threshold_period=2)
+        with (
+            self.feature(["organizations:incidents", "organizations:performance-view"]),
+            mock.patch(
+                "sentry.incidents.subscription_processor.alert_rule_state_cache",
+                AlertRuleStateCache(),
+            ),
+        ):
+            update = self.build_subscription_update(
+                self.sub, value=trigger.alert_threshold + 1, time_delta=timedelta(minutes=-2)
+            )
+            process_subscription_updates([(update, self.sub)])
+            self.assert_no_active_incident(rule)
+
+            # The cached trigger is replaced once the trigger is saved
+            trigger.update(alert_threshold=trigger.alert_threshold + 10)
+            update = self.build_subscription_update(
+                self.sub, value=trigger.alert_threshold + 1, time_delta=timedelta(minutes=-1)
+            )
+            with self.capture_on_commit_callbacks(execute=True):
+                process_subscription_updates([(update, self.sub)])
+
+        incident = self.assert_active_incident(rule)
+        self.assert_actions_fired_for_incident(
+            incident,
+            [self.action],
+            [(trigger.alert_threshold + 1, IncidentStatus.CRITICAL, mock.ANY)],
+        )
+
+    def test_process_subscription_updates_removed_alert_rule(self):
+        message = self.build_subscription_update(self.sub)
+        self.rule.delete()
+        subscription_id = self.sub.id
+        snuba_query = self.sub.snuba_query
+        with (
+            self.feature(["organizations:incidents", "organizations:performance-view"]),
+            self.tasks(),
+            self.capture_on_commit_callbacks(execute=True),
+        ):
+            process_subscription_updates([(message, self.sub)])
+        self.metrics.incr.assert_called_once_with(
+            "incidents.alert_rules.no_alert_rule_for_subscription"
+        )
+        assert not QuerySubscription.objects.filter(id=subscription_id).exists()
+        assert not SnubaQuery.objects.filter(id=snuba_query.id).exists()
+
     def test_alert_multiple_triggers_non_consecutive(self):
         # Verify that a rule that expects two consecutive updates to be over the
         # alert threshold doesn't trigger if there are two updates that are above with
@@ -3770,3 +3854,72 @@ class TestUpdateAlertRuleStats(TestCase):
         ]
 
         assert results == [int(date.timestamp()), 20, 10, 3, 15]
+
+    def test_pipeline(self):
+        alert_rule = AlertRule(id=1)
+        sub = QuerySubscription(project_id=2)
+        date = timezone.now()
+        client = get_redis_client()
+        pipeline = client.pipeline()
+        update_alert_rule_stats(alert_rule, sub, date, {3: 20}, {3: 10}, pipeline=pipeline)
+        assert client.get("{alert_rule:1:project:2}:last_update") is None
+
+        pipeline.execute()
+        assert int(client.get("{alert_rule:1:project:2}:last_update")) == int(date.timestamp())
+
+
+class TestGetAlertRuleStatsMany(TestCase):
+    def test(self):
+        sub = QuerySubscription(project_id=2)
+        triggers = [AlertRuleTrigger(id=3)]
+        timestamp = timezone.now().replace(microsecond=0)
+        update_alert_rule_stats(AlertRule(id=1), sub, timestamp, {3: 1}, {3: 2})
+
+        assert get_alert_rule_stats_many(
+            [(AlertRule(id=1), sub, triggers), (AlertRule(id=5), sub, triggers)]
+        ) == [
+            (timestamp, {3: 1}, {3: 2}),
+            get_alert_rule_stats(AlertRule(id=5), sub, triggers),
+        ]
+        assert get_alert_rule_stats_many([]) == []
+
+
+class TestAlertRuleStateCache(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.alert_rule = self.create_alert_rule()
+        self.trigger = create_alert_rule_trigger(self.alert_rule, CRITICAL_TRIGGER_LABEL, 100)
+        self.sub = self.alert_rule.snuba_query.subscriptions.get()
+        self.cache = AlertRuleStateCache()
+
+    def test_hit(self):
+        alert_rule, triggers = self.cache.get_many([self.sub])[self.sub.id]
+        assert alert_rule == self.alert_rule
+        assert triggers == [self.trigger]
+
+        with self.assertNumQueries(0):
+            cached_alert_rule, cached_triggers = self.cache.get_many([self.sub])[self.sub.id]
+        assert cached_alert_rule == self.alert_rule
+        assert cached_alert_rule is not alert_rule
+        assert cached_triggers == [self.trigger]
+
+    def test_invalidated_on_save(self):
+        self.cache.get_many([self.sub])
+        self.trigger.update(alert_threshold=200)
+        _, triggers = self.cache.get_many([self.sub])[self.sub.id]
+        assert triggers[0].alert_threshold == 200
+
+        self.alert_rule.update(threshold_period=5)
+        alert_rule, _ = self.cache.get_many([self.sub])[self.sub.id]
+        assert alert_rule.threshold_period == 5
+
+    def test_expired(self):
+        self.cache = AlertRuleStateCache(ttl=0)
+        self.cache.get_many([self.sub])
+        with mock.patch.object(self.cache, "_load", wraps=self.cache._load) as load:
+            self.cache.get_many([self.sub])
+        assert load.call_count == 1
+
+    def test_no_alert_rule(self):
+        self.alert_rule.delete()
+        assert self.cache.get_many([self.sub]) == {}
@@ -28,3 +28,13 @@ class ProjectOptionManagerTest(TestCase):
         ProjectOption.objects.create(project=self.project, key="foo", value="bar")
         result = ProjectOption.objects.get_value_bulk([self.project], "foo")
         assert result == {self.project: "bar"}
+
+    def test_prefetch_all_values(self):
+        other_project = self.create_project()
+        ProjectOption.objects.set_value(self.project, "foo", "bar")
+        ProjectOption.objects.clear_local_cache()
+
+        ProjectOption.objects.prefetch_all_values([self.project.id, other_project.id])
+        with self.assertNumQueries(0):
+            assert ProjectOption.objects.get_all_values(self.project) == {"foo": "bar"}
+            assert ProjectOption.objects.get_all_values(other_project) == {}
@@ -11,6 +11,7 @@ from sentry.constants import ObjectStatus
 from sentry.monitors.clock_tasks.check_missed import (
     dispatch_check_missing,
     mark_environment_missing,
+    mark_environments_missing,
 )
 from sentry.monitors.clock_tasks.producer import MONITORS_CLOCK_TASKS_CODEC
 from sentry.monitors.models import (
@@ -754,3 +755,72 @@ class MonitorClockTasksCheckMissingTest(TestCase):
         assert not MonitorCheckIn.objects.filter(
             monitor_environment=monitor_environment.id, status=CheckInStatus.MISSED
         ).exists()
+
+    def test_mark_environments_missing(self):
+        ts = timezone.now().replace(second=0, microsecond=0)
+
+        monitor = Monitor.objects.create(
+            organization_id=self.organization.id,
+            project_id=self.project.id,
+            type=MonitorType.CRON_JOB,
+            config={
+                "schedule_type": ScheduleType.CRONTAB,
+                "schedule": "* * * * *",
+                "max_runtime": None,
+                "checkin_margin": None,
+            },
+        )
+        missed_environments = [
+            MonitorEnvironment.objects.create(
+                monitor=monitor,
+                environment_id=self.create_environment(name=f"missed-{i}").id,
+                last_checkin=ts - timedelta(minutes=2),
+                next_checkin=ts - timedelta(minutes=1),
+                next_checkin_latest=ts,
+                status=MonitorStatus.OK,
+            )
+            for i in range(3)
+        ]
+
+        # Checked in since the missed task was dispatched
+        ok_environment = MonitorEnvironment.objects.create(
+            monitor=monitor,
+            environment_id=self.create_environment(name="ok").id,
+            last_checkin=ts,
+            next_checkin=ts + timedelta(minutes=1),
+            next_checkin_latest=ts + timedelta(minutes=1),
+            status=MonitorStatus.OK,
+        )
+
+        with mock.patch("sentry.monitors.clock_tasks.check_missed.MARK_MISSING_CHUNK_SIZE", 2):
+            mark_environments_missing(
+                [env.id for env in missed_environments] + [ok_environment.id], ts
+            )
+
+        for missed_environment in missed_environments:
+            monitor_environment = MonitorEnvironment.objects.get(id=missed_environment.id)
+            assert monitor_environment.status == MonitorStatus.ERROR
+            assert monitor_environment.last_checkin == ts - timedelta(minutes=2)
+            assert monitor_environment.next_checkin == ts
+            assert monitor_environment.next_checkin_latest == ts + timedelta(minutes=1)
+
+            missed_checkin = MonitorCheckIn.objects.get(
+                monitor_environment=monitor_environment, status=CheckInStatus.MISSED
+            )
+            assert missed_checkin.date_added == ts - timedelta(minutes=1)
+            assert missed_checkin.expected_time == ts - timedelta(minutes=1)
+            assert missed_checkin.date_clock == ts
+            assert missed_checkin.monitor_config == monitor.config
+
+        ok_environment.refresh_from_db()
+        assert ok_environment.status == MonitorStatus.OK
+        assert not MonitorCheckIn.objects.filter(monitor_environment=ok_environment).exists()
+
+        # Marking the same environments again is a no-op
+        mark_environments_missing([env.id for env in missed_environments], ts)
+        assert (
+            MonitorCheckIn.objects.filter(
+                monitor_environment__in=missed_environments, status=CheckInStatus.MISSED
+            ).count()
+            == 3
+        )
@@ -5,7 +5,11 @@ from arroyo.backends.kafka import KafkaPayload
 from django.utils import timezone
 from sentry_kafka_schemas.schema_types.monitors_clock_tasks_v1 import MarkTimeout
 
-from sentry.monitors.clock_tasks.check_timeout import dispatch_check_timeout, mark_checkin_timeout
+from sentry.monitors.clock_tasks.check_timeout import (
+    dispatch_check_timeout,
+    mark_checkin_timeout,
+    mark_checkins_timeout,
+)
 from sentry.monitors.clock_tasks.producer import MONITORS_CLOCK_TASKS_CODEC
 from sentry.monitors.logic.mark_failed import mark_failed
 from sentry.monitors.models import (
@@ -500,3 +504,75 @@ class MonitorClockTasksCheckTimeoutTest(TestCase):
         # Second call does NOT trigger a mark_failed
         mark_checkin_timeout(checkin.id, ts + timedelta(minutes=31))
         assert mock_mark_failed.call_count == 1
+
+    @mock.patch("sentry.monitors.clock_tasks.check_timeout.mark_failed", wraps=mark_failed)
+    def test_mark_checkins_timeout(self, mock_mark_failed):
+        ts = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+        # Schedule is once a day
+        monitor = Monitor.objects.create(
+            organization_id=self.organization.id,
+            project_id=self.project.id,
+            type=MonitorType.CRON_JOB,
+            config={
+                "schedule_type": ScheduleType.CRONTAB,
+                "schedule": "0 0 * * *",
+                "checkin_margin": None,
+                "max_runtime": 30,
+            },
+        )
+
+        def create_checkin(environment_name: str, status: int, date_added):
+            monitor_environment = MonitorEnvironment.objects.create(
+                monitor=monitor,
+                environment_id=self.create_environment(name=environment_name).id,
+                last_checkin=ts,
+                next_checkin=ts + timedelta(hours=24),
+                next_checkin_latest=ts + timedelta(hours=24, minutes=1),
+                status=MonitorStatus.OK,
+            )
+            return MonitorCheckIn.objects.create(
+                monitor=monitor,
+                monitor_environment=monitor_environment,
+                project_id=self.project.id,
+                status=status,
+                date_added=date_added,
+                date_updated=date_added,
+                timeout_at=date_added + timedelta(minutes=30),
+            )
+
+        timed_out = create_checkin("timed-out", CheckInStatus.IN_PROGRESS, ts)
+
+        # A newer check-in completed after the timed out check-in
+        superseded = create_checkin("superseded", CheckInStatus.IN_PROGRESS, ts)
+        MonitorCheckIn.objects.create(
+            monitor=monitor,
+            monitor_environment=superseded.monitor_environment,
+            project_id=self.project.id,
+            status=CheckInStatus.OK,
+            date_added=ts + timedelta(minutes=10),
+            date_updated=ts + timedelta(minutes=10),
+        )
+
+        mark_checkins_timeout([timed_out.id, superseded.id], ts + timedelta(minutes=30))
+
+        marked = MonitorCheckIn.objects.filter(
+            id__in=[timed_out.id, superseded.id], status=CheckInStatus.TIMEOUT
+        )
+        assert marked.count() == 2
+
+        # Only the monitor environment without a newer result is failed
+        assert mock_mark_failed.call_count == 1
+        assert mock_mark_failed.mock_calls[0].args[0].id == timed_out.id
+        assert mock_mark_failed.mock_calls[0].args[0].status == CheckInStatus.TIMEOUT
+
+        assert MonitorEnvironment.objects.filter(
+            id=timed_out.monitor_environment_id, status=MonitorStatus.ERROR
+        ).exists()
+        assert MonitorEnvironment.objects.filter(
+            id=superseded.monitor_environment_id, status=MonitorStatus.OK
+        ).exists()
+
+        # Check-ins which already timed out are not processed again
+        mark_checkins_timeout([timed_out.id, superseded.id], ts + timedelta(minutes=31))
+        assert mock_mark_failed.call_count == 1
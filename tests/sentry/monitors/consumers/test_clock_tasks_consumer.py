@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest import mock
 
 from arroyo.backends.kafka import KafkaPayload
@@ -88,3 +88,68 @@ def test_dispatch_mark_unknown(mock_mark_checkin_unknown):
 
     assert mock_mark_checkin_unknown.call_count == 1
     assert mock_mark_checkin_unknown.mock_calls[0] == mock.call(1, ts)
+
+
+@mock.patch("sentry.monitors.consumers.clock_tasks_consumer.mark_checkin_unknown")
+@mock.patch("sentry.monitors.consumers.clock_tasks_consumer.mark_checkins_timeout")
+@mock.patch("sentry.monitors.consumers.clock_tasks_consumer.mark_environments_missing")
+def test_batched_dispatch(
+    mock_mark_environments_missing, mock_mark_checkins_timeout, mock_mark_checkin_unknown
+):
+    ts = timezone.now().replace(second=0, microsecond=0)
+    next_ts = ts + timedelta(minutes=1)
+
+    factory = MonitorClockTasksStrategyFactory(mode="batched", max_batch_size=5)
+    consumer = factory.create_with_partitions(mock.Mock(), {partition: 0})
+
+    # Tasks of the later tick are sent first, they are still processed last
+    send_task(
+        consumer,
+        next_ts,
+        {"type": "mark_missing", "ts": next_ts.timestamp(), "monitor_environment_id": 1},
+    )
+    send_task(
+        consumer,
+        ts,
+        {"type": "mark_missing", "ts": ts.timestamp(), "monitor_environment_id": 1},
+    )
+    send_task(
+        consumer,
+        ts,
+        {"type": "mark_missing", "ts": ts.timestamp(), "monitor_environment_id": 2},
+    )
+    send_task(
+        consumer,
+        ts,
+        {
+            "type": "mark_timeout",
+            "ts": ts.timestamp(),
+            "monitor_environment_id": 3,
+            "checkin_id": 4,
+        },
+    )
+    send_task(
+        consumer,
+        ts,
+        {
+            "type": "mark_unknown",
+            "ts": ts.timestamp(),
+            "monitor_environment_id": 3,
+            "checkin_id": 5,
+        },
+    )
+
+    # The batch is processed once the next task is received
+    assert mock_mark_environments_missing.call_count == 0
+    send_task(
+        consumer,
+        next_ts,
+        {"type": "mark_missing", "ts": next_ts.timestamp(), "monitor_environment_id": 2},
+    )
+
+    assert mock_mark_environments_missing.mock_calls == [
+        mock.call([1, 2], ts),
+        mock.call([1], next_ts),
+    ]
+    assert mock_mark_checkins_timeout.mock_calls == [mock.call([4], ts)]
+    assert mock_mark_checkin_unknown.mock_calls == [mock.call(5, ts)]
@@ -1,6 +1,7 @@
 import contextlib
 import uuid
-from collections.abc import Generator, Mapping, Sequence
+from collections.abc import Callable, Generator, Mapping, Sequence
+from concurrent.futures import Executor, Future
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest import mock
@@ -19,7 +20,11 @@ from sentry.constants import ObjectStatus
 from sentry.db.models import BoundedPositiveIntegerField
 from sentry.models.environment import Environment
 from sentry.monitors.constants import TIMEOUT, PermitCheckInStatus
-from sentry.monitors.consumers.monitor_consumer import StoreMonitorCheckInStrategyFactory
+from sentry.monitors.consumers.monitor_consumer import (
+    StoreMonitorCheckInStrategyFactory,
+    prefetch_checkin_groups,
+)
+from sentry.monitors.logic.mark_ok import mark_ok
 from sentry.monitors.models import (
     CheckInStatus,
     Monitor,
@@ -33,6 +38,7 @@ from sentry.monitors.processing_errors.errors import ProcessingErrorsException,
 from sentry.monitors.types import CheckinItem
 from sentry.testutils.asserts import assert_org_audit_log_exists
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.outbox import outbox_runner
 from sentry.utils import json
 from sentry.utils.outcomes import Outcome
@@ -42,6 +48,21 @@ class ExpectNoProcessingError:
     pass
 
 
+class SynchronousExecutor(Executor):
+    """
+    Runs the submitted functions on the calling thread, so that the database
+    writes of the check-in groups happen within the test transaction.
+    """
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+        future: Future[Any] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
 class MonitorConsumerTest(TestCase):
     def setUp(self):
         super().setUp()
@@ -69,6 +90,16 @@ class MonitorConsumerTest(TestCase):
         commit = mock.Mock()
         return factory.create_with_partitions(commit, {self.partition: 0})
 
+    def create_bulk_consumer(self, max_batch_size: int):
+        factory = StoreMonitorCheckInStrategyFactory(
+            mode="batched-parallel", max_batch_size=max_batch_size
+        )
+        with mock.patch(
+            "sentry.monitors.consumers.monitor_consumer.ThreadPoolExecutor",
+            SynchronousExecutor,
+        ):
+            return factory.create_with_partitions(mock.Mock(), {self.partition: 0})
+
     def send_checkin(
         self,
         monitor_slug: str,
@@ -1097,6 +1128,128 @@ class MonitorConsumerTest(TestCase):
 
         assert try_monitor_clock_tick.call_count == 1
 
+    @override_options({"crons.consumer.bulk-checkin-processing": True})
+    @mock.patch("sentry.monitors.consumers.monitor_consumer.mark_ok", wraps=mark_ok)
+    def test_parallel_bulk_processing(self, mock_mark_ok):
+        monitor = self._create_monitor(slug="my-monitor")
+
+        now = datetime.now().replace(second=0, microsecond=0)
+
+        # Bring the monitor environment into an OK state
+        self.send_checkin(monitor.slug, ts=now)
+        assert mock_mark_ok.call_count == 1
+
+        consumer = self.create_bulk_consumer(max_batch_size=4)
+
+        guids = []
+        for minutes in (1, 2, 3):
+            self.send_checkin(monitor.slug, consumer=consumer, ts=now + timedelta(minutes=minutes))
+            guids.append(self.guid)
+        self.send_checkin(
+            monitor.slug, status="error", consumer=consumer, ts=now + timedelta(minutes=4)
+        )
+        error_guid = self.guid
+
+        # One more check-in to process the batch
+        self.send_checkin(monitor.slug, consumer=consumer, ts=now + timedelta(minutes=5))
+
+        # The run of OK check-ins marked the monitor environment as OK once
+        assert mock_mark_ok.call_count == 2
+
+        checkins = [MonitorCheckIn.objects.get(guid=guid) for guid in guids]
+        assert all(checkin.status == CheckInStatus.OK for checkin in checkins)
+
+        # Each check-in is expected after the previous one, as when processed
+        # one at a time
+        for previous, checkin in zip(checkins, checkins[1:]):
+            assert checkin.expected_time == monitor.get_next_expected_checkin(previous.date_added)
+
+        # The error check-in was processed after the OK check-ins were stored
+        error_checkin = MonitorCheckIn.objects.get(guid=error_guid)
+        assert error_checkin.status == CheckInStatus.ERROR
+        assert error_checkin.expected_time == monitor.get_next_expected_checkin(
+            checkins[-1].date_added
+        )
+
+        monitor_environment = MonitorEnvironment.objects.get(
+            id=error_checkin.monitor_environment_id
+        )
+        assert monitor_environment.status == MonitorStatus.ERROR
+        assert monitor_environment.last_checkin == error_checkin.date_added
+
+    @override_options({"crons.consumer.bulk-checkin-processing": True})
+    def test_parallel_bulk_processing_existing_guid(self):
+        monitor = self._create_monitor(slug="my-monitor")
+
+        now = datetime.now().replace(second=0, microsecond=0)
+        self.send_checkin(monitor.slug, ts=now)
+
+        consumer = self.create_bulk_consumer(max_batch_size=2)
+
+        # An in-progress check-in which is closed within the same batch
+        guid = uuid.uuid4().hex
+        self.send_checkin(
+            monitor.slug,
+            guid=guid,
+            status="in_progress",
+            consumer=consumer,
+            ts=now + timedelta(minutes=1),
+        )
+        self.send_checkin(monitor.slug, guid=guid, consumer=consumer, ts=now + timedelta(minutes=2))
+        self.send_checkin(monitor.slug, consumer=consumer, ts=now + timedelta(minutes=3))
+
+        checkin = MonitorCheckIn.objects.get(guid=guid)
+        assert checkin.status == CheckInStatus.OK
+        assert checkin.duration is not None
+
+    @override_options({"crons.consumer.bulk-checkin-processing": True})
+    def test_parallel_bulk_processing_conflicting_guid(self):
+        monitor = self._create_monitor(slug="my-monitor")
+
+        now = datetime.now().replace(second=0, microsecond=0)
+        self.send_checkin(monitor.slug, ts=now)
+        monitor_environment = MonitorEnvironment.objects.get(monitor=monitor)
+
+        consumer = self.create_bulk_consumer(max_batch_size=2)
+
+        conflicting_guid = uuid.uuid4().hex
+
+        def prefetch(checkin_mapping):
+            group_states = prefetch_checkin_groups(checkin_mapping)
+            # An in-progress check-in created by another consumer once the
+            # batch was prefetched
+            MonitorCheckIn.objects.create(
+                monitor=monitor,
+                monitor_environment=monitor_environment,
+                project_id=self.project.id,
+                guid=conflicting_guid,
+                status=CheckInStatus.IN_PROGRESS,
+                date_added=now + timedelta(minutes=1),
+            )
+            return group_states
+
+        with mock.patch(
+            "sentry.monitors.consumers.monitor_consumer.prefetch_checkin_groups",
+            side_effect=prefetch,
+        ):
+            self.send_checkin(
+                monitor.slug,
+                guid=conflicting_guid,
+                consumer=consumer,
+                ts=now + timedelta(minutes=2),
+            )
+            self.send_checkin(monitor.slug, consumer=consumer, ts=now + timedelta(minutes=3))
+            guid = self.guid
+            self.send_checkin(monitor.slug, consumer=consumer, ts=now + timedelta(minutes=4))
+
+        # The conflicting check-in is processed as an update of the existing one
+        conflicting = MonitorCheckIn.objects.get(guid=conflicting_guid)
+        assert conflicting.status == CheckInStatus.OK
+        assert conflicting.duration is not None
+
+        # The rest of the run is still stored
+        assert MonitorCheckIn.objects.get(guid=guid).status == CheckInStatus.OK
+
     @mock.patch("sentry.quotas.backend.check_accept_monitor_checkin")
     def test_monitor_quotas_accept(self, check_accept_monitor_checkin):
         check_accept_monitor_checkin.return_value = PermitCheckInStatus.ACCEPT
@@ -18,6 +18,7 @@ from sentry.options.manager import (
     FLAG_STOREONLY,
     NotWritableReason,
     OptionsManager,
+    OptionsSnapshot,
     UnknownOption,
     UpdateChannel,
 )
@@ -373,6 +374,33 @@ class OptionsManagerTest(TestCase):
         keys = list(self.manager.filter(flag=FLAG_REQUIRED))
         assert {k.name for k in keys} == {"required", "nostorerequired"}
 
+    def test_snapshot(self):
+        self.manager.register("bar", default=1)
+        self.manager.set("foo", "a")
+
+        snapshot = self.manager.snapshot()
+        assert isinstance(snapshot, OptionsSnapshot)
+        assert snapshot["foo"] == "a"
+        assert snapshot.get("bar") == 1
+        assert "foo" in snapshot
+        assert "unknown" not in snapshot
+        assert set(snapshot) == set(self.manager.registry)
+        assert len(snapshot) == len(self.manager.registry)
+        with pytest.raises(UnknownOption):
+            snapshot["unknown"]
+
+        # Values read from the snapshot don't change until a new one is taken.
+        self.manager.set("foo", "b")
+        with patch.object(self.manager, "get") as get:
+            assert snapshot["foo"] == "a"
+        assert not get.called
+
+        assert self.manager.snapshot() is snapshot
+        new_snapshot = self.manager.snapshot(max_age=0)
+        assert new_snapshot is not snapshot
+        assert new_snapshot["foo"] == "b"
+        assert self.manager.snapshot() is new_snapshot
+
     def test_isset(self):
         self.manager.register("basic")
         assert self.manager.isset("basic") is False
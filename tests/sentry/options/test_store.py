@@ -9,7 +9,7 @@ from django.test import override_settings
 
 from sentry.models.options.option import Option
 from sentry.options.manager import OptionsManager, UpdateChannel
-from sentry.options.store import OptionsStore
+from sentry.options.store import CHANGE_CACHE_KEY, VERSION_CACHE_KEY, OptionsStore
 from sentry.testutils.cases import TestCase
 from sentry.testutils.silo import no_silo_test
 
@@ -164,3 +164,83 @@ class OptionsStoreTest(TestCase):
         mocked_time.return_value = 26
         store.clean_local_cache()
         assert not store._local_cache
+
+    def test_publish_change(self):
+        store, key = self.store, self.key
+
+        store.set(key, "bar", UpdateChannel.CLI)
+        store.set(key, "baz", UpdateChannel.CLI)
+        assert store.cache.get(VERSION_CACHE_KEY) == 2
+        assert store.cache.get(CHANGE_CACHE_KEY % 2) == key.cache_key
+
+        store.delete(key)
+        assert store.cache.get(VERSION_CACHE_KEY) == 3
+
+    @patch("sentry.options.store.time")
+    def test_push_invalidation(self, mocked_time):
+        # Another process, reading from the same cache.
+        reader = OptionsStore(cache=self.store.cache)
+        reader.configure_push_invalidation(enabled=True, check_interval=1, ttl=300)
+        key, other_key = self.make_key(10, 0), self.make_key(10, 0)
+
+        mocked_time.return_value = 100
+        self.store.set(key, "bar", UpdateChannel.CLI)
+        self.store.set(other_key, "bar", UpdateChannel.CLI)
+        assert reader.get(key) == "bar"
+        assert reader.get(other_key) == "bar"
+
+        self.store.set(key, "baz", UpdateChannel.CLI)
+        # The version is not checked again until the interval passed.
+        assert reader.get(key) == "bar"
+
+        mocked_time.return_value = 101
+        with patch.object(reader.cache, "get_many", wraps=reader.cache.get_many) as get_many:
+            assert reader.get(key) == "baz"
+        # Only the changed option was reloaded.
+        assert get_many.call_args_list[-1].args == ([key.cache_key],)
+        assert reader._stats["reloads"] == 1
+        assert reader._stats["reloaded"] == 1
+
+        # Options are not fetched again once their TTL expires.
+        mocked_time.return_value = 200
+        with patch.object(reader.cache, "get", side_effect=RuntimeError()):
+            assert reader.get(key) == "baz"
+            assert reader.get(other_key) == "bar"
+
+    @patch("sentry.options.store.time")
+    def test_push_invalidation_lost_version(self, mocked_time):
+        reader = OptionsStore(cache=self.store.cache)
+        reader.configure_push_invalidation(enabled=True, check_interval=1, ttl=300)
+        key, other_key = self.make_key(10, 0), self.make_key(10, 0)
+
+        mocked_time.return_value = 100
+        self.store.set(key, "bar", UpdateChannel.CLI)
+        self.store.set(other_key, "bar", UpdateChannel.CLI)
+        assert reader.get(key) == "bar"
+        assert reader.get(other_key) == "bar"
+
+        # The version starts over once evicted, every option is reloaded.
+        self.store.cache.delete(VERSION_CACHE_KEY)
+        self.store.set(key, "baz", UpdateChannel.CLI)
+        mocked_time.return_value = 101
+        assert reader.get(key) == "baz"
+        assert reader.get(other_key) == "bar"
+        assert reader._stats["reloaded"] == 2
+
+    @patch("sentry.utils.metrics.incr")
+    @patch("sentry.options.store.time")
+    def test_flush_stats(self, mocked_time, mock_incr):
+        store, key = self.store, self.key
+
+        mocked_time.return_value = 100
+        store.set(key, "bar", UpdateChannel.CLI)
+        assert store.get(key) == "bar"
+
+        mocked_time.return_value = 105
+        assert store.get(key) == "bar"
+        assert not mock_incr.called
+
+        # The stats are flushed on reads once the interval passed.
+        mocked_time.return_value = 110
+        assert store.get(key) == "bar"
+        mock_incr.assert_any_call("options.local_cache.hit", amount=2, tags={"invalidation": "ttl"})
@@ -2387,3 +2387,61 @@ def test_get_current_widget_specs(
     ):
         specs = get_current_widget_specs(default_project.organization)
     assert specs == expected
+
+
+@django_db_all
+@override_options({"on_demand_metrics.metric_specs_cache.enabled": True})
+def test_get_metric_extraction_config_cached_specs(
+    default_project: Project, factories, default_organization
+) -> None:
+    other_project = factories.create_project(organization=default_organization)
+    with Feature(ON_DEMAND_METRICS):
+        create_alert("count()", "transaction.duration:>=1000", default_project)
+        create_alert("count()", "transaction.duration:>=1000", other_project)
+
+        with (
+            mock.patch("sentry.relay.config.metric_extraction._local_metric_specs", {}),
+            mock.patch.object(
+                OnDemandMetricSpec,
+                "to_metric_spec",
+                autospec=True,
+                side_effect=OnDemandMetricSpec.to_metric_spec,
+            ) as to_metric_spec,
+        ):
+            config = get_metric_extraction_config(default_project)
+            generated = to_metric_spec.call_count
+            assert generated > 0
+
+            # The specs generated for the first project are shared by the whole org.
+            assert get_metric_extraction_config(other_project) == config
+            assert to_metric_spec.call_count == generated
+
+            # Editing the alert changes the query, generating new specs.
+            create_alert("count()", "transaction.duration:>=2000", other_project)
+            other_config = get_metric_extraction_config(other_project)
+            assert other_config is not None
+            assert len(other_config["metrics"]) == 2
+            assert to_metric_spec.call_count > generated
+
+
+@django_db_all
+@override_options({"on_demand_metrics.metric_specs_cache.enabled": True})
+def test_get_metric_extraction_config_project_dependent_specs_not_cached(
+    default_project: Project,
+) -> None:
+    with Feature(ON_DEMAND_METRICS):
+        create_alert("apdex(10)", "transaction.duration:>=1000", default_project)
+
+        with (
+            mock.patch("sentry.relay.config.metric_extraction._local_metric_specs", {}),
+            mock.patch.object(
+                OnDemandMetricSpec,
+                "to_metric_spec",
+                autospec=True,
+                side_effect=OnDemandMetricSpec.to_metric_spec,
+            ) as to_metric_spec,
+        ):
+            get_metric_extraction_config(default_project)
+            generated = to_metric_spec.call_count
+            get_metric_extraction_config(default_project)
+            assert to_metric_spec.call_count == 2 * generated
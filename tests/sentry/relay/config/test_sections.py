@@ -0,0 +1,102 @@
+from unittest import mock
+
+import pytest
+
+from sentry.relay.config import get_filter_settings, get_project_config
+from sentry.relay.config.sections import (
+    ALERT_RULES,
+    DASHBOARDS,
+    DYNAMIC_SAMPLING,
+    ORGANIZATION_OPTIONS,
+    PROJECT_OPTIONS,
+    ConfigSections,
+    get_trigger_dependencies,
+)
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.pytest.fixtures import django_db_all
+from sentry.testutils.silo import region_silo_test
+
+
+@pytest.mark.parametrize(
+    "trigger,dependencies",
+    [
+        ("projectoption.post_save", {PROJECT_OPTIONS}),
+        ("organizationoption.set_value", {ORGANIZATION_OPTIONS}),
+        ("dashboards:create-on-demand-metric", {DASHBOARDS}),
+        ("alerts:create-on-demand-metric", {ALERT_RULES}),
+        ("dynamic_sampling:boost_release", {DYNAMIC_SAMPLING}),
+        ("dynamic_sampling_boost_low_volume_projects", {DYNAMIC_SAMPLING}),
+        ("projectkey.post_save", set()),
+        ("invalidate-all", None),
+        (None, None),
+    ],
+)
+def test_get_trigger_dependencies(trigger, dependencies):
+    assert get_trigger_dependencies(trigger) == dependencies
+
+
+@django_db_all
+@region_silo_test
+@override_options({"relay.project-config-sections.enabled": True})
+def test_sections_reused_unless_stale(default_project):
+    build = mock.Mock(return_value={"a": 1})
+
+    assert ConfigSections().get_or_build("filterSettings", default_project, build) == {"a": 1}
+    assert build.call_count == 1
+
+    # Dynamic sampling does not affect filters, the cached section is reused.
+    sections = ConfigSections({DYNAMIC_SAMPLING})
+    assert sections.get_or_build("filterSettings", default_project, build) == {"a": 1}
+    assert build.call_count == 1
+    assert sections.reuse_ratio == 1.0
+
+    build.return_value = {"a": 2}
+    sections = ConfigSections({PROJECT_OPTIONS})
+    assert sections.get_or_build("filterSettings", default_project, build) == {"a": 2}
+    # Sections are built once per project for the configs computed together.
+    assert sections.get_or_build("filterSettings", default_project, build) == {"a": 2}
+    assert build.call_count == 2
+    assert sections.reuse_ratio == 0.0
+
+    assert ConfigSections().get_or_build("filterSettings", default_project, build) == {"a": 2}
+    assert build.call_count == 3
+
+
+@django_db_all
+@region_silo_test
+def test_sections_disabled(default_project):
+    build = mock.Mock(return_value=None)
+
+    sections = ConfigSections({DYNAMIC_SAMPLING})
+    sections.get_or_build("filterSettings", default_project, build)
+    sections.get_or_build("filterSettings", default_project, build)
+    assert build.call_count == 2
+    assert sections.reuse_ratio is None
+
+
+@django_db_all
+@region_silo_test
+@override_options({"relay.project-config-sections.enabled": True})
+def test_get_project_config_reuses_sections(default_project):
+    default_project.update_option("sentry:blacklisted_ips", ["127.0.0.1"])
+    keys = [default_project.key_set.get()]
+
+    config = get_project_config(default_project, keys, sections=ConfigSections()).to_dict()
+    assert config["config"]["filterSettings"]["clientIps"] == {"blacklistedIps": ["127.0.0.1"]}
+
+    default_project.update_option("sentry:blacklisted_ips", ["127.0.0.2"])
+
+    with mock.patch(
+        "sentry.relay.config.get_filter_settings", wraps=get_filter_settings
+    ) as mock_get_filter_settings:
+        config = get_project_config(
+            default_project, keys, sections=ConfigSections({DASHBOARDS})
+        ).to_dict()
+        assert not mock_get_filter_settings.called
+        assert config["config"]["filterSettings"]["clientIps"] == {"blacklistedIps": ["127.0.0.1"]}
+
+        config = get_project_config(
+            default_project, keys, sections=ConfigSections({PROJECT_OPTIONS})
+        ).to_dict()
+        assert mock_get_filter_settings.call_count == 1
+        assert config["config"]["filterSettings"]["clientIps"] == {"blacklistedIps": ["127.0.0.2"]}
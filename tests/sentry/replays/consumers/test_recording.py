@@ -7,6 +7,7 @@ from datetime import datetime
 from unittest.mock import ANY, patch
 
 import msgpack
+import pytest
 from arroyo.backends.kafka import KafkaPayload
 from arroyo.types import BrokerValue, Message, Partition, Topic
 from sentry_kafka_schemas.schema_types.ingest_replay_recordings_v1 import ReplayRecording
@@ -471,6 +472,36 @@ class ThreadedRecordingTestCase(RecordingTestCase):
     force_synchronous = False
 
 
+class BatchedRecordingTestCase(RecordingTestCase):
+    def processing_factory(self):
+        return ProcessReplayRecordingStrategyFactory(
+            input_block_size=1,
+            max_batch_size=10,
+            max_batch_time=1,
+            num_processes=1,
+            num_threads=2,
+            output_block_size=1,
+            mode="batched-parallel",
+        )
+
+    def test_storage_error_is_raised(self):
+        # The batch must not be committed when a segment could not be stored.
+        with patch(
+            "sentry.replays.consumers.recording.store_recording_message",
+            side_effect=OSError("storage is down"),
+        ):
+            with pytest.raises(OSError):
+                self.submit(self.nonchunked_messages())
+
+    def test_emit_error_is_raised(self):
+        with patch(
+            "sentry.replays.consumers.recording.emit_recording_message_events",
+            side_effect=ValueError("kafka is down"),
+        ):
+            with pytest.raises(ValueError):
+                self.submit(self.nonchunked_messages())
+
+
 # Experimental Two Step Recording Consumer
 
 
@@ -1,4 +1,11 @@
-from sentry.replays.usecases.ingest.event_parser import _get_testid, _parse_classes, _parse_events
+import pytest
+
+from sentry.replays.usecases.ingest.event_parser import (
+    _get_testid,
+    _parse_classes,
+    _parse_events,
+    iter_events,
+)
 from sentry.utils import json
 
 
@@ -522,3 +529,28 @@ def test_parse_classes():
     assert _parse_classes("  a b ") == ["a", "b"]
     assert _parse_classes("a  ") == ["a"]
     assert _parse_classes("  a") == ["a"]
+
+
+def test_iter_events():
+    events = [
+        {"type": 4, "data": {"href": "http://localhost/"}, "timestamp": 1},
+        {
+            "type": 2,
+            "data": {"node": {"type": 3, "textContent": 'quoted "[{" brackets', "id": 1}},
+            "timestamp": 2,
+        },
+        {"type": 3, "data": {"source": 9, "id": 2440, "type": 5}, "timestamp": 3},
+        {"timestamp": 4, "data": {"tag": "breadcrumb", "payload": {"type": 3}}, "type": 5},
+    ]
+    segment = json.dumps(events).encode()
+
+    assert list(iter_events(segment, (5,))) == [events[3]]
+    assert list(iter_events(segment, (3, 5))) == [events[2], events[3]]
+    assert list(iter_events(segment, (2,))) == [events[1]]
+    assert list(iter_events(b" [ ] ", (5,))) == []
+
+
+@pytest.mark.parametrize("segment", [b"[{]", b"{}", b"[", b'[{"type": 5}', b"[{}][{}]", b""])
+def test_iter_events_invalid_json(segment):
+    with pytest.raises(ValueError):
+        list(iter_events(segment, (5,)))
@@ -242,6 +242,25 @@ class ProcessBufferTest(ProcessDelayedAlertConditionsTestBase):
             self.project_two.id,
         }
 
+    @override_options({"delayed_processing.bulk_evaluation.enabled": True})
+    @patch("sentry.rules.processing.delayed_processing.apply_delayed.delay")
+    @patch("sentry.rules.processing.delayed_processing.apply_delayed_bulk.delay")
+    def test_bulk_evaluation_groups_projects_by_org(
+        self, mock_apply_delayed_bulk, mock_apply_delayed
+    ):
+        self._push_base_events()
+        other_project = self.create_project(organization=self.create_organization())
+        buffer.backend.push_to_sorted_set(key=PROJECT_ID_BUFFER_LIST_KEY, value=other_project.id)
+
+        process_buffer()
+
+        mock_apply_delayed_bulk.assert_called_once()
+        assert set(mock_apply_delayed_bulk.call_args[0][0]) == {
+            self.project.id,
+            self.project_two.id,
+        }
+        mock_apply_delayed.assert_called_once_with(other_project.id)
+
 
 class ProcessInBatchesTest(CreateEventTestCase):
     def setUp(self):
@@ -17,12 +17,14 @@ from sentry.rules.conditions.event_frequency import (
     ComparisonType,
     EventFrequencyCondition,
     EventFrequencyConditionData,
+    EventFrequencyPercentCondition,
 )
 from sentry.rules.processing.buffer_processing import process_in_batches
 from sentry.rules.processing.delayed_processing import (
     DataAndGroups,
     UniqueConditionQuery,
     apply_delayed,
+    apply_delayed_bulk,
     bulk_fetch_events,
     cleanup_redis_buffer,
     generate_unique_queries,
@@ -33,6 +35,7 @@ from sentry.rules.processing.delayed_processing import (
     get_rules_to_groups,
     get_slow_conditions,
     parse_rulegroup_to_event_data,
+    query_condition,
 )
 from sentry.rules.processing.processor import PROJECT_ID_BUFFER_LIST_KEY, RuleProcessor
 from sentry.testutils.cases import RuleTestCase, TestCase
@@ -1291,6 +1294,79 @@ class ApplyDelayedTest(ProcessDelayedAlertConditionsTestBase):
         self._assert_count_percent_results(safe_execute_callthrough)
 
 
+# Snuba queries look up groups, which other threads can't see within the test's transaction.
+@override_options({"delayed_processing.bulk_evaluation.max_workers": 1})
+class ApplyDelayedBulkTest(ProcessDelayedAlertConditionsTestBase):
+    @patch("sentry.rules.conditions.event_frequency.MIN_SESSIONS_TO_FIRE", 1)
+    def test_apply_delayed_bulk_rules_to_fire(self):
+        self._push_base_events()
+        apply_delayed_bulk([self.project.id, self.project_two.id])
+
+        rule_fire_histories = RuleFireHistory.objects.filter(
+            rule__in=[self.rule1, self.rule2, self.rule3, self.rule4],
+            group__in=[self.group1, self.group2, self.group3, self.group4],
+        ).values_list("rule", "group")
+        assert set(rule_fire_histories) == {
+            (self.rule1.id, self.group1.id),
+            (self.rule2.id, self.group2.id),
+            (self.rule3.id, self.group3.id),
+            (self.rule4.id, self.group4.id),
+        }
+        self.assert_buffer_cleared(project_id=self.project.id)
+        self.assert_buffer_cleared(project_id=self.project_two.id)
+
+    @patch("sentry.rules.processing.delayed_processing.safe_execute", side_effect=safe_execute)
+    def test_apply_delayed_bulk_shares_queries_across_projects(self, safe_execute_callthrough):
+        self.environment.add_project(self.project_two)
+        rule = self.create_project_rule(
+            project=self.project_two,
+            condition_data=[self.event_frequency_condition],
+            environment_id=self.environment.id,
+        )
+        event = self.create_event(
+            self.project_two.id, FROZEN_TIME, "group-5", self.environment.name
+        )
+        self.create_event(self.project_two.id, FROZEN_TIME, "group-5", self.environment.name)
+        assert event.group
+        self.push_to_hash(self.project.id, self.rule1.id, self.group1.id, self.event1.event_id)
+        self.push_to_hash(self.project_two.id, rule.id, event.group.id, event.event_id)
+
+        apply_delayed_bulk([self.project.id, self.project_two.id])
+
+        # Both rules share one query as they use the same condition, interval and environment.
+        assert safe_execute_callthrough.call_count == 1
+        rule_fire_histories = RuleFireHistory.objects.filter(
+            rule__in=[self.rule1, rule]
+        ).values_list("rule", "group")
+        assert set(rule_fire_histories) == {
+            (self.rule1.id, self.group1.id),
+            (rule.id, event.group.id),
+        }
+
+    @patch("sentry.rules.processing.delayed_processing.query_condition")
+    def test_apply_delayed_bulk_isolates_failing_projects(self, mock_query_condition):
+        def fail_percent_queries(condition_inst, *args):
+            if isinstance(condition_inst, EventFrequencyPercentCondition):
+                raise Exception("Snuba is down")
+            return query_condition(condition_inst, *args)
+
+        mock_query_condition.side_effect = fail_percent_queries
+        self._push_base_events()
+
+        apply_delayed_bulk([self.project.id, self.project_two.id])
+
+        # Only the second project has a percent condition, its rules are not fired.
+        rule_fire_histories = RuleFireHistory.objects.filter(
+            rule__in=[self.rule1, self.rule2, self.rule3, self.rule4],
+        ).values_list("rule", "group")
+        assert set(rule_fire_histories) == {
+            (self.rule1.id, self.group1.id),
+            (self.rule2.id, self.group2.id),
+        }
+        self.assert_buffer_cleared(project_id=self.project.id)
+        assert buffer.backend.get_hash(model=Project, field={"project_id": self.project_two.id})
+
+
 class UniqueConditionQueryTest(TestCase):
     """
     Tests for the UniqueConditionQuery class. Currently, this is just to pass codecov.
@@ -1,4 +1,5 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from functools import cached_property
@@ -16,7 +17,11 @@ from sentry.snuba.dataset import Dataset
 from sentry.snuba.models import SnubaQuery
 from sentry.snuba.query_subscriptions.consumer import (
     InvalidSchemaError,
+    SubscriptionResultMessage,
+    batch_subscriber_registry,
+    handle_messages,
     parse_message_value,
+    register_batch_subscriber,
     register_subscriber,
     subscriber_registry,
 )
@@ -138,6 +143,154 @@ class HandleMessageTest(BaseQuerySubscriptionTest, TestCase):
         )
         mock_callback.assert_called_once_with(data["payload"], sub)
 
+    def test_arroyo_consumer_batched_parallel(self):
+        registration_key = "registered_test_batched"
+        mock_callback = mock.Mock()
+        register_subscriber(registration_key)(mock_callback)
+        with self.tasks():
+            snuba_query = create_snuba_query(
+                SnubaQuery.Type.ERROR,
+                Dataset.Events,
+                "hello",
+                "count()",
+                timedelta(minutes=10),
+                timedelta(minutes=1),
+                None,
+            )
+            sub = create_snuba_subscription(self.project, registration_key, snuba_query)
+        sub.refresh_from_db()
+
+        data = deepcopy(self.valid_wrapper)
+        data["payload"]["subscription_id"] = sub.subscription_id
+        commit = mock.Mock()
+        partition = Partition(ArroyoTopic("test"), 0)
+        factory = QuerySubscriptionStrategyFactory(
+            self.dataset.value,
+            2,
+            1,
+            1,
+            DEFAULT_BLOCK_SIZE,
+            DEFAULT_BLOCK_SIZE,
+            multi_proc=False,
+            mode="batched-parallel",
+            max_workers=1,
+        )
+        strategy = factory.create_with_partitions(commit, {partition: 0})
+        for offset in (1, 2):
+            strategy.submit(
+                Message(
+                    BrokerValue(
+                        KafkaPayload(b"key", json.dumps(data).encode("utf-8"), []),
+                        partition,
+                        offset,
+                        datetime.now(),
+                    )
+                )
+            )
+        strategy.poll()
+        factory.shutdown()
+
+        assert mock_callback.call_count == 2
+        assert mock_callback.call_args[0][1] == sub
+        assert commit.call_args[0][0] == {partition: 3}
+
+
+class HandleMessagesTest(BaseQuerySubscriptionTest, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.orig_registry = deepcopy(subscriber_registry)
+        self.orig_batch_registry = deepcopy(batch_subscriber_registry)
+        self.executor = ThreadPoolExecutor(max_workers=2)
+
+    def tearDown(self):
+        super().tearDown()
+        self.executor.shutdown()
+        subscriber_registry.clear()
+        subscriber_registry.update(self.orig_registry)
+        batch_subscriber_registry.clear()
+        batch_subscriber_registry.update(self.orig_batch_registry)
+
+    def create_subscription(self, subscription_type):
+        with self.tasks():
+            snuba_query = create_snuba_query(
+                SnubaQuery.Type.ERROR,
+                Dataset.Events,
+                "hello",
+                "count()",
+                timedelta(minutes=10),
+                timedelta(minutes=1),
+                None,
+            )
+            sub = create_snuba_subscription(self.project, subscription_type, snuba_query)
+        sub.refresh_from_db()
+        return sub
+
+    def build_message(self, subscription_id, offset, value=50):
+        data = deepcopy(self.valid_wrapper)
+        data["payload"]["subscription_id"] = subscription_id
+        data["payload"]["result"]["data"] = [{"hello": value}]
+        return SubscriptionResultMessage(json.dumps(data).encode("utf-8"), offset, 0)
+
+    def handle_messages(self, messages):
+        handle_messages(messages, self.topic, self.dataset.value, self.jsoncodec, self.executor, 2)
+
+    def test_preserves_order_per_subscription(self):
+        callback = mock.Mock()
+        register_subscriber("batch_test")(callback)
+        sub = self.create_subscription("batch_test")
+        other_sub = self.create_subscription("batch_test")
+
+        messages = [
+            self.build_message(subscription.subscription_id, offset, value=offset)
+            for offset, subscription in enumerate([sub, other_sub, sub, other_sub, sub])
+        ]
+        with self.assertNumQueries(1):
+            self.handle_messages(messages)
+
+        values: dict[int, list[int]] = {}
+        for (contents, subscription), _ in callback.call_args_list:
+            values.setdefault(subscription.id, []).append(contents["values"]["data"][0]["hello"])
+        assert values == {sub.id: [0, 2, 4], other_sub.id: [1, 3]}
+
+    def test_batch_subscriber(self):
+        callback = mock.Mock()
+        batch_callback = mock.Mock()
+        register_subscriber("batch_test")(callback)
+        register_batch_subscriber("batch_test")(batch_callback)
+        sub = self.create_subscription("batch_test")
+
+        self.handle_messages([self.build_message(sub.subscription_id, offset) for offset in (1, 2)])
+
+        assert not callback.called
+        batch_callback.assert_called_once()
+        updates = batch_callback.call_args[0][0]
+        assert [subscription for _, subscription in updates] == [sub, sub]
+
+    @mock.patch("sentry.snuba.query_subscriptions.consumer._delete_from_snuba")
+    def test_missing_subscription(self, mock_delete_from_snuba):
+        callback = mock.Mock()
+        register_subscriber("batch_test")(callback)
+        sub = self.create_subscription("batch_test")
+
+        self.handle_messages(
+            [
+                self.build_message("missing", 1),
+                self.build_message(sub.subscription_id, 2),
+            ]
+        )
+
+        mock_delete_from_snuba.assert_called_once()
+        callback.assert_called_once()
+
+    def test_failing_handler(self):
+        callback = mock.Mock(side_effect=[Exception("boom"), None])
+        register_subscriber("batch_test")(callback)
+        sub = self.create_subscription("batch_test")
+
+        self.handle_messages([self.build_message(sub.subscription_id, offset) for offset in (1, 2)])
+        # The failing update doesn't prevent the next one from being handled.
+        assert callback.call_count == 2
+
 
 class ParseMessageValueTest(BaseQuerySubscriptionTest, unittest.TestCase):
     def run_test(self, message):
@@ -210,3 +363,23 @@ class RegisterSubscriberTest(unittest.TestCase):
         with pytest.raises(Exception) as excinfo:
             register_subscriber("hello")(other_callback)
         assert str(excinfo.value) == "Handler already registered for hello"
+
+
+class RegisterBatchSubscriberTest(unittest.TestCase):
+    def setUp(self):
+        self.orig_registry = deepcopy(batch_subscriber_registry)
+
+    def tearDown(self):
+        batch_subscriber_registry.clear()
+        batch_subscriber_registry.update(self.orig_registry)
+
+    def test_register(self):
+        callback = lambda updates: None
+        register_batch_subscriber("hello")(callback)
+        assert batch_subscriber_registry["hello"] is callback
+
+    def test_already_registered(self):
+        register_batch_subscriber("hello")(lambda updates: None)
+        with pytest.raises(Exception) as excinfo:
+            register_batch_subscriber("hello")(lambda updates: None)
+        assert str(excinfo.value) == "Batch handler already registered for hello"
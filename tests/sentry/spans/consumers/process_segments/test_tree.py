@@ -0,0 +1,78 @@
+from sentry.spans.consumers.process_segments.tree import NO_PARENT, SpanTree
+
+
+def _span(span_id, parent_span_id=None, start_timestamp=0.0, is_segment=False):
+    return {
+        "span_id": span_id,
+        "parent_span_id": parent_span_id,
+        "start_timestamp": start_timestamp,
+        "is_segment": is_segment,
+    }
+
+
+def _ids(spans):
+    return [span["span_id"] for span in spans]
+
+
+def test_flatten_depth_first_by_start_timestamp():
+    spans = [
+        _span("c", "a", 2.0),
+        _span("b", "a", 1.0),
+        _span("a", None, 0.0, is_segment=True),
+        _span("d", "b", 3.0),
+    ]
+    tree = SpanTree(spans)
+
+    assert _ids(tree.flatten()) == ["a", "b", "d", "c"]
+    assert tree.parents == [2, 2, NO_PARENT, 1]
+    assert tree.depths == [1, 1, 0, 2]
+    assert tree.root == 2
+
+
+def test_orphans_follow_segment():
+    spans = [
+        _span("orphan-late", "missing", 5.0),
+        _span("a", None, 1.0, is_segment=True),
+        _span("orphan-early", "missing", 0.0),
+        _span("orphan-child", "orphan-early", 2.0),
+    ]
+    tree = SpanTree(spans)
+
+    assert _ids(tree.flatten()) == ["a", "orphan-early", "orphan-child", "orphan-late"]
+    assert tree.depths == [0, 0, 0, 1]
+
+
+def test_without_segment_span():
+    spans = [_span("b", "a", 1.0), _span("a", "x", 0.0)]
+    tree = SpanTree(spans)
+
+    assert tree.root == NO_PARENT
+    assert _ids(tree.flatten()) == ["a", "b"]
+
+
+def test_duplicate_span_ids_and_cycles():
+    spans = [
+        _span("a", "b", 0.0),
+        _span("b", "a", 1.0),
+        _span("a", None, 2.0),
+    ]
+    tree = SpanTree(spans)
+
+    assert len(tree) == 2
+    assert _ids(tree.flatten()) == ["a", "b"]
+
+
+def test_does_not_mutate_spans():
+    spans = [_span("a", None, 0.0, is_segment=True), _span("b", "a", 1.0)]
+    SpanTree(spans)
+
+    assert spans == [_span("a", None, 0.0, is_segment=True), _span("b", "a", 1.0)]
+
+
+def test_deep_segment():
+    count = 50_000
+    spans = [_span(str(i), str(i - 1) if i else None, float(i), i == 0) for i in range(count)]
+    tree = SpanTree(spans)
+
+    assert tree.order == list(range(count))
+    assert tree.depths[-1] == count - 1
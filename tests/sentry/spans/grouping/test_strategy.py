@@ -324,6 +324,48 @@ def test_reuse_existing_grouping_results() -> None:
     }
 
 
+def test_span_groups_are_memoized() -> None:
+    calls = []
+
+    def counting_strategy(span: Span) -> list[str] | None:
+        calls.append(span["span_id"])
+        return None
+
+    strategy = SpanGroupingStrategy(name="memoized-strategy", strategies=[counting_strategy])
+    event = {
+        "transaction": "transaction name",
+        "contexts": {"trace": {"span_id": "a" * 16}},
+        "spans": [
+            SpanBuilder().with_span_id("b" * 16).with_description("hi").build(),
+            SpanBuilder().with_span_id("c" * 16).with_description("hi").build(),
+            SpanBuilder().with_span_id("d" * 16).with_description("bye").build(),
+            SpanBuilder()
+            .with_span_id("e" * 16)
+            .with_description("hi")
+            .with_fingerprint(["a"])
+            .build(),
+        ],
+    }
+
+    expected = {
+        "a" * 16: hash_values(["transaction name"]),
+        "b" * 16: hash_values(["hi"]),
+        "c" * 16: hash_values(["hi"]),
+        "d" * 16: hash_values(["bye"]),
+        "e" * 16: hash_values(["a"]),
+    }
+    assert strategy.execute(event) == expected
+    # the fingerprinted span does not use the default strategies
+    assert calls == ["b" * 16, "d" * 16]
+
+    assert strategy.execute(event) == expected
+    assert calls == ["b" * 16, "d" * 16]
+
+    strategy.cache.clear()
+    assert strategy.execute(event) == expected
+    assert calls == ["b" * 16, "d" * 16, "b" * 16, "d" * 16]
+
+
 @pytest.mark.parametrize(
     "spans,expected",
     [
@@ -17,6 +17,7 @@ from sentry.tasks.relay import (
     schedule_build_project_config,
     schedule_invalidate_project_config,
 )
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.helpers.task_runner import BurstTaskRunner
 from sentry.testutils.hybrid_cloud import simulated_transaction_watermarks
 from sentry.testutils.pytest.fixtures import django_db_all
@@ -84,6 +85,7 @@ def redis_cache(monkeypatch):
     monkeypatch.setattr("sentry.relay.projectconfig_cache.set_many", cache.set_many)
     monkeypatch.setattr("sentry.relay.projectconfig_cache.delete_many", cache.delete_many)
     monkeypatch.setattr("sentry.relay.projectconfig_cache.get", cache.get)
+    monkeypatch.setattr("sentry.relay.projectconfig_cache.exists_many", cache.exists_many)
 
     return cache
 
@@ -454,6 +456,41 @@ class TestInvalidationTask:
             assert new_cfg is not None
             assert new_cfg != cfg
 
+    @override_options({"relay.project-config-bulk-organization.enabled": True})
+    def test_invalidate_org_bulk(
+        self,
+        default_project,
+        default_organization,
+        default_projectkey,
+        factories,
+        redis_cache,
+        task_runner,
+        django_cache,
+    ):
+        default_project.update_option("sentry:blacklisted_ips", ["127.0.0.1"])
+        other_project = factories.create_project(organization=default_organization)
+        other_key = factories.create_project_key(project=other_project)
+        uncached_project = factories.create_project(organization=default_organization)
+        uncached_keys = list(_cache_keys_for_project(uncached_project))
+
+        cfg = {"dummy-key": "val"}
+        redis_cache.set_many({default_projectkey.public_key: cfg, other_key.public_key: cfg})
+        redis_cache.delete_many(uncached_keys)
+
+        with task_runner():
+            schedule_invalidate_project_config(
+                organization_id=default_organization.id, trigger="test"
+            )
+
+        new_cfg = redis_cache.get(default_projectkey.public_key)
+        assert new_cfg["projectId"] == default_project.id
+        assert new_cfg["publicKeys"][0]["publicKey"] == default_projectkey.public_key
+        assert new_cfg["config"]["filterSettings"]["clientIps"] == {"blacklistedIps": ["127.0.0.1"]}
+        assert redis_cache.get(other_key.public_key)["projectId"] == other_project.id
+        # Configs which were not cached are not computed.
+        for public_key in uncached_keys:
+            assert redis_cache.get(public_key) is None
+
     @mock.patch(
         "sentry.tasks.relay._schedule_invalidate_project_config",
         wraps=_schedule_invalidate_project_config,
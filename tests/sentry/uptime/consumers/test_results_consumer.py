@@ -53,7 +53,9 @@ class ProcessResultTest(ConfigPusherTestMixin, metaclass=abc.ABCMeta):
 
     @property
     @abc.abstractmethod
-    def strategy_processing_mode(self) -> Literal["batched-parallel", "parallel", "serial"]:
+    def strategy_processing_mode(
+        self,
+    ) -> Literal["batched", "batched-parallel", "parallel", "serial"]:
         pass
 
     def setUp(self):
@@ -1324,3 +1326,73 @@ class ProcessResultSerialTest(ProcessResultTest):
 
 class ProcessResultParallelTest(ProcessResultTest):
     strategy_processing_mode = "parallel"
+
+
+class ProcessResultBatchedTest(ProcessResultTest):
+    strategy_processing_mode = "batched"
+
+    def send_result(
+        self, result: CheckResult, consumer: ProcessingStrategy[KafkaPayload] | None = None
+    ):
+        if consumer is not None:
+            return super().send_result(result, consumer=consumer)
+
+        # Flush every result as its own batch, so that results are processed on send
+        factory = UptimeResultsStrategyFactory(mode=self.strategy_processing_mode, max_batch_size=1)
+        consumer = factory.create_with_partitions(mock.Mock(), {self.partition: 0})
+        super().send_result(result, consumer=consumer)
+        with self.feature(UptimeDomainCheckFailure.build_ingest_feature_name()):
+            consumer.poll()
+
+    def test_batch_across_subscriptions(self) -> None:
+        """
+        Validates that a batch holding results of many subscriptions processes them together,
+        keeping the results of each subscription in order.
+        """
+        factory = UptimeResultsStrategyFactory(mode="batched", max_batch_size=3)
+        consumer = factory.create_with_partitions(mock.Mock(), {self.partition: 0})
+        subscription_2 = self.create_uptime_subscription(
+            subscription_id=uuid.uuid4().hex, interval_seconds=300, url="http://santry.io"
+        )
+        project_subscription_2 = self.create_project_uptime_subscription(
+            uptime_subscription=subscription_2, owner=self.user
+        )
+
+        result_1 = self.create_uptime_result(
+            self.subscription.subscription_id,
+            scheduled_check_time=datetime.now() - timedelta(minutes=5),
+        )
+        result_2 = self.create_uptime_result(
+            self.subscription.subscription_id,
+            scheduled_check_time=datetime.now() - timedelta(minutes=4),
+        )
+        result_3 = self.create_uptime_result(
+            subscription_2.subscription_id,
+            scheduled_check_time=datetime.now() - timedelta(minutes=4),
+        )
+        with (
+            mock.patch.object(
+                type(factory.result_processor),
+                "handle_results",
+                autospec=True,
+                side_effect=type(factory.result_processor).handle_results,
+            ) as mock_handle_results,
+            self.feature(["organizations:uptime", "organizations:uptime-create-issues"]),
+        ):
+            for result in (result_1, result_2, result_3):
+                self.send_result(result, consumer=consumer)
+            with self.feature(UptimeDomainCheckFailure.build_ingest_feature_name()):
+                consumer.poll()
+
+        assert [
+            [result for _, result in mock_call.args[1]]
+            for mock_call in mock_handle_results.mock_calls
+        ] == [[result_1, result_3], [result_2]]
+
+        cluster = _get_cluster()
+        assert cluster.get(build_last_update_key(self.project_subscription)) == str(
+            int(result_2["scheduled_check_time_ms"])
+        )
+        assert cluster.get(build_last_update_key(project_subscription_2)) == str(
+            int(result_3["scheduled_check_time_ms"])
+        )
@@ -4,6 +4,8 @@ from sentry.testutils.cases import TestCase
 from sentry.workflow_engine.models import DataConditionGroup
 from sentry.workflow_engine.models.data_condition import Condition, DataCondition
 from sentry.workflow_engine.processors.data_condition_group import (
+    CompiledConditionGroupCache,
+    compile_condition_groups,
     evaluate_data_conditions,
     get_data_conditions_for_group,
     process_data_condition_group,
@@ -247,3 +249,80 @@ class TestEvaluateConditionGroupWithSlowConditions(TestCase):
         assert logic_result is True
         assert condition_results == [True]
         assert remaining_conditions == []
+
+
+class TestCompiledConditionGroup(TestCase):
+    def setUp(self):
+        self.data_condition_group = self.create_data_condition_group(
+            logic_type=DataConditionGroup.Type.ANY
+        )
+        self.create_data_condition(
+            comparison=5,
+            type=Condition.GREATER,
+            condition_result=True,
+            condition_group=self.data_condition_group,
+        )
+        self.create_data_condition(
+            comparison=20,
+            type=Condition.LESS,
+            condition_result=DetectorPriorityLevel.HIGH,
+            condition_group=self.data_condition_group,
+        )
+        self.create_data_condition(
+            type=Condition.EVENT_FREQUENCY_COUNT,
+            comparison={"interval": "1d", "value": 7},
+            condition_result=True,
+            condition_group=self.data_condition_group,
+        )
+
+    def test_matches_process_data_condition_group(self):
+        for logic_type in DataConditionGroup.Type:
+            self.data_condition_group.update(logic_type=logic_type)
+            compiled_group = compile_condition_groups([self.data_condition_group.id])[
+                self.data_condition_group.id
+            ]
+            for value in (1, 10, 30):
+                assert compiled_group.evaluate(value) == process_data_condition_group(
+                    self.data_condition_group.id, value
+                ), (logic_type, value)
+
+    def test_empty_group(self):
+        data_condition_group = self.create_data_condition_group()
+        compiled_group = compile_condition_groups([data_condition_group.id])[
+            data_condition_group.id
+        ]
+        assert compiled_group.evaluate(1) == process_data_condition_group(
+            data_condition_group.id, 1
+        )
+
+    def test_compile_many(self):
+        other_group = self.create_data_condition_group()
+        with self.assertNumQueries(2):
+            compiled_groups = compile_condition_groups(
+                [self.data_condition_group.id, other_group.id, 0]
+            )
+        assert set(compiled_groups) == {self.data_condition_group.id, other_group.id}
+        assert len(compiled_groups[self.data_condition_group.id].fast_conditions) == 2
+        assert len(compiled_groups[self.data_condition_group.id].slow_conditions) == 1
+
+    def test_cache(self):
+        cache = CompiledConditionGroupCache()
+        group_id = self.data_condition_group.id
+        compiled_group = cache.get_many([group_id])[group_id]
+        with self.assertNumQueries(0):
+            assert cache.get_many([group_id])[group_id] is compiled_group
+
+        # Editing a condition invalidates the compiled group
+        self.create_data_condition(
+            comparison=0,
+            type=Condition.EQUAL,
+            condition_result=True,
+            condition_group=self.data_condition_group,
+        )
+        assert len(cache.get_many([group_id])[group_id].fast_conditions) == 3
+
+        self.data_condition_group.update(logic_type=DataConditionGroup.Type.ALL)
+        assert cache.get_many([group_id])[group_id].logic_type == DataConditionGroup.Type.ALL
+
+        self.data_condition_group.delete()
+        assert cache.get_many([group_id]) == {}
@@ -7,7 +7,11 @@ from sentry.issues.status_change_message import StatusChangeMessage
 from sentry.testutils.helpers.datetime import freeze_time
 from sentry.types.group import PriorityLevel
 from sentry.workflow_engine.handlers.detector import DetectorEvaluationResult, DetectorStateData
-from sentry.workflow_engine.handlers.detector.stateful import get_redis_client
+from sentry.workflow_engine.handlers.detector.stateful import (
+    bulk_commit_state_updates,
+    bulk_evaluate,
+    get_redis_client,
+)
 from sentry.workflow_engine.models import DataPacket, Detector, DetectorState
 from sentry.workflow_engine.processors.detector import process_detectors
 from sentry.workflow_engine.types import DetectorPriorityLevel
@@ -425,6 +429,116 @@ class TestEvaluate(BaseDetectorHandlerTest):
         self.assert_updates(handler, "val1", None, None, None, None)
 
 
+@freeze_time()
+class TestBulkEvaluate(BaseDetectorHandlerTest):
+    def test(self):
+        handler = self.build_handler()
+        other_handler = self.build_handler()
+        occurrence, event_data = build_mock_occurrence_and_event(
+            handler, "val1", 6, PriorityLevel.HIGH
+        )
+        results = bulk_evaluate(
+            [
+                (handler, DataPacket("1", {"dedupe": 1, "group_vals": {"val1": 6}})),
+                (other_handler, DataPacket("2", {"dedupe": 1, "group_vals": {"val1": 0}})),
+                # Already active, no status change
+                (handler, DataPacket("1", {"dedupe": 2, "group_vals": {"val1": 8}})),
+                (handler, DataPacket("1", {"dedupe": 3, "group_vals": {"val1": 0}})),
+            ]
+        )
+        assert results == [
+            {
+                "val1": DetectorEvaluationResult(
+                    group_key="val1",
+                    is_active=True,
+                    priority=DetectorPriorityLevel.HIGH,
+                    result=occurrence,
+                    event_data=event_data,
+                )
+            },
+            {},
+            {},
+            {
+                "val1": DetectorEvaluationResult(
+                    group_key="val1",
+                    is_active=False,
+                    result=StatusChangeMessage(
+                        fingerprint=[f"{handler.detector.id}:val1"],
+                        project_id=handler.detector.project_id,
+                        new_status=1,
+                        new_substatus=None,
+                    ),
+                    priority=DetectorPriorityLevel.OK,
+                )
+            },
+        ]
+        self.assert_updates(handler, "val1", 3, {}, False, DetectorPriorityLevel.OK)
+        self.assert_updates(other_handler, "val1", 1, {}, None, None)
+
+        bulk_commit_state_updates([handler, other_handler, handler])
+        assert handler.get_state_data(["val1"]) == {
+            "val1": DetectorStateData(
+                "val1", False, DetectorPriorityLevel.OK, 3, {"test1": None, "test2": None}
+            )
+        }
+        assert other_handler.get_state_data(["val1"])["val1"].dedupe_value == 1
+        assert DetectorState.objects.filter(detector=handler.detector).count() == 1
+        assert not DetectorState.objects.filter(detector=other_handler.detector).exists()
+
+    def test_existing_state(self):
+        handler = self.build_handler()
+        handler.evaluate(DataPacket("1", {"dedupe": 2, "group_vals": {"val1": 6, None: 6}}))
+        handler.commit_state_updates()
+
+        with mock.patch(
+            "sentry.workflow_engine.handlers.detector.stateful.metrics"
+        ) as mock_metrics:
+            results = bulk_evaluate(
+                [
+                    (handler, DataPacket("1", {"dedupe": 2, "group_vals": {"val1": 0}})),
+                    (handler, DataPacket("1", {"dedupe": 3, "group_vals": {"val1": 6, None: 0}})),
+                ]
+            )
+            mock_metrics.incr.assert_called_once_with(
+                "workflow_engine.detector.skipping_already_processed_update"
+            )
+        assert results[0] == {}
+        assert list(results[1]) == [None]
+        assert results[1][None].priority == DetectorPriorityLevel.OK
+
+        with self.assertNumQueries(1):
+            bulk_commit_state_updates([handler])
+        assert handler.get_state_data([None, "val1"]) == {
+            None: DetectorStateData(
+                None, False, DetectorPriorityLevel.OK, 3, {"test1": None, "test2": None}
+            ),
+            "val1": DetectorStateData(
+                "val1", True, DetectorPriorityLevel.HIGH, 3, {"test1": None, "test2": None}
+            ),
+        }
+
+    def test_handlers_of_same_detector(self):
+        handler = self.build_handler()
+        same_detector_handler = self.build_handler(handler.detector)
+        results = bulk_evaluate(
+            [
+                (handler, DataPacket("1", {"dedupe": 1, "group_vals": {"val1": 6}})),
+                # Sees the state updated by the previous packet.
+                (same_detector_handler, DataPacket("1", {"dedupe": 2, "group_vals": {"val1": 8}})),
+            ]
+        )
+        assert list(results[0]) == ["val1"]
+        assert results[1] == {}
+
+        bulk_commit_state_updates([handler, same_detector_handler])
+        assert DetectorState.objects.filter(detector=handler.detector).count() == 1
+        assert handler.get_state_data(["val1"])["val1"].dedupe_value == 2
+
+    def test_empty(self):
+        assert bulk_evaluate([]) == []
+        bulk_commit_state_updates([])
+
+
 @freeze_time()
 class TestEvaluateGroupKeyValue(BaseDetectorHandlerTest):
     def test_dedupe(self):
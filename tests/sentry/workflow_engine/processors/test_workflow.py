@@ -8,6 +8,7 @@ from sentry.eventstream.base import GroupState
 from sentry.grouping.grouptype import ErrorGroupType
 from sentry.testutils.factories import Factories
 from sentry.testutils.helpers.datetime import before_now, freeze_time
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.helpers.redis import mock_redis_buffer
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.utils import json
@@ -220,6 +221,22 @@ class TestEvaluateWorkflowTriggers(BaseWorkflowTest):
 
         assert triggered_workflows == {self.workflow, workflow_two}
 
+    def test_compiled_condition_groups(self):
+        workflow_two, _, _, _ = self.create_detector_and_workflow(name_prefix="two")
+        assert workflow_two.when_condition_group
+        workflow_two.when_condition_group.update(logic_type=DataConditionGroup.Type.ALL)
+        self.create_data_condition(
+            condition_group=workflow_two.when_condition_group,
+            type=Condition.EVENT_CREATED_BY_DETECTOR,
+            comparison=self.detector.id + 1,
+        )
+
+        with override_options({"workflow_engine.compiled-condition-groups": True}):
+            triggered_workflows = evaluate_workflow_triggers(
+                {self.workflow, workflow_two}, self.job
+            )
+        assert triggered_workflows == {self.workflow}
+
     def test_delays_slow_conditions(self):
         assert self.workflow.when_condition_group
         self.workflow.when_condition_group.update(logic_type=DataConditionGroup.Type.ALL)
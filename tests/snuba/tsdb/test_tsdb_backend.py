@@ -230,6 +230,20 @@ class SnubaTSDBTest(TestCase, SnubaTestCase):
             == {}
         )
 
+    def test_range_columns_groups(self):
+        dts = [self.now + timedelta(hours=i) for i in range(4)]
+        assert self.db.get_range_columns(
+            TSDBModel.group,
+            [self.proj1group1.id, self.proj1group2.id],
+            dts[0],
+            dts[-1],
+            rollup=3600,
+            tenant_ids={"referrer": "r", "organization_id": 1234},
+        ) == (
+            [timestamp(dt) for dt in dts],
+            {self.proj1group1.id: [3, 3, 3, 3], self.proj1group2.id: [3, 3, 3, 3]},
+        )
+
     def test_range_releases(self):
         dts = [self.now + timedelta(hours=i) for i in range(4)]
         assert self.db.get_range(
@@ -793,6 +807,20 @@ class SnubaTSDBGroupProfilingTest(TestCase, SnubaTestCase, SearchIssueTestMixin)
             == {}
         )
 
+    def test_range_columns_groups(self):
+        dts = [self.now + timedelta(hours=i) for i in range(4)]
+        assert self.db.get_range_columns(
+            TSDBModel.group_generic,
+            [self.proj1group1.id, self.proj1group2.id],
+            dts[0],
+            dts[-1],
+            rollup=3600,
+            tenant_ids={"referrer": "test", "organization_id": 1},
+        ) == (
+            [timestamp(dt) for dt in dts],
+            {self.proj1group1.id: [3, 3, 3, 3], self.proj1group2.id: [3, 3, 3, 3]},
+        )
+
     def test_get_distinct_counts_totals_users(self):
         assert self.db.get_distinct_counts_totals(
             TSDBModel.users_affected_by_generic_group,